@@ -1,4 +1,12 @@
 class Category:
+    """
+    This class represents a single category (node) of the category tree. The attributes are declared as slots, so
+    that a category does not need a dictionary per instance, which keeps the memory small if several trees are held
+    within one process. The main category (tier 1 ancestor) is set once the tree is built.
+    """
+
+    __slots__ = ("category_id", "name", "parent", "children", "parent_id", "keywords", "tier", "structure_id",
+                 "main_category")
 
     def __init__(self, category_id, name):
         """
@@ -16,7 +24,8 @@ class Category:
         self.parent_id = None
         self.keywords = dict()
         self.tier = ""
-        self.structure_id = 0
+        self.structure_id = "00000000"
+        self.main_category = None
 
     def get_tier(self):
         """
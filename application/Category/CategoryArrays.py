@@ -0,0 +1,162 @@
+import numpy as np
+
+from application.Category import StructureId
+from application.Validator import Validator
+
+
+class CategoryArrays:
+    """
+    This class represents the structure of a category tree as a set of arrays (one entry per category in the order
+    of the category list), so that the tree can be traversed by indices instead of references between the Category
+    objects: the index of the parent (-1 for the root), the tier and the packed structure id (one byte per tier, e.g.
+    01020300 -> 0x01020300, see 'StructureId.pack', or -1 if the tree has more than 4 tiers or more than 99 children
+    per category). The children of all categories are stored in CSR format, i.e. the children of the category with
+    the index i are 'children_indices[children_indptr[i]:children_indptr[i + 1]]' in the order of the tree.
+    Furthermore, the path of ancestors of every category is precomputed: 'ancestor_indices[i, t - 1]' is the index of
+    the ancestor of the category i on tier t (the category itself on its own tier, -1 below it), i.e. the first column
+    holds the main category (tier 1) of every category.
+    The row of a category is its position within the category list (see 'get_position'). The categories themselves
+    are not changed, so the same categories can be part of several lists.
+    The arrays of a category tree are stored with the tree ('category_arrays'), so that they are only built once.
+    """
+
+    def __init__(self, category_list):
+        """
+        Builds the arrays for the given category list. A parent that is not part of the list is treated like the root
+        (-1), children that are not part of the list are left out.
+
+        :param category_list: list of type Category that contains all categories.
+        """
+
+        Validator.check_empty_list(category_list)
+
+        self.category_list = category_list
+        self.positions = {id(category): index for index, category in enumerate(category_list)}
+        self.parent_indices = np.array([self.positions.get(id(category.parent), -1) for category in category_list],
+                                       dtype=np.int32)
+        self.tiers = np.array([int(category.tier or 0) for category in category_list], dtype=np.int16)
+        self.structure_ids = np.array([StructureId.pack(category.structure_id)
+                                       if len(category.structure_id) == 2 * StructureId.TIERS else -1
+                                       for category in category_list], dtype=np.int64)
+
+        children = [[self.positions[id(child)] for child in category.children if id(child) in self.positions]
+                    for category in category_list]
+        self.children_indptr = np.zeros(len(category_list) + 1, dtype=np.int32)
+        np.cumsum([len(indices) for indices in children], out=self.children_indptr[1:])
+        self.children_indices = np.array([index for indices in children for index in indices], dtype=np.int32)
+
+        self.ancestor_indices = self.calculate_ancestor_indices(self.parent_indices)
+        self.main_category_indices = self.ancestor_indices[:, 0]
+
+    @classmethod
+    def calculate_ancestor_indices(cls, parent_indices):
+        """
+        Calculates the path of ancestors of every category from the indices of the parents. To do so, the parents of
+        all categories are followed upwards at once until the root is reached for every category.
+
+        :param parent_indices: array containing the index of the parent of every category (-1 for the root).
+        :return: array with one row per category containing the index of the ancestor on every tier (starting with
+        tier 1) or -1 if the category is not that deep (at least one column).
+        """
+
+        chain = [np.arange(len(parent_indices), dtype=np.int32)]
+        while (chain[-1] != -1).any():
+            current = chain[-1]
+            chain.append(np.where(current != -1, parent_indices[np.maximum(current, 0)], -1).astype(np.int32))
+
+        chain = np.array(chain)
+        depths = (chain != -1).sum(axis=0) - 1
+        categories = np.arange(len(parent_indices))
+
+        ancestor_indices = np.full((len(parent_indices), max(1, int(depths.max()))), -1, dtype=np.int32)
+        for tier in range(1, int(depths.max()) + 1):
+            selected = depths >= tier
+            ancestor_indices[selected, tier - 1] = chain[depths[selected] - tier, categories[selected]]
+
+        return ancestor_indices
+
+    @classmethod
+    def for_categories(cls, category_list):
+        """
+        Returns the arrays for the given category list. For a category tree, the arrays are stored with the tree and
+        only rebuilt if categories were added to, removed from or moved within the tree (see
+        'CategoryTree.invalidate_indexes'). Any other list of categories is converted on every call.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: arrays of the given category list.
+        """
+
+        arrays = getattr(category_list, "category_arrays", None)
+
+        if arrays is None or not arrays.is_up_to_date(category_list):
+            arrays = cls(category_list)
+            if hasattr(category_list, "category_arrays"):
+                category_list.category_arrays = arrays
+
+        return arrays
+
+    def is_up_to_date(self, category_list) -> bool:
+        """
+        Checks whether these arrays were built from the given category list in its current size.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: True if the arrays can be used for the given category list.
+        """
+
+        return category_list is self.category_list and len(category_list) == len(self.tiers)
+
+    def get_position(self, category) -> int:
+        """
+        Returns the position of the given category within the category list, i.e. its row within the arrays.
+
+        :param category: category of the category list.
+        :return: index of the category within the category list.
+        """
+
+        position = self.positions.get(id(category))
+        Validator.check_existence_category(position)
+
+        return position
+
+    def get_category(self, index):
+        """
+        Returns the category at the given index.
+
+        :param index: index of the category within the category list.
+        :return: category at the given index.
+        """
+
+        return self.category_list[index]
+
+    def get_parent(self, index) -> int:
+        """
+        Returns the index of the parent of the category at the given index.
+
+        :param index: index of the category within the category list.
+        :return: index of the parent or -1 for the root.
+        """
+
+        return int(self.parent_indices[index])
+
+    def get_children(self, index):
+        """
+        Returns the indices of the children of the category at the given index.
+
+        :param index: index of the category within the category list.
+        :return: array containing the indices of the children in the order of the tree.
+        """
+
+        return self.children_indices[self.children_indptr[index]:self.children_indptr[index + 1]]
+
+    def get_ancestors(self, index):
+        """
+        Returns the path of ancestors of the category at the given index, starting with its main category (tier 1) and
+        ending with the category itself.
+
+        :param index: index of the category within the category list.
+        :return: array containing the indices of the ancestors from tier 1 downwards.
+        """
+
+        path = self.ancestor_indices[index]
+
+        return path[path != -1]
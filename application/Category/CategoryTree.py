@@ -1,13 +1,23 @@
 import csv
+import hashlib
+import os
 import sys
+import zipfile
+
+import numpy as np
 
 from application.Scraper import CategoryScraper
+from application.Scraper.Retry import RetryError, RetryPolicy
 from application.Matching import NLPHelper, Calculator
+from application.Matching.KeywordMatrix import KeywordMatrix
 from application.Validator import Validator
 from application.Category import Category
+from application.Category.CategoryArrays import CategoryArrays
+from application.Category.DistanceMatrix import DistanceMatrix
+from application.Category.LcaIndex import LcaIndex
 
 
-class CategoryTree:
+class CategoryTree(list):
     """
     This class represents a tree structure in which categories and their subcategories are stored. The tree is
     based on a list and uses the class Category to initialize the nodes (categories) of the tree.
@@ -15,284 +25,269 @@ class CategoryTree:
     This class offers different methods to set up a tree by reading a csv file that represents a category distinction
     according to the taxonomy of the IAB with a maximum level of depth of 4, i.e. 3 subcategories.
     Moreover, methods to find a category by its name or id as well as methods to set the parent-child-relationship
-    are implemented within this class.
-
-    - this class has a class variable, that is called "root" and represents a connector for all main categories
-    that are listed within the IAB taxonomy.
+    are implemented within this class. The tree itself is the list of all categories, which additionally keeps hash
+    indexes (name, id and structure id -> category), so that every category is found in constant time.
+    Every tree has its own root and its own state, i.e. several trees can be built within one process. Once it is
+    built (see 'set_up_tree'), a tree is only read by the matching and can be reused for any number of requests.
+    A tree with its keywords can be stored as a binary snapshot (see 'save_snapshot'), so that it does not have to be
+    built from the csv file and the keywords file again on every start.
     """
 
-    root = Category.Category("0", "Category")
-
-    def __init__(self):
-        self.root = Category.Category(0, "Category")
-
-    @classmethod
-    def get_categories(cls, csv_data) -> list:
+    def __init__(self, category_list=()):
         """
-        Reads the given csv file and extracts every category. To prevent multiple categories, only the entry at
-        index 2 (the name of the category) is considered. Besides the name, the category id as well as the category of
-        the parent category is extracted and stored.
+        Initializes the tree with its root (at index 0) followed by the given categories and builds the indexes for
+        them. The root represents a connector for all main categories that are listed within the IAB taxonomy.
 
-        :param csv_data: csv file to be read.
-        :return: list of type Category that contains all categories.
+        :param category_list: list of type Category that contains all categories except the root.
         """
 
-        try:
-            Validator.check_file_existence(csv_data)
-            category_dict_list = cls.convert_csv_into_dict(csv_data)
-            category_list = list()
-            with open(csv_data, "r") as csv_file:
-                csv_reader = csv.reader(csv_file, delimiter=";")
-                next(csv_reader)
-
-                for dictionary in category_dict_list:
-                    category = Category.Category(dictionary.get("category id"), dictionary.get("category name"))
-                    Category.Category.set_parent_id(category, dictionary.get("parent id"))
-                    category_list.append(category)
+        super().__init__()
+        self.root = Category.Category("0", "Category")
+        self.root.set_tier("0")
+        self.append(self.root)
+        self.extend(category_list)
 
-            return category_list
+        self.csv_data = None
+        self.keyword_matrix = None
+        self.category_arrays = None
+        self.distance_matrix = None
+        self.lca_index = None
+        self.categories_by_name = dict()
+        self.categories_by_id = dict()
+        self.categories_by_structure_id = dict()
+        self.indexed_length = 0
+        self.index_categories()
 
-        except FileNotFoundError as error:
-            sys.exit(str(error))
-
-    @classmethod
-    def get_tier(cls, line_tier):
+    def index_categories(self):
         """
-        Calculates the depth of the category within the given csv file.
-
-        :param line_tier: line that is read from the csv file.
-        :return: level of depth for the lowest subcategory in the category tree.
+        (Re-)Builds the indexes of the tree that map the name, the id and the structure id of every category to the
+        category. If a name or an id occurs more than once, the first category in the list is indexed, like in a
+        linear search.
         """
 
-        try:
-            Validator.check_empty_string(line_tier)
+        categories_by_name = dict()
+        categories_by_id = dict()
+        categories_by_structure_id = dict()
 
-            if line_tier[4] == "":
-                return "1"
-            if line_tier[5] == "":
-                return "2"
-            if line_tier[6] == "":
-                return "3"
-            if line_tier[6] != "":
-                return "4"
+        for category in self:
+            categories_by_name.setdefault(category.name, category)
+            categories_by_id.setdefault(category.category_id, category)
+            categories_by_structure_id.setdefault(category.structure_id, category)
 
-        except FileNotFoundError as error:
-            sys.exit(str(error))
+        self.categories_by_name = categories_by_name
+        self.categories_by_id = categories_by_id
+        self.categories_by_structure_id = categories_by_structure_id
+        self.indexed_length = len(self)
 
-    @classmethod
-    def find_category_by_name(cls, category_list, category_name) -> Category:
+    def get_index(self, index_name) -> dict:
         """
-        Returns the category with the given name.
+        Returns one of the indexes of the tree. The indexes are rebuilt if categories were added to, removed from or
+        replaced within the tree since the last indexing (see 'invalidate_indexes').
 
-        :param category_list: list of type Category that contains all categories.
-        :param category_name: name of the category to be searched.
-        :return: category with the given name.
+        :param index_name: name of the index ("name", "id" or "structure id").
+        :return: dictionary mapping the name, the id or the structure id to the category.
         """
 
-        try:
-            Validator.check_empty_list(category_list)
-            Validator.check_empty_name(category_name)
+        if self.indexed_length != len(self):
+            self.index_categories()
 
-            for category_1 in category_list:
-                if category_1.name == category_name:
-                    return category_1
-            raise Exception('A category with this name does not exist')
+        if index_name == "name":
+            return self.categories_by_name
+        if index_name == "id":
+            return self.categories_by_id
+        if index_name == "structure id":
+            return self.categories_by_structure_id
 
-        except ValueError as error:
-            sys.exit(str(error))
+        raise ValueError('Error: This index does not exist.')
 
-    @classmethod
-    def find_category_by_id(cls, category_list, id_to_be_searched) -> Category:
+    def invalidate_indexes(self):
         """
-        Returns the category with the given id.
-
-        :param category_list: list of type Category that contains all categories.
-        :param id_to_be_searched: id to be searched.
-        :return: category with the given id.
+        Marks the indexes, the arrays, the distance matrix and the LCA index of the tree as outdated, so that they are
+        rebuilt on the next lookup. Every method of the list that adds, removes, replaces or reorders categories calls
+        this method.
         """
 
-        try:
-            Validator.check_empty_list(category_list)
-            Validator.check_empty_id(id_to_be_searched)
+        self.indexed_length = None
+        self.category_arrays = None
+        self.distance_matrix = None
+        self.lca_index = None
 
-            for category in category_list:
-                if category.category_id == str(id_to_be_searched):
-                    return category
-            raise Exception("No category with the given id!")
+    def append(self, category):
+        super().append(category)
+        self.invalidate_indexes()
 
-        except ValueError as error:
-            sys.exit(str(error))
+    def extend(self, category_list):
+        super().extend(category_list)
+        self.invalidate_indexes()
 
-    @classmethod
-    def set_tier(cls, csv_file, category_list):
-        """
-        Calculates the depth level of each category in the Category Tree that is stored in a list containing all
-        categories.
+    def insert(self, index, category):
+        super().insert(index, category)
+        self.invalidate_indexes()
 
-        :param csv_file: csv file with all categories to be read.
-        :param category_list: list of type Category that contains all categories.
-        """
+    def remove(self, category):
+        super().remove(category)
+        self.invalidate_indexes()
 
-        try:
-            Validator.check_file_existence(csv_file)
+    def pop(self, index=-1):
+        self.invalidate_indexes()
+        return super().pop(index)
 
-            with open(csv_file, "r") as csv_data:
-                csv_reader = csv.reader(csv_data, delimiter=";")
-                next(csv_reader)
-                for line in csv_reader:
-                    category_name = line[2]
-                    category = cls.find_category_by_name(category_list, category_name)
-                    tier = cls.get_tier(line)
-                    category.set_tier(tier)
+    def clear(self):
+        super().clear()
+        self.invalidate_indexes()
 
-        except FileNotFoundError as error:
-            sys.exit(str(error))
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.invalidate_indexes()
 
-    @classmethod
-    def set_tier_1(cls, category_list, parent_line):
-        """
-        Sets a main category as a child of the root category 'Category'.
-        :param category_list: list of type Category that contains all categories.
-        :param parent_line: one line of the csv file.
-        """
+    def reverse(self):
+        super().reverse()
+        self.invalidate_indexes()
 
-        try:
-            Validator.check_empty_list(category_list)
-            Validator.check_empty_string(parent_line)
+    def __setitem__(self, index, category):
+        super().__setitem__(index, category)
+        self.invalidate_indexes()
 
-            child_category = cls.find_category_by_name(category_list, parent_line[2])
-            cls.root.children.append(child_category)
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.invalidate_indexes()
 
-        except ValueError as error:
-            sys.exit(str(error))
+    def __iadd__(self, category_list):
+        self.invalidate_indexes()
+        return super().__iadd__(category_list)
 
-    @classmethod
-    def set_tier_2_and_above(cls, category_list, parent_line, tier):
+    def get_arrays(self) -> CategoryArrays:
         """
-        Matches a child with its parent by reading a given line from the csv file. The tier determines the level
-        of depth in category tree in which the matching needs to take place.
+        Returns the array representation of the tree (parent indices, tiers, integer structure ids and the children
+        in CSR format), see CategoryArrays.
 
-        :param category_list: list of type Category that contains all categories.
-        :param parent_line: one line of the csv file.
-        :param tier: level op depth in the category tree.
+        :return: arrays of the tree.
         """
 
-        try:
-            Validator.check_empty_list(category_list)
-            Validator.check_empty_string(parent_line)
+        return CategoryArrays.for_categories(self)
 
-            category_parent = cls.find_category_by_name(category_list, parent_line[tier + 1])
-            child_category = cls.find_category_by_name(category_list, parent_line[tier + 2])
-            category_parent.children.append(child_category)
+    def get_distance_matrix(self) -> DistanceMatrix:
+        """
+        Returns the distances between all categories of the tree, see DistanceMatrix. The distances are calculated on
+        the first call (or restored from a snapshot, see 'save_snapshot').
 
-        except ValueError as error:
-            sys.exit(str(error))
+        :return: distance matrix of the tree.
+        """
 
-    @classmethod
-    def set_child(cls, parent_line, category_list):
+        return DistanceMatrix.for_categories(self)
+
+    def get_lca_index(self) -> LcaIndex:
         """
-        Uses one line of the csv file to match a child with its parent. All dependencies in the given line are
-        considered. To do so, the tier of the passed line is considered in order to determine the amount of
-        subcategories. In order to set the child, the method 'set_tier_2_and_above()' is used.
+        Returns the index to find the lowest common ancestor of two categories of the tree and to calculate their
+        distance for any depth of the tree, see LcaIndex.
 
-        :param parent_line: one line of the csv file.
-        :param category_list: list of type Category that contains all categories.
+        :return: LCA index of the tree.
         """
 
-        try:
-            Validator.check_empty_list(category_list)
-            Validator.check_empty_string(parent_line)
+        return LcaIndex.for_categories(self)
 
-            tier = cls.get_tier(parent_line)
+    @classmethod
+    def get_tier(cls, line_tier):
+        """
+        Calculates the depth of the category within the given csv file. The tier columns start with the fourth column
+        (tier 1), the tier of the category is the number of filled tier columns, i.e. any number of tiers is supported.
 
-            if tier == "1":
-                cls.set_tier_1(category_list, parent_line)
+        :param line_tier: line that is read from the csv file.
+        :return: level of depth for the lowest subcategory in the category tree.
+        """
 
-            if tier == "2":
-                cls.set_tier_2_and_above(category_list, parent_line, 2)
+        try:
+            Validator.check_empty_string(line_tier)
 
-            if tier == "3":
-                cls.set_tier_2_and_above(category_list, parent_line, 2)
-                cls.set_tier_2_and_above(category_list, parent_line, 3)
+            tier = 1
+            while tier + 3 < len(line_tier) and line_tier[tier + 3] != "":
+                tier = tier + 1
 
-            if tier == "4":
-                cls.set_tier_2_and_above(category_list, parent_line, 2)
-                cls.set_tier_2_and_above(category_list, parent_line, 3)
-                cls.set_tier_2_and_above(category_list, parent_line, 4)
+            return str(tier)
 
-        except ValueError as error:
+        except FileNotFoundError as error:
             sys.exit(str(error))
 
     @classmethod
-    def set_children(cls, file, category_list):
+    def find_category_by_name(cls, category_list, category_name) -> Category:
         """
-        Sets all children according to the given csv file.
+        Returns the category with the given name.
 
-        :param file: csv file that contains all information about the categories.
         :param category_list: list of type Category that contains all categories.
+        :param category_name: name of the category to be searched.
+        :return: category with the given name.
         """
 
         try:
             Validator.check_empty_list(category_list)
-            Validator.check_file_existence(file)
+            Validator.check_empty_name(category_name)
 
-            with open(file, "r") as csv_file:
-                csv_reader = csv.reader(csv_file, delimiter=";")
-                next(csv_reader)
+            if isinstance(category_list, CategoryTree):
+                category = category_list.get_index("name").get(category_name)
+                if category is not None:
+                    return category
+                raise Exception('A category with this name does not exist')
 
-                for line in csv_reader:
-                    cls.set_child(line, category_list)
+            for category_1 in category_list:
+                if category_1.name == category_name:
+                    return category_1
+            raise Exception('A category with this name does not exist')
 
-        except (ValueError, FileNotFoundError) as error:
+        except ValueError as error:
             sys.exit(str(error))
 
     @classmethod
-    def set_all_parents(cls, category_list, csv_data):
+    def find_category_by_id(cls, category_list, id_to_be_searched) -> Category:
         """
-        Sets the parents for all categories of the entire csv file.
+        Returns the category with the given id.
 
         :param category_list: list of type Category that contains all categories.
-        :param csv_data: csv file that contains all information about the categories.
+        :param id_to_be_searched: id to be searched.
+        :return: category with the given id.
         """
 
         try:
             Validator.check_empty_list(category_list)
-            Validator.check_file_existence(csv_data)
+            Validator.check_empty_id(id_to_be_searched)
 
-            with open(csv_data, "r") as csv_file:
-                csv_reader = csv.reader(csv_file, delimiter=";")
-                next(csv_reader)
+            if isinstance(category_list, CategoryTree):
+                category = category_list.get_index("id").get(str(id_to_be_searched))
+                if category is not None:
+                    return category
+                raise Exception("No category with the given id!")
 
-                for line in csv_reader:
-                    if cls.get_tier(line) != "1":
-                        cls.set_parent(category_list, line)
+            for category in category_list:
+                if category.category_id == str(id_to_be_searched):
+                    return category
+            raise Exception("No category with the given id!")
 
-        except (ValueError, FileNotFoundError) as error:
+        except ValueError as error:
             sys.exit(str(error))
 
     @classmethod
-    def set_parent(cls, category_list, line):
+    def find_category_by_structure_id(cls, category_list, structure_id) -> Category:
         """
-        For each entry of the list of categories, the parent of the category will be set. In case of a main node
-        (tier = 1), nothing will happen. If the level is deeper (2 - 4), the parent category will be added by using the
-        parent id given in the csv file.
+        Returns the category with the given structure id.
 
         :param category_list: list of type Category that contains all categories.
-        :param line: one line of the csv file.
+        :param structure_id: structure id to be searched.
+        :return: category with the given structure id.
         """
 
         try:
             Validator.check_empty_list(category_list)
-            Validator.check_empty_string(line)
+            Validator.check_empty_id(structure_id)
+
+            if isinstance(category_list, CategoryTree):
+                category = category_list.get_index("structure id").get(structure_id)
+                if category is not None:
+                    return category
+                raise Exception("No category with the given structure id!")
 
-            tier_level = cls.get_tier(line)
-            if tier_level == "1":
-                child = cls.find_category_by_id(category_list, line[0])
-                cls.root.children.append(child)
-            if (tier_level == "2") or (tier_level == "3") or (tier_level == "4"):
-                parent = cls.find_category_by_id(category_list, line[1])
-                child = cls.find_category_by_id(category_list, line[0])
-                child.parent = parent
+            for category in category_list:
+                if category.structure_id == structure_id:
+                    return category
+            raise Exception("No category with the given structure id!")
 
         except ValueError as error:
             sys.exit(str(error))
@@ -309,11 +304,13 @@ class CategoryTree:
         try:
             Validator.check_empty_list(category_list)
 
-            print(f"Root category '{cls.root.name}' ({cls.root.category_id}) has no parents and the following children:")
-            for child in cls.root.children:
+            root = category_list[0]
+
+            print(f"Root category '{root.name}' ({root.category_id}) has no parents and the following children:")
+            for child in root.children:
                 print(child.name)
             for category in category_list:
-                if category.parent == cls.root:
+                if category.parent == root:
                     print(f"'{category.name}' ({category.category_id}) is a main category and has the following children:")
                 if category.parent is not None:
                     if not category.children:
@@ -336,24 +333,20 @@ class CategoryTree:
     @classmethod
     def set_up_tree(cls, csv_data) -> list:
         """
-        Uses the csv file and methods of the class CategoryTree in order to set up the entire category tree.
+        Uses the csv file and methods of the class CategoryTree in order to set up the entire category tree. The csv
+        file is read only once (see 'read_csv_rows'), all relationships, tiers and structure ids are derived from the
+        read lines (see 'build_tree').
 
         :param csv_data: csv file that contains all categories.
+        :return: tree (list) of type Category that contains all categories and their indexes.
         """
 
         try:
             Validator.check_file_existence(csv_data)
 
-            category_list = cls.get_categories(csv_data)
-            category_list.insert(0, cls.root)
-            cls.set_children(csv_data, category_list)
-            cls.delete_duplicates(category_list)
-            cls.set_all_parents(category_list, csv_data)
-            cls.set_tier(csv_data, category_list)
-            cls.set_structure_id(category_list)
-            cls.initialize_root(category_list)
-            cls.set_root_as_parent(category_list)
-            cls.concatenate_structure_id(category_list)
+            csv_rows = cls.read_csv_rows(csv_data)
+            category_list = cls.build_tree(csv_rows)
+            category_list.csv_data = csv_data
 
             return category_list
 
@@ -361,56 +354,86 @@ class CategoryTree:
             sys.exit(str(error))
 
     @classmethod
-    def set_structure_id(cls, category_list):
+    def read_csv_rows(cls, csv_data) -> list:
         """
-        Calculates and sets the structure id of each category. Each tier is represented by two digits. In case there
-        are leading zeros, the category is represented by only one digit which will be adapted in the
-        function "concatenate_structure_id".
+        Reads all lines of the given csv file (without the header).
 
-        :param category_list: list of type Category that contains all categories.
+        :param csv_data: csv file to be read.
+        :return: list containing every line of the csv file as a list of its columns.
         """
 
         try:
-            Validator.check_empty_list(category_list)
+            Validator.check_file_existence(csv_data)
+
+            with open(csv_data, "r") as csv_file:
+                csv_reader = csv.reader(csv_file, delimiter=";")
+                next(csv_reader)
 
-            tmp_structure_id = 1
+                return list(csv_reader)
 
-            for category in category_list:
-                if category.tier == "1":
-                    category.set_structure_id(tmp_structure_id)
-                    tmp_structure_id = tmp_structure_id + 1
-            tmp_structure_id = 1
+        except FileNotFoundError as error:
+            sys.exit(str(error))
 
-            for category in category_list:
-                if category.tier == "1":
-                    for child_category in category.children:
-                        child_category.structure_id = tmp_structure_id
-                        tmp_structure_id = tmp_structure_id + 1
-                    tmp_structure_id = 1
+    @classmethod
+    def build_tree(cls, csv_rows) -> list:
+        """
+        Builds the category tree from the lines of the csv file. Every line defines one category with its id, the id
+        of its parent and its name, the tier results from the filled tier columns. At first, all categories are
+        created, so that every parent can be found afterwards. Then every category is added as a child of its parent
+        (main categories as children of the root) in the order of the csv file. The parent is the category named in
+        the tier column above the one of the category, i.e. the path given by the tier columns defines the tree.
+        Since every category is added only once, there are no duplicates in the lists of children. At last, the
+        tiers and the structure ids are set according to the position of each category in the tree.
 
-            for category in category_list:
-                if category.tier == "2":
-                    for child_category in category.children:
-                        child_category.structure_id = tmp_structure_id
-                        tmp_structure_id = tmp_structure_id + 1
-                    tmp_structure_id = 1
+        :param csv_rows: list containing every line of the csv file as a list of its columns.
+        :return: tree (list) of type Category that contains all categories and their indexes.
+        """
 
-            for category in category_list:
-                if category.tier == "3":
-                    for child_category in category.children:
-                        child_category.structure_id = tmp_structure_id
-                        tmp_structure_id = tmp_structure_id + 1
-                    tmp_structure_id = 1
+        try:
+            Validator.check_empty_list(csv_rows)
+
+            category_list = cls()
+
+            for line in csv_rows:
+                category = Category.Category(line[0], line[2])
+                category.set_parent_id(line[1])
+                category.set_tier(cls.get_tier(line))
+                category_list.append(category)
+
+            linked_categories = set()
+
+            for line, category in zip(csv_rows, category_list[1:]):
+                if category.name in linked_categories:
+                    continue
+                linked_categories.add(category.name)
+
+                tier = int(category.tier)
+                if tier == 1:
+                    parent = category_list.root
+                else:
+                    parent = cls.find_category_by_name(category_list, line[tier + 1])
+
+                category.parent = parent
+                parent.children.append(category)
+
+            cls.set_tiers_and_structure_ids(category_list)
+            category_list.index_categories()
+            cls.set_main_categories(category_list)
+
+            return category_list
 
         except ValueError as error:
             sys.exit(str(error))
 
     @classmethod
-    def concatenate_structure_id(cls, category_list):
+    def set_tiers_and_structure_ids(cls, category_list):
         """
-        Generates the structure id for every category by concatenating the specific structure ids of the parent
-        categories. After that, every category has its unique structure id that represents its position in the
-        category tree hierarchy. The structure id is set to every category.
+        Calculates and sets the tier and the structure id of each category. The tier is the level of depth of the
+        category below the root. Each tier of the structure id is represented by two digits (or more, if a category
+        has more than 99 children) that hold the position of the category within the children of its parent (starting
+        with 1), e.g. 01020300 is the third child of the second child of the first main category. Unused tiers are
+        filled with zeros up to the depth of the tree (at least 4 tiers). The tree is traversed from the root
+        downwards, so that the structure id of the parent is always known before the ones of its children.
 
         :param category_list: list of type Category that contains all categories.
         """
@@ -418,34 +441,39 @@ class CategoryTree:
         try:
             Validator.check_empty_list(category_list)
 
-            for category in category_list:
-                if category.tier == "4":
-                    category.structure_id = str(category.parent.parent.parent.structure_id).zfill(2) + \
-                                            str(category.parent.parent.structure_id).zfill(2) + \
-                                            str(category.parent.structure_id).zfill(2) + str(category.structure_id).zfill(2)
+            root = category_list[0]
+            width = max(2, len(str(max(len(category.children) for category in category_list))))
+            prefixes = {root: ""}
+            parents = [root]
+            tier = 0
 
-            for category in category_list:
-                if category.tier == "3":
-                    category.structure_id = str(category.parent.parent.structure_id).zfill(2) + \
-                                            str(category.parent.structure_id).zfill(2) + \
-                                            str(category.structure_id).zfill(2) + "00"
+            while parents:
+                next_parents = []
+                tier = tier + 1
 
-            for category in category_list:
-                if category.tier == "2":
-                    category.structure_id = str(category.parent.structure_id).zfill(2) + \
-                                            str(category.structure_id).zfill(2) + "0000"
+                for parent in parents:
+                    for position, child in enumerate(parent.children, start=1):
+                        prefixes[child] = prefixes[parent] + str(position).zfill(width)
+                        child.set_tier(str(tier))
+                        next_parents.append(child)
 
-            for category in category_list:
-                if category.tier == "1":
-                    category.structure_id = str(category.structure_id).zfill(2) + "000000"
+                parents = next_parents
+
+            length = width * max(4, tier - 1)
+            del prefixes[root]
+
+            for category, prefix in prefixes.items():
+                category.set_structure_id(prefix.ljust(length, "0"))
 
         except ValueError as error:
             sys.exit(str(error))
 
     @classmethod
-    def set_root_as_parent(cls, category_list):
+    def set_main_categories(cls, category_list):
         """
-        Sets the parent (root) for every main category (tier 1).
+        Sets the main category (the ancestor on tier 1) of each category, so that it does not have to be searched
+        through the parents on every request. The main categories are taken from the precomputed paths of ancestors
+        (see CategoryArrays). The root has no main category.
 
         :param category_list: list of type Category that contains all categories.
         """
@@ -453,88 +481,219 @@ class CategoryTree:
         try:
             Validator.check_empty_list(category_list)
 
-            for category in category_list:
-                if category.tier == "1":
-                    category.parent = cls.root
+            main_category_indices = CategoryArrays.for_categories(category_list).main_category_indices.tolist()
+
+            for category, main_category_index in zip(category_list, main_category_indices):
+                category.main_category = category_list[main_category_index] if main_category_index != -1 else None
 
         except ValueError as error:
             sys.exit(str(error))
 
     @classmethod
-    def initialize_root(cls, category_list):
+    def calculate_source_hash(cls, csv_data, keywords_file) -> str:
         """
-        Set the root category as the parent of all main categories (tier = 1).
+        Calculates the sha256 hash of the csv file and the keywords file a tree is built from. The hash is stored with
+        a snapshot of the tree in order to recognize outdated snapshots.
 
-        :param category_list: list of type Category that contains all categories.
+        :param csv_data: csv file that contains all categories.
+        :param keywords_file: json file containing the keywords for each category.
+        :return: hexadecimal sha256 hash of both files.
         """
 
         try:
-            Validator.check_empty_list(category_list)
+            Validator.check_file_existence(csv_data)
+            Validator.check_file_existence(keywords_file)
 
-            cls.root.tier = "0"
-            for category in category_list:
-                if cls.get_tier == "1":
-                    category_tier_1 = category
-                    cls.root.children.append(category)
-                    category_tier_1.parent = cls.root
+            source_hash = hashlib.sha256()
 
-        except ValueError as error:
+            for file in (csv_data, keywords_file):
+                with open(file, "rb") as source_file:
+                    source_hash.update(source_file.read())
+                source_hash.update(b"\0")
+
+            return source_hash.hexdigest()
+
+        except FileNotFoundError as error:
             sys.exit(str(error))
 
     @classmethod
-    def delete_duplicates(cls, category_list):
+    def save_snapshot(cls, category_list, snapshot_file, csv_data, keywords_file, with_distances=False):
         """
-        Deletes the duplicates in the children list of all categories since they are counted every single time
-        when they occur in the csv file.
+        Stores the built tree with the keywords of all categories and the compiled keyword matrix as a binary snapshot
+        (uncompressed .npz file). The tree is stored as arrays in the order of the category list: the ids, parent ids,
+        names, tiers and structure ids of the categories as well as the index of the parent of every category (-1 for
+        the root). The order of the children results from the order of the categories. The keywords are stored as
+        indices into the vocabulary with their occurrences, the keyword matrix as its normalized values (CSR format).
+        Optionally, the distances between all categories are stored as well (see DistanceMatrix).
 
-        :param category_list: list of type Category that contains all categories.
+        :param category_list: tree (list) of type Category with initialized keywords (see
+        'NLPHelper.initialize_keywords_from_keywords_dict').
+        :param snapshot_file: file in which the snapshot is stored.
+        :param csv_data: csv file the tree was built from.
+        :param keywords_file: json file the keywords were read from.
+        :param with_distances: True if the distance matrix is stored with the snapshot.
         """
 
         try:
             Validator.check_empty_list(category_list)
 
+            source_hash = cls.calculate_source_hash(csv_data, keywords_file)
+            keyword_matrix = KeywordMatrix.for_categories(category_list)
+            positions = {id(category): index for index, category in enumerate(category_list)}
+
+            parent_indices = [positions[id(category.parent)] if category.parent is not None else -1
+                              for category in category_list]
+            keyword_columns = []
+            keyword_counts = []
+            keyword_indptr = [0]
+
             for category in category_list:
-                list_no_duplicates = []
-                for child in category.children:
-                    if child not in list_no_duplicates:
-                        list_no_duplicates.append(child)
-                category.children = list_no_duplicates
+                for keyword, occurrences in category.keywords.items():
+                    keyword_columns.append(keyword_matrix.vocabulary[keyword])
+                    keyword_counts.append(occurrences)
+                keyword_indptr.append(len(keyword_columns))
+
+            distances = dict()
+            if with_distances:
+                distances["distances"] = DistanceMatrix.for_categories(category_list).matrix
+
+            with open(snapshot_file, "wb") as file:
+                np.savez(file,
+                         source_hash=np.array(source_hash),
+                         category_ids=np.array([category.category_id for category in category_list], dtype=str),
+                         parent_ids=np.array([category.parent_id or "" for category in category_list], dtype=str),
+                         names=np.array([category.name for category in category_list], dtype=str),
+                         tiers=np.array([category.tier for category in category_list], dtype=str),
+                         structure_ids=np.array([str(category.structure_id) for category in category_list], dtype=str),
+                         parent_indices=np.array(parent_indices, dtype=np.int32),
+                         vocabulary=np.array(list(keyword_matrix.vocabulary), dtype=str),
+                         keyword_columns=np.array(keyword_columns, dtype=np.int32),
+                         keyword_counts=np.array(keyword_counts, dtype=np.int64),
+                         keyword_indptr=np.array(keyword_indptr, dtype=np.int32),
+                         matrix_data=keyword_matrix.matrix.data,
+                         matrix_indices=keyword_matrix.matrix.indices,
+                         matrix_indptr=keyword_matrix.matrix.indptr,
+                         **distances)
 
         except ValueError as error:
             sys.exit(str(error))
 
     @classmethod
-    def convert_csv_into_dict(cls, csv_file) -> list:
+    def load_snapshot(cls, snapshot_file, csv_data, keywords_file):
         """
-        Converts the given csv file into a list containing dictionaries for each category.
-        The keys are identical to the first line of the csv file whereas the values are represented
-        by the content of each line.
+        Restores a tree with the keywords of all categories and the compiled keyword matrix (as well as the distance
+        matrix if it was stored) from a snapshot (see 'save_snapshot'). The snapshot is only used if it was created
+        from the given csv file and keywords file, i.e. if the stored hash equals the hash of the current files. A
+        snapshot that cannot be read (e.g. a damaged file or a snapshot of an older format with missing arrays) is
+        treated like an outdated one.
 
-        :param csv_file: csv file to be read.
-        :return: list of dictionaries containing each categories with the given keys and values.
+        :param snapshot_file: file in which the snapshot is stored.
+        :param csv_data: csv file that contains all categories.
+        :param keywords_file: json file containing the keywords for each category.
+        :return: tree (list) of type Category with initialized keywords or None if the snapshot does not exist, is
+        outdated or cannot be read.
         """
 
+        if not os.path.isfile(snapshot_file):
+            return None
+
         try:
-            Validator.check_file_existence(csv_file)
+            return cls.__read_snapshot(snapshot_file, csv_data, keywords_file)
 
-            category_id = "category id"
-            parent_id = "parent id"
-            category_name = "category name"
-            tier_1 = "tier 1"
-            tier_2 = "tier 2"
-            tier_3 = "tier 3"
-            tier_4 = "tier 4"
+        except (KeyError, IndexError, ValueError, OSError, EOFError, zipfile.BadZipFile):
+            return None
 
-            category_list = []
+    @classmethod
+    def __read_snapshot(cls, snapshot_file, csv_data, keywords_file):
+        """
+        Reads the arrays of a snapshot and rebuilds the tree from them (see 'load_snapshot').
 
-            with open(csv_file, "r") as csv_data:
-                csv_reader = csv.reader(csv_data, delimiter=";")
-                next(csv_reader)
+        :param snapshot_file: file in which the snapshot is stored.
+        :param csv_data: csv file that contains all categories.
+        :param keywords_file: json file containing the keywords for each category.
+        :return: tree (list) of type Category with initialized keywords or None if the snapshot is outdated.
+        """
+
+        with np.load(snapshot_file) as snapshot:
+            if str(snapshot["source_hash"]) != cls.calculate_source_hash(csv_data, keywords_file):
+                return None
+
+            category_ids = snapshot["category_ids"].tolist()
+            parent_ids = snapshot["parent_ids"].tolist()
+            names = snapshot["names"].tolist()
+            tiers = snapshot["tiers"].tolist()
+            structure_ids = snapshot["structure_ids"].tolist()
+            parent_indices = snapshot["parent_indices"].tolist()
+            vocabulary = snapshot["vocabulary"].tolist()
+            keyword_columns = snapshot["keyword_columns"].tolist()
+            keyword_counts = snapshot["keyword_counts"].tolist()
+            keyword_indptr = snapshot["keyword_indptr"].tolist()
+            matrix_data = snapshot["matrix_data"]
+            matrix_indices = snapshot["matrix_indices"]
+            matrix_indptr = snapshot["matrix_indptr"]
+            distances = snapshot["distances"] if "distances" in snapshot.files else None
+
+        category_list = cls()
+        category_list.csv_data = csv_data
+
+        for index in range(1, len(names)):
+            category = Category.Category(category_ids[index], names[index])
+            category.set_parent_id(parent_ids[index])
+            category.set_tier(tiers[index])
+            category.set_structure_id(structure_ids[index])
+            category_list.append(category)
+
+        for index, category in enumerate(category_list):
+            start, end = keyword_indptr[index], keyword_indptr[index + 1]
+            category.set_keywords({vocabulary[column]: occurrences for column, occurrences
+                                   in zip(keyword_columns[start:end], keyword_counts[start:end])})
+
+            if parent_indices[index] != -1:
+                category.parent = category_list[parent_indices[index]]
+                category.parent.children.append(category)
+
+        category_list.index_categories()
+        cls.set_main_categories(category_list)
+        category_list.keyword_matrix = KeywordMatrix.from_arrays(category_list, vocabulary, matrix_data,
+                                                                 matrix_indices, matrix_indptr)
+        if distances is not None:
+            category_list.distance_matrix = DistanceMatrix(category_list, distances)
+
+        return category_list
+
+    @classmethod
+    def set_up_tree_with_keywords(cls, csv_data, keywords_file, snapshot_file=None, with_distances=False) -> list:
+        """
+        Sets up the category tree and initializes the keywords of all categories. If a snapshot file is given, the
+        tree is restored from the snapshot as long as it belongs to the given files. Otherwise (or if the snapshot is
+        missing or outdated), the tree is built from the csv file and the keywords file and the snapshot is
+        (re-)created. Optionally, the distances between all categories are calculated at once and stored with the
+        snapshot.
+
+        :param csv_data: csv file that contains all categories.
+        :param keywords_file: json file containing the keywords for each category.
+        :param snapshot_file: file in which the snapshot of the tree is stored (optional).
+        :param with_distances: True if the distance matrix is calculated when the tree is built.
+        :return: tree (list) of type Category with initialized keywords.
+        """
+
+        try:
+            Validator.check_file_existence(csv_data)
+            Validator.check_file_existence(keywords_file)
+
+            if snapshot_file is not None:
+                category_list = cls.load_snapshot(snapshot_file, csv_data, keywords_file)
+                if category_list is not None:
+                    return category_list
+
+            category_list = cls.set_up_tree(csv_data)
+            NLPHelper.initialize_keywords_from_keywords_dict(category_list, keywords_file)
+
+            if with_distances:
+                category_list.get_distance_matrix()
 
-                for line in csv_reader:
-                    category_dict = {category_id: line[0], parent_id: line[1], category_name: line[2], tier_1: line[3],
-                                     tier_2: line[4], tier_3: line[5], tier_4: line[6]}
-                    category_list.append(category_dict)
+            if snapshot_file is not None:
+                cls.save_snapshot(category_list, snapshot_file, csv_data, keywords_file, with_distances)
 
             return category_list
 
@@ -542,16 +701,23 @@ class CategoryTree:
             sys.exit(str(error))
 
     @classmethod
-    def create_category_profile(cls, application_name, category_list, language, additional_stopwords=None):
+    def create_category_profile(cls, application_name, category_list, language, additional_stopwords=None,
+                                retry_policy=None, failure_report=None, cache=None):
         """
         Scrapes the description of a given name of an smartphone application and matches it to the most fitting category
-        within the category tree.
+        within the category tree. Failed requests are retried according to the retry policy. If the description can
+        still not be scraped, the application is added to the failure report and skipped (None is returned) or, without
+        a failure report, the program is stopped with an error message.
 
         :param application_name: name of a specific application that is used to compare with the user's description.
         :param category_list: list of type Category that contains all categories.
         :param language: language of the description.
         :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
         defined in the nltk package.
+        :param retry_policy: policy for retrying failed requests (default policy, see RetryPolicy, if None).
+        :param failure_report: report to which the application is added if it cannot be scraped (optional).
+        :param cache: cache of app ids and descriptions, so that every application is only scraped once (see
+        DescriptionCache, optional).
         :return: best matching category within the category tree for the given application.
         """
 
@@ -560,24 +726,25 @@ class CategoryTree:
             Validator.check_empty_string(application_name)
             Validator.check_language(language)
 
-            success = False
+            retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
 
-            while success is False:
-                try:
-                    CategoryScraper.get_application_description(application_name)
-                    success = True
-                except:
-                    pass
+            try:
+                description = retry_policy.call(CategoryScraper.scrape_application_description, application_name,
+                                                cache=cache, description=application_name)
+            except RetryError as error:
+                if failure_report is None:
+                    raise ValueError(str(error))
+                failure_report.add(error)
+                return None
 
-            keyword_dict = NLPHelper.generate_keyword_dict_from_user_description("./files/category_description.txt", language,
-                                                                                 additional_stopwords)
+            keyword_dict = NLPHelper.generate_keyword_dict_from_description(description, language, additional_stopwords)
 
-            best_matches = Calculator.get_top10_best_matches_application(category_list, keyword_dict)
+            match_result = Calculator.match(category_list, keyword_dict)
+            best_matches = match_result.top_matches_application
             # best_match = Calculator.calculate_best_matching_category_initial(category_list, keyword_dict)
 
             if best_matches:
-                matches_dict = Calculator.calculate_main_category_application_matching_values(best_matches, category_list)
-                top_match = Calculator.calculate_highest_matching_value(matches_dict)
+                top_match = Calculator.calculate_highest_matching_value(match_result.main_categories)
                 return top_match
             else:
                 return best_matches
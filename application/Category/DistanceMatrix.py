@@ -0,0 +1,112 @@
+import numpy as np
+
+from application.Category.CategoryArrays import CategoryArrays
+from application.Category.LcaIndex import LcaIndex
+from application.Validator import Validator
+
+
+class DistanceMatrix:
+    """
+    This class represents the distances between all pairs of categories of a category tree (see
+    'Calculator.calculate_distance') as a matrix with one row and one column per category in the order of the category
+    list. Since the distances only depend on the positions of the categories within the tree, they are calculated once
+    for the fixed tree (see LcaIndex), so that the distance between two categories as well as the distances from one
+    category to all others are looked up by the positions of the categories (see 'CategoryArrays.get_position'). For
+    trees with up to 9 tiers, all distances are multiples of the weight of the deepest tier that are stored exactly as
+    float16 (0.125 for the IAB taxonomy).
+    The root is not a category that can be matched, hence its row and column are NaN.
+    The matrix of a category tree is stored with the tree ('distance_matrix'), so that it is only calculated once.
+    """
+
+    def __init__(self, category_list, matrix=None):
+        """
+        Calculates the distances between all categories of the given category list or takes over an already
+        calculated matrix (e.g. read from a snapshot of the category tree).
+
+        :param category_list: list of type Category that contains all categories.
+        :param matrix: array containing the distances between all categories (optional).
+        """
+
+        Validator.check_empty_list(category_list)
+
+        self.category_list = category_list
+        self.arrays = CategoryArrays.for_categories(category_list)
+
+        if matrix is None:
+            valid = np.flatnonzero(self.arrays.parent_indices != -1)
+
+            matrix = np.full((len(category_list), len(category_list)), np.nan, dtype=np.float16)
+            matrix[np.ix_(valid, valid)] = LcaIndex.for_categories(category_list).calculate_distances(valid[:, None],
+                                                                                                      valid[None, :])
+        elif matrix.shape != (len(category_list), len(category_list)):
+            raise ValueError('Error: The distance matrix does not fit the categories.')
+
+        self.matrix = matrix
+
+    @classmethod
+    def for_categories(cls, category_list):
+        """
+        Returns the distance matrix for the given category list. For a category tree, the matrix is stored with the
+        tree and only recalculated if categories were added to, removed from or moved within the tree (see
+        'CategoryTree.invalidate_indexes'). Any other list of categories
+        is calculated on every call.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: distance matrix of the given category list.
+        """
+
+        distance_matrix = getattr(category_list, "distance_matrix", None)
+
+        if distance_matrix is None or not distance_matrix.is_up_to_date(category_list):
+            distance_matrix = cls(category_list)
+            if hasattr(category_list, "distance_matrix"):
+                category_list.distance_matrix = distance_matrix
+
+        return distance_matrix
+
+    def is_up_to_date(self, category_list) -> bool:
+        """
+        Checks whether this matrix was calculated for the given category list in its current size.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: True if the matrix can be used for the given category list.
+        """
+
+        return category_list is self.category_list and len(category_list) == len(self.matrix)
+
+    def distance(self, category_1, category_2) -> float:
+        """
+        Returns the distance between two categories.
+
+        :param category_1: first category.
+        :param category_2: second category.
+        :return: distance between two categories.
+        """
+
+        return float(self.matrix[self.arrays.get_position(category_1), self.arrays.get_position(category_2)])
+
+    def get_row(self, category):
+        """
+        Returns the distances from the given category to all categories in the order of the category list.
+
+        :param category: category from which the distances are looked up.
+        :return: array (read-only view) containing the distance to every category.
+        """
+
+        row = self.matrix[self.arrays.get_position(category)]
+        row.flags.writeable = False
+
+        return row
+
+    def get_distances(self, category, categories):
+        """
+        Returns the distances from the given category to several other categories (e.g. from the best match to all
+        categories of the Top 10).
+
+        :param category: category from which the distances are looked up.
+        :param categories: list of categories to which the distances are looked up.
+        :return: array containing the distance to every given category (same order).
+        """
+
+        return self.matrix[self.arrays.get_position(category),
+                           [self.arrays.get_position(other) for other in categories]].astype(np.float64)
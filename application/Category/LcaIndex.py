@@ -0,0 +1,161 @@
+import numpy as np
+
+from application.Category.CategoryArrays import CategoryArrays
+from application.Validator import Validator
+
+
+class LcaIndex:
+    """
+    This class represents an index to find the lowest common ancestor (LCA) of two categories of a category tree with
+    any depth and any number of children per category. The tree is traversed once (Euler tour) and the minimum depth
+    of every range of the tour is stored in a sparse table, so that the LCA of two categories is found in constant
+    time by two lookups.
+    The index calculates the same weighted tier distance as 'Calculator.calculate_distance' for trees of any depth:
+    the weight of tier 1 is 2, the weight of every further tier is half of the weight of the tier above (0.5, 0.25,
+    0.125, ...). Every tier below the LCA down to the deepest tier of the tree counts twice, except for the tiers on
+    which only one of the two categories exists (they count once). With W(t) as the sum of the weights of the tiers 1
+    to t, the distance of two different categories with the depths d1 and d2 and their LCA on depth l is
+    2 * (W(D) - W(l)) - (W(max(d1, d2)) - W(min(d1, d2))), where D is the depth of the tree.
+    The index of a category tree is stored with the tree ('lca_index'), so that it is only built once.
+    """
+
+    def __init__(self, category_list):
+        """
+        Builds the Euler tour, the depths and the sparse table for the given category list. The first category of
+        the list has to be the root.
+
+        :param category_list: list of type Category that contains all categories.
+        """
+
+        Validator.check_empty_list(category_list)
+
+        arrays = CategoryArrays.for_categories(category_list)
+
+        self.category_list = category_list
+        self.arrays = arrays
+        self.depths = np.zeros(len(category_list), dtype=np.int32)
+        self.first_occurrences = np.zeros(len(category_list), dtype=np.int32)
+
+        tour = []
+        stack = [(0, 0)]
+
+        while stack:
+            index, position = stack.pop()
+            if position == 0:
+                self.first_occurrences[index] = len(tour)
+            tour.append(index)
+
+            children = arrays.get_children(index)
+            if position < len(children):
+                child = int(children[position])
+                self.depths[child] = self.depths[index] + 1
+                stack.append((index, position + 1))
+                stack.append((child, 0))
+
+        self.tour = np.array(tour, dtype=np.int32)
+        self.tree_depth = int(self.depths.max())
+
+        weights = np.array([2] + [0.5 ** (tier - 1) for tier in range(2, self.tree_depth + 1)], dtype=np.float64)
+        self.cumulated_weights = np.concatenate(([0], np.cumsum(weights)))
+
+        self.sparse_table = [self.tour]
+        length = 1
+        while 2 * length <= len(self.tour):
+            previous = self.sparse_table[-1]
+            left, right = previous[:len(previous) - length], previous[length:]
+            self.sparse_table.append(np.where(self.depths[left] <= self.depths[right], left, right))
+            length = 2 * length
+
+    @classmethod
+    def for_categories(cls, category_list):
+        """
+        Returns the LCA index for the given category list. For a category tree, the index is stored with the tree and
+        only rebuilt if categories were added to, removed from or moved within the tree (see
+        'CategoryTree.invalidate_indexes'). Any other list of categories is indexed on every call.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: LCA index of the given category list.
+        """
+
+        lca_index = getattr(category_list, "lca_index", None)
+
+        if lca_index is None or not lca_index.is_up_to_date(category_list):
+            lca_index = cls(category_list)
+            if hasattr(category_list, "lca_index"):
+                category_list.lca_index = lca_index
+
+        return lca_index
+
+    def is_up_to_date(self, category_list) -> bool:
+        """
+        Checks whether this index was built for the given category list in its current size.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: True if the index can be used for the given category list.
+        """
+
+        return category_list is self.category_list and len(category_list) == len(self.depths)
+
+    def find_lca(self, index_1, index_2):
+        """
+        Returns the lowest common ancestor of two categories (or of several pairs of categories, if arrays of indices
+        are given).
+
+        :param index_1: index (or array of indices) of the first category within the category list.
+        :param index_2: index (or array of indices) of the second category within the category list.
+        :return: index (or array of indices) of the lowest common ancestor.
+        """
+
+        first_1 = self.first_occurrences[index_1]
+        first_2 = self.first_occurrences[index_2]
+        start = np.minimum(first_1, first_2)
+        end = np.maximum(first_1, first_2)
+
+        level = np.log2(end - start + 1).astype(np.int32)
+        if np.ndim(level) == 0:
+            table = self.sparse_table[level]
+            left, right = table[start], table[end - (1 << level) + 1]
+        else:
+            left = np.empty(level.shape, dtype=np.int32)
+            right = np.empty(level.shape, dtype=np.int32)
+            for current in np.unique(level):
+                selected = level == current
+                table = self.sparse_table[current]
+                left[selected] = table[start[selected]]
+                right[selected] = table[end[selected] - (1 << int(current)) + 1]
+
+        return np.where(self.depths[left] <= self.depths[right], left, right)
+
+    def calculate_distances(self, index_1, index_2):
+        """
+        Calculates the distance between two categories (or between several pairs of categories, if arrays of indices
+        are given, which are broadcast against each other).
+
+        :param index_1: index (or array of indices) of the first category within the category list.
+        :param index_2: index (or array of indices) of the second category within the category list.
+        :return: distance (or array of distances) between the categories.
+        """
+
+        index_1, index_2 = np.broadcast_arrays(np.asarray(index_1), np.asarray(index_2))
+
+        lca_depths = self.depths[self.find_lca(index_1, index_2)]
+        depths_1 = self.depths[index_1]
+        depths_2 = self.depths[index_2]
+        weights = self.cumulated_weights
+
+        distances = (2 * (weights[self.tree_depth] - weights[lca_depths])
+                     - (weights[np.maximum(depths_1, depths_2)] - weights[np.minimum(depths_1, depths_2)]))
+
+        return np.where(index_1 == index_2, 0.0, distances)
+
+    def distance(self, category_1, category_2) -> float:
+        """
+        Calculates the distance between two categories.
+
+        :param category_1: first category.
+        :param category_2: second category.
+        :return: distance between two categories.
+        """
+
+        return float(self.calculate_distances(self.arrays.get_position(category_1),
+                                              self.arrays.get_position(category_2)))
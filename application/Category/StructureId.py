@@ -0,0 +1,155 @@
+from functools import lru_cache
+
+import numpy as np
+
+from application.Validator import Validator
+
+TIERS = 4
+TIER_WEIGHTS = (2, 0.5, 0.25, 0.125)
+
+
+@lru_cache(maxsize=4096)
+def pack(structure_id) -> int:
+    """
+    Converts a structure id (string with two digits per tier, e.g. 01020300) into an integer with one byte per tier,
+    i.e. the position of the category within the children of its parent on tier 1 is stored in the highest byte, the
+    one on tier 4 in the lowest byte (e.g. 01020300 -> 0x01020300). Unused tiers are 0, so that the ids of a category
+    and all of its subcategories share the same leading bytes. Since a tree only holds a limited number of structure
+    ids, the packed ids are cached. Structure ids that do not consist of exactly 8 digits (e.g. of a deeper tree) are
+    rejected instead of being cut off.
+
+    :param structure_id: structure id (string with a length of 8) of a category.
+    :return: packed structure id.
+    """
+
+    Validator.check_structure_id(structure_id)
+
+    packed = 0
+
+    for tier in range(TIERS):
+        packed = (packed << 8) | int(structure_id[2 * tier:2 * tier + 2])
+
+    return packed
+
+
+def unpack(packed) -> str:
+    """
+    Converts a packed structure id back into its string representation (see 'pack').
+
+    :param packed: packed structure id.
+    :return: structure id (string with a length of 8).
+    """
+
+    return "".join(str((packed >> (8 * (TIERS - 1 - tier))) & 0xFF).zfill(2) for tier in range(TIERS))
+
+
+def is_half_zero(position):
+    """
+    Checks whether exactly one of the two digits of a tier of the structure id is 0 (e.g. 01 or 10). Works for single
+    values as well as for arrays.
+
+    :param position: position of the category on a tier (value of one byte of the packed structure id).
+    :return: True if exactly one digit is 0.
+    """
+
+    return (position // 10 == 0) != (position % 10 == 0)
+
+
+@lru_cache(maxsize=4096)
+def check(packed):
+    """
+    Checks whether the packed structure id of a category corresponds with the syntactical rules of the category tree
+    in the same way as 'Calculator.check_distances' does for the string representation: the main category must not be
+    empty (00), a tier that is empty must not be followed by a tier with exactly one digit of 0, and an empty second
+    tier additionally must not be followed by such a fourth tier. Valid ids are cached, so that every id is only
+    checked once.
+
+    :param packed: packed structure id of a category.
+    """
+
+    tier_1, tier_2, tier_3, tier_4 = ((packed >> 24) & 0xFF, (packed >> 16) & 0xFF, (packed >> 8) & 0xFF,
+                                      packed & 0xFF)
+
+    if tier_1 == 0:
+        raise Exception("Incorrect structure id!")
+    if tier_2 == 0 and (is_half_zero(tier_3) or is_half_zero(tier_4)):
+        raise Exception("Incorrect structure id!")
+    if tier_3 == 0 and is_half_zero(tier_4):
+        raise Exception("Incorrect structure id!")
+
+
+def calculate_distance(packed_1, packed_2):
+    """
+    Calculates the distance of two categories from their packed structure ids with the same result as
+    'Calculator.calculate_distance'. The first tier on which the ids differ results from the highest differing byte
+    (XOR of both ids). From this tier downwards, the weight of each tier (2, 0.5, 0.25, 0.125) is counted once if
+    exactly one of the ids is empty on this tier and twice otherwise.
+
+    :param packed_1: packed structure id of the first category.
+    :param packed_2: packed structure id of the second category.
+    :return: distance between two categories.
+    """
+
+    check(packed_1)
+    check(packed_2)
+
+    difference = packed_1 ^ packed_2
+    if difference == 0:
+        return 0
+
+    distance = 0
+    shift = (difference.bit_length() - 1) // 8 * 8
+
+    for weight in TIER_WEIGHTS[TIERS - 1 - shift // 8:]:
+        if ((packed_1 >> shift) & 0xFF == 0) != ((packed_2 >> shift) & 0xFF == 0):
+            distance = distance + weight
+        else:
+            distance = distance + weight * 2
+        shift = shift - 8
+
+    return distance
+
+
+def check_all(packed_ids):
+    """
+    Checks an array of packed structure ids (see 'check').
+
+    :param packed_ids: array of packed structure ids.
+    """
+
+    tier_1, tier_2, tier_3, tier_4 = ((packed_ids >> 24) & 0xFF, (packed_ids >> 16) & 0xFF, (packed_ids >> 8) & 0xFF,
+                                      packed_ids & 0xFF)
+
+    if np.any((tier_1 == 0)
+              | ((tier_2 == 0) & (is_half_zero(tier_3) | is_half_zero(tier_4)))
+              | ((tier_3 == 0) & is_half_zero(tier_4))):
+        raise Exception("Incorrect structure id!")
+
+
+def calculate_distances(packed_ids_1, packed_ids_2):
+    """
+    Calculates the distances of several pairs of categories at once (see 'calculate_distance'). The arrays are
+    broadcast against each other, e.g. a single id and an array of ids result in the distances from one category to
+    all others. A tier is counted if the ids differ on this tier or on a tier above, i.e. if the ids shifted down to
+    this tier differ.
+
+    :param packed_ids_1: array of packed structure ids of the first categories.
+    :param packed_ids_2: array of packed structure ids of the second categories.
+    :return: array containing the distances between the categories.
+    """
+
+    packed_ids_1 = np.asarray(packed_ids_1, dtype=np.int64)
+    packed_ids_2 = np.asarray(packed_ids_2, dtype=np.int64)
+
+    check_all(packed_ids_1)
+    check_all(packed_ids_2)
+
+    distances = np.zeros(np.broadcast(packed_ids_1, packed_ids_2).shape, dtype=np.float64)
+
+    for tier in range(TIERS):
+        shift = 8 * (TIERS - 1 - tier)
+        counted = (packed_ids_1 >> shift) != (packed_ids_2 >> shift)
+        half = ((packed_ids_1 >> shift) & 0xFF == 0) != ((packed_ids_2 >> shift) & 0xFF == 0)
+        distances += np.where(counted, np.where(half, TIER_WEIGHTS[tier], TIER_WEIGHTS[tier] * 2), 0)
+
+    return distances
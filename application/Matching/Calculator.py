@@ -1,13 +1,24 @@
+import heapq
 import sys
 from itertools import islice
 
-from application.Category import Category
+import numpy as np
+
+from application.Category import Category, StructureId
+from application.Category.CategoryArrays import CategoryArrays
+from application.Category.LcaIndex import LcaIndex
 from application.Category.CategoryTree import CategoryTree
 from application.Matching import NLPHelper
-from application.Matching.NLPHelper import initialize_keywords_from_keywords_dict
+from application.Matching.KeywordMatrix import KeywordMatrix
+from application.Matching.MatchResult import MatchResult
 from application.Scraper import CategoryScraper
+from application.Scraper.Retry import RetryError, RetryPolicy, FailureReport
 from application.Validator import Validator
 
+TOP_MATCHES_NUMBER = 10
+MINIMUM_MATCHING_VALUE = 0.01
+MINIMUM_MATCHING_VALUE_APPLICATION = 0.008
+
 
 def get_total_occurrences(keywords_dict) -> int:
     """
@@ -65,58 +76,47 @@ def calculate_matching_values_all_categories(category_list, user_dict) -> dict:
     """
     Calculates matching values of all categories and the given user description. The user's description needs to be
     stored as a dictionary containing the name of the token and its number of occurrences in the description. The
-    dictionary will be normalized within this function.
+    dictionary will be normalized within this function. The keywords of the categories are compiled once into a
+    sparse matrix (see KeywordMatrix), so that all matching values result from one matrix-vector multiplication.
+    If a MatchResult is given instead of the dictionary, its already calculated matching values are returned.
 
     :param category_list: list of type Category that contains all categories.
-    :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user.
+    :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user
+    or the MatchResult of this description.
     :return: dictionary holding matching values with every category in the category list.
     """
 
     try:
         Validator.check_empty_list(category_list)
 
-        matching_values_dict = dict()
-        user_dict_normalized = calculate_normalized_values_of_keywords(user_dict)
+        if isinstance(user_dict, MatchResult):
+            return user_dict.matching_values
 
-        for category in category_list:
-            normalized_keywords_dict = calculate_normalized_values_of_keywords(category.keywords)
-            result = calculate_matching_values(
-                calculate_normalized_values_of_keywords(normalized_keywords_dict), user_dict_normalized)
-            matching_values_dict[category.name] = result
-
-        return matching_values_dict
+        keyword_matrix = KeywordMatrix.for_categories(category_list)
+        return keyword_matrix.calculate_matching_values(user_dict)
 
     except ValueError as error:
         sys.exit(str(error))
 
 
-def calculate_best_matching_category(category_list, user_dict):
+def calculate_best_matching_category(category_list, user_dict, threshold=MINIMUM_MATCHING_VALUE):
     """
     Calculates the best matching category for the given user's description.
 
     :param category_list: list of type Category that contains all categories.
     :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user.
-    :return: dictionary holding the best match with the user's description.
+    :param threshold: minimum matching value the best matching category needs to reach.
+    :return: best matching category or -1 if no category reaches the minimum matching value.
     """
 
     try:
         Validator.check_empty_list(category_list)
 
-        best_match = dict()
-        best_matching_category_name = ""
-        best_matching_category_occurrences = 0
         matching_values_dict = calculate_matching_values_all_categories(category_list, user_dict)
+        best_match = select_top_matches(matching_values_dict, 1, threshold)
 
-        for element in matching_values_dict:
-            if matching_values_dict[element] > best_matching_category_occurrences:
-                best_matching_category_occurrences = matching_values_dict[element]
-                best_matching_category_name = element
-
-        if best_matching_category_occurrences >= 0.01:
-
-            best_match[best_matching_category_name] = best_matching_category_occurrences
-
-            best_matching_category = best_matching_category_name
+        if best_match:
+            best_matching_category = next(iter(best_match))
             category_comparison = CategoryTree.find_category_by_name(category_list, best_matching_category)
             return category_comparison
 
@@ -171,12 +171,77 @@ def take(number, iterable):
     return list(islice(iterable, number))
 
 
-def get_top10_best_matches(category_list, user_dict):
+def select_top_matches(matching_dict, number=TOP_MATCHES_NUMBER, threshold=None, tie_breaking="order") -> dict:
+    """
+    Selects the best matching entries of the given dictionary without sorting all of its entries. A heap of the size
+    'number' is used instead, so that the selection needs O(n log k) instead of O(n log n) operations.
+
+    :param matching_dict: dictionary containing categories (names) with their matching values.
+    :param number: maximum number of entries to be selected.
+    :param threshold: minimum matching value an entry needs to reach to be selected (None for no minimum).
+    :param tie_breaking: order of entries with the same matching value, either "order" (in the order of the given
+    dictionary, i.e. the order of the category list) or "name" (alphabetical).
+    :return: dictionary containing the selected entries in descending order of their matching values.
+    """
+
+    items = matching_dict.items()
+
+    if threshold is not None:
+        items = [item for item in items if item[1] >= threshold]
+
+    if tie_breaking == "order":
+        top_matches = heapq.nsmallest(number, items, key=lambda item: -item[1])
+    elif tie_breaking == "name":
+        top_matches = heapq.nsmallest(number, items, key=lambda item: (-item[1], item[0]))
+    else:
+        raise ValueError('Error: The tie breaking must be either "order" or "name".')
+
+    return dict(top_matches)
+
+
+def select_top_indices(scores, number=TOP_MATCHES_NUMBER, threshold=None, tie_breaking="order", names=None) -> list:
+    """
+    Selects the indices of the best matching values of the given array. Only the candidates that can belong to the
+    best 'number' values are sorted, the others are sorted out by a partial partition of the array (O(n)).
+
+    :param scores: array holding the matching value of every category in the order of the category list.
+    :param number: maximum number of indices to be selected.
+    :param threshold: minimum matching value an index needs to reach to be selected (None for no minimum).
+    :param tie_breaking: order of indices with the same matching value, either "order" (ascending index) or "name"
+    (alphabetical, the names need to be given).
+    :param names: names of the categories in the order of the category list (only needed for tie breaking by name).
+    :return: list containing the selected indices in descending order of their matching values.
+    """
+
+    if threshold is None:
+        candidates = np.arange(len(scores))
+    else:
+        candidates = np.flatnonzero(scores >= threshold)
+
+    if 0 < number < len(candidates):
+        kth_value = -np.partition(-scores[candidates], number - 1)[number - 1]
+        candidates = candidates[scores[candidates] >= kth_value]
+
+    if tie_breaking == "order":
+        top_indices = sorted(candidates.tolist(), key=lambda index: -scores[index])
+    elif tie_breaking == "name":
+        top_indices = sorted(candidates.tolist(), key=lambda index: (-scores[index], names[index]))
+    else:
+        raise ValueError('Error: The tie breaking must be either "order" or "name".')
+
+    return top_indices[:number]
+
+
+def get_top10_best_matches(category_list, user_dict, number=TOP_MATCHES_NUMBER, threshold=MINIMUM_MATCHING_VALUE,
+                           tie_breaking="order"):
     """
     Returns the 10 best fitting categories for the user's description.
 
     :param category_list: list of type Category that contains all categories.
     :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user.
+    :param number: number of the best fitting categories to be returned.
+    :param threshold: minimum matching value a category needs to reach.
+    :param tie_breaking: order of categories with the same matching value (see 'select_top_matches').
     :return: Top 10 categories that matches the best with the user's description.
     """
 
@@ -184,17 +249,33 @@ def get_top10_best_matches(category_list, user_dict):
         Validator.check_empty_list(category_list)
 
         matching_values_dict = calculate_matching_values_all_categories(category_list, user_dict)
-        tmp_dict = \
-            {key: value for key, value in sorted(matching_values_dict.items(), key=lambda item: item[1], reverse=True)}
+        top_ten_dict = select_top_matches(matching_values_dict, number, threshold, tie_breaking)
+
+        return top_ten_dict
+
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def get_top10_best_matches_application(category_list, user_dict, number=TOP_MATCHES_NUMBER, threshold=None,
+                                       tie_breaking="order") -> dict:
+    """
+    Returns the 10 best fitting categories for the user's description. In contrast to 'get_top10_best_matches', no
+    minimum matching value is required by default, since the description of an application always needs a category.
 
-        top_ten_list = take(10, tmp_dict.items())
-        list_tmp = list()
+    :param category_list: list of type Category that contains all categories.
+    :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user.
+    :param number: number of the best fitting categories to be returned.
+    :param threshold: minimum matching value a category needs to reach (e.g. MINIMUM_MATCHING_VALUE_APPLICATION).
+    :param tie_breaking: order of categories with the same matching value (see 'select_top_matches').
+    :return: Top 10 categories that matches the best with the user's description.
+    """
 
-        for element in top_ten_list:
-            if element[1] >= 0.01:
-                list_tmp.append(element)
+    try:
+        Validator.check_empty_list(category_list)
 
-        top_ten_dict = dict(list_tmp)
+        matching_values_dict = calculate_matching_values_all_categories(category_list, user_dict)
+        top_ten_dict = select_top_matches(matching_values_dict, number, threshold, tie_breaking)
 
         return top_ten_dict
 
@@ -202,44 +283,121 @@ def get_top10_best_matches(category_list, user_dict):
         sys.exit(str(error))
 
 
-def get_top10_best_matches_application(category_list, user_dict) -> dict:
+def score_batch(category_list, user_dicts):
     """
-    Returns the 10 best fitting categories for the user's description.
+    Calculates the matching values of all categories for several user descriptions with one matrix multiplication.
+
+    :param category_list: list of type Category that contains all categories.
+    :param user_dicts: list of dictionaries containing all tokens with their number of occurrences in the descriptions
+    of the users.
+    :return: matrix with one row per user description and one column per category (same order as the category list).
+    """
+
+    try:
+        Validator.check_empty_list(category_list)
+
+        keyword_matrix = KeywordMatrix.for_categories(category_list)
+        return keyword_matrix.score_batch(user_dicts)
+
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def create_match_result(category_list, scores, number=TOP_MATCHES_NUMBER, threshold=MINIMUM_MATCHING_VALUE,
+                        category_names=None) -> MatchResult:
+    """
+    Derives the best match, the Top 10 (with and without the minimum matching value) and the main categories from the
+    matching values of all categories and stores them in a MatchResult.
+
+    :param category_list: list of type Category that contains all categories.
+    :param scores: array holding the matching value of every category in the order of the category list.
+    :param number: number of the best fitting categories to be stored.
+    :param threshold: minimum matching value the best match and the categories of the Top 10 need to reach.
+    :param category_names: names of the categories in the order of the category list (e.g. the names stored with the
+    keyword matrix, so that they are not collected again for every result).
+    :return: result of the matching.
+    """
+
+    ranking = select_top_indices(scores, number)
+    top_matches = dict()
+    top_matches_application = dict()
+
+    for index in ranking:
+        top_matches_application[category_list[index].name] = float(scores[index])
+        if scores[index] >= threshold:
+            top_matches[category_list[index].name] = float(scores[index])
+
+    if ranking and scores[ranking[0]] >= threshold:
+        best_match = category_list[ranking[0]]
+    else:
+        best_match = -1
+
+    main_categories = calculate_main_category_application_matching_values(top_matches_application, category_list)
+
+    if category_names is None:
+        category_names = [category.name for category in category_list]
+
+    return MatchResult(category_list, category_names, scores, best_match, top_matches, top_matches_application,
+                       main_categories)
+
+
+def match(category_list, user_dict, number=TOP_MATCHES_NUMBER, threshold=MINIMUM_MATCHING_VALUE) -> MatchResult:
+    """
+    Calculates the matching values of all categories for the given user's description once and derives all results
+    from them (see MatchResult).
 
     :param category_list: list of type Category that contains all categories.
     :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user.
-    :return: Top 10 categories that matches the best with the user's description.
+    :param number: number of the best fitting categories to be stored.
+    :param threshold: minimum matching value the best match and the categories of the Top 10 need to reach.
+    :return: result of the matching.
     """
 
     try:
         Validator.check_empty_list(category_list)
 
-        matching_values_dict = calculate_matching_values_all_categories(category_list, user_dict)
-        tmp_dict = \
-            {key: value for key, value in sorted(matching_values_dict.items(), key=lambda item: item[1], reverse=True)}
+        keyword_matrix = KeywordMatrix.for_categories(category_list)
+        return create_match_result(category_list, keyword_matrix.score(user_dict), number, threshold,
+                                   keyword_matrix.category_names)
 
-        top_ten_list = take(10, tmp_dict.items())
-        list_tmp = list()
+    except ValueError as error:
+        sys.exit(str(error))
 
-        for element in top_ten_list:
-            if element[1] >= 0.008:
-                list_tmp.append(element)
-            list_tmp.append(element)
 
-        top_ten_dict = dict(list_tmp)
+def match_batch(category_list, user_dicts, number=TOP_MATCHES_NUMBER, threshold=MINIMUM_MATCHING_VALUE) -> list:
+    """
+    Calculates the results of several user descriptions at once. The matching values of all descriptions are
+    calculated with one matrix multiplication (see 'score_batch').
 
-        return top_ten_dict
+    :param category_list: list of type Category that contains all categories.
+    :param user_dicts: list of dictionaries containing all tokens with their number of occurrences in the descriptions
+    of the users.
+    :param number: number of the best fitting categories to be stored.
+    :param threshold: minimum matching value the best match and the categories of the Top 10 need to reach.
+    :return: list containing the result of the matching for every user description.
+    """
+
+    try:
+        Validator.check_empty_list(category_list)
+
+        keyword_matrix = KeywordMatrix.for_categories(category_list)
+        scores = keyword_matrix.score_batch(user_dicts)
+        return [create_match_result(category_list, row, number, threshold, keyword_matrix.category_names)
+                for row in scores]
 
     except ValueError as error:
         sys.exit(str(error))
 
 
 def calculate_highest_matching_value(matching_dict):
-    tmp_dict = \
-        {key: value for key, value in sorted(matching_dict.items(), key=lambda item: item[1], reverse=True)}
-    top_match = take(1, tmp_dict.items())
+    """
+    Returns the entry with the highest matching value of the given dictionary.
 
-    top_match = dict(top_match)
+    :param matching_dict: dictionary containing categories (names) with their matching values.
+    :return: dictionary containing only the entry with the highest matching value.
+    """
+
+    top_match = select_top_matches(matching_dict, 1)
 
     return top_match
 
@@ -250,23 +408,12 @@ def check_distances(structure_id_1):
     A category cannot be a subcategory without a parent category, e.g. 10200030 is not possible, since at index 4 and 5,
     there are two zeros which means that no parent category is given. Every two digits represent a category in the
     hierarchy, whereas the first two digits refer to a main category on the most upper level (tier 1).
+    The check is done on the packed structure id (see 'StructureId.check').
 
     :param structure_id_1: structure id of a category.
     """
 
-    if structure_id_1[0] == "0" and structure_id_1[1] == "0":
-        raise Exception("Incorrect structure id!")
-    if (structure_id_1[2] == "0" and structure_id_1[3] == "0"
-            and ((structure_id_1[4] == "0" and structure_id_1[5] != "0")
-                 or (structure_id_1[4] != "0" and structure_id_1[5] == "0")
-                 or (structure_id_1[6] == "0" and structure_id_1[7] != "0")
-                 or (structure_id_1[6] != "0" and structure_id_1[7] == "0"))):
-        raise Exception("Incorrect structure id!")
-
-    if (structure_id_1[4] == "0" and structure_id_1[5] == "0"
-            and ((structure_id_1[6] == "0" and structure_id_1[7] != "0") or (
-                    structure_id_1[6] != "0" and structure_id_1[7] == "0"))):
-        raise Exception("Incorrect structure id!")
+    StructureId.check(StructureId.pack(structure_id_1))
 
 
 def calculate_distance(structure_id_1, structure_id_2):
@@ -279,74 +426,66 @@ def calculate_distance(structure_id_1, structure_id_2):
     distance between the main category and the root which results in 1.5 for half the way. Since the other distance
     is at the same level, the distance is doubled. This results in 3. The distance on tier 3 is 0.25,
     and for tier 4 0.125.
+    The distance is calculated on the packed structure ids (see 'StructureId.calculate_distance').
 
     :param structure_id_1: structure id (string with a length of 8) of the first category.
     :param structure_id_2: structure id (string with a length of 8) of the second category.
     :return: distance between two categories.
     """
-    check_distances(structure_id_1)
-    check_distances(structure_id_2)
-
-    distance = 0
-    if structure_id_1 != structure_id_2:
-        if structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1]:
-            if ((structure_id_1[0] == "0" and structure_id_1[1] == "0")
-                and not (structure_id_2[0] == "0" and structure_id_2[1] == "0")) \
-                    or ((structure_id_2[0] == "0" and structure_id_2[1] == "0")
-                        and not (structure_id_1[0] == "0" and structure_id_1[1] == "0")):
-                distance = distance + 2
-            else:
-                distance = distance + 2 * 2
-
-        if (structure_id_1[2] != structure_id_2[2] or structure_id_1[3] != structure_id_2[3]) \
-                or ((structure_id_1[2] == structure_id_2[2] and structure_id_1[3] == structure_id_2[3])
-                    and (structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1])):
-            if ((structure_id_1[2] == "0" and structure_id_1[3] == "0") and not (
-                    structure_id_2[2] == "0" and structure_id_2[3] == "0")) \
-                    or ((structure_id_2[2] == "0" and structure_id_2[3] == "0") and not (
-                    structure_id_1[2] == "0" and structure_id_1[3] == "0")):
-                distance = distance + 0.5
-            else:
-                distance = distance + 0.5 * 2
-
-        if (structure_id_1[4] != structure_id_2[4] or structure_id_1[5] != structure_id_2[5]) \
-                or ((structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
-                    and (structure_id_1[2] != structure_id_2[2] or structure_id_1[3] != structure_id_2[3])) \
-                or ((structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
-                    and (structure_id_1[2] == structure_id_2[2] and structure_id_1[3] == structure_id_2[3])
-                    and (structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1])):
-            if ((structure_id_1[4] == "0" and structure_id_1[5] == "0") and not (
-                    structure_id_2[4] == "0" and structure_id_2[5] == "0")) \
-                    or ((structure_id_2[4] == "0" and structure_id_2[5] == "0") and not (
-                    structure_id_1[4] == "0" and structure_id_1[5] == "0")):
-                distance = distance + 0.25
-            else:
-                distance = distance + 0.25 * 2
-
-        if (structure_id_1[6] != structure_id_2[6] or structure_id_1[7] != structure_id_2[7]) \
-                or ((structure_id_1[6] == structure_id_2[6] and structure_id_1[7] == structure_id_2[7])
-                    and (structure_id_1[4] != structure_id_2[4] or structure_id_1[5] != structure_id_2[5])) \
-                or ((structure_id_1[6] == structure_id_2[6] and structure_id_1[7] == structure_id_2[7])
-                    and (structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
-                    and (structure_id_1[2] != structure_id_2[2] or structure_id_1[3] != structure_id_2[3])) \
-                or ((structure_id_1[6] == structure_id_2[6] and structure_id_1[7] == structure_id_2[7])
-                    and (structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
-                    and (structure_id_1[2] == structure_id_2[2] or structure_id_1[3] == structure_id_2[3])
-                    and structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1]):
-            if ((structure_id_1[6] == "0" and structure_id_1[7] == "0") and not (
-                    structure_id_2[6] == "0" and structure_id_2[7] == "0")) \
-                    or ((structure_id_2[6] == "0" and structure_id_2[7] == "0") and not (
-                    structure_id_1[6] == "0" and structure_id_1[7] == "0")):
-                distance = distance + 0.125
-            else:
-                distance = distance + 0.125 * 2
 
-    return distance
+    return StructureId.calculate_distance(StructureId.pack(structure_id_1), StructureId.pack(structure_id_2))
+
+
+def calculate_distances(category_list, category, categories):
+    """
+    Calculates the distances between a category and several other categories at once (e.g. between the best match and
+    all categories of the Top 10). The distances are calculated from the lowest common ancestors of the categories
+    (see 'CategoryTree.get_lca_index'), so that trees of any depth are supported.
+
+    :param category_list: list of type Category that contains all categories.
+    :param category: category from which the distances are calculated.
+    :param categories: list of categories to which the distances are calculated.
+    :return: array containing the distance to every given category (same order).
+    """
+
+    try:
+        Validator.check_empty_list(category_list)
+        Validator.check_existence_category(category)
+
+        arrays = CategoryArrays.for_categories(category_list)
+        lca_index = LcaIndex.for_categories(category_list)
 
+        return lca_index.calculate_distances(arrays.get_position(category),
+                                             [arrays.get_position(other) for other in categories])
 
-def get_matches_application_with_categories(csv_data, language, additional_stopwords, keywords_file, applications):
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def calculate_distance_between_categories(category_list, category_1, category_2) -> float:
     """
-    Stores all matching values of all applications that are listed in the provided file.
+    Calculates the distance between two categories of the category tree (see 'calculate_distances'). In contrast to
+    'calculate_distance', the distance does not depend on the format of the structure ids, so that it is correct for
+    trees of any depth.
+
+    :param category_list: list of type Category that contains all categories.
+    :param category_1: first category.
+    :param category_2: second category.
+    :return: distance between two categories.
+    """
+
+    return float(calculate_distances(category_list, category_1, [category_2])[0])
+
+
+def get_matches_application_with_categories(csv_data, language, additional_stopwords, keywords_file, applications,
+                                            snapshot_file=None, cache=None, retry_policy=None, failure_report=None):
+    """
+    Stores all matching values of all applications that are listed in the provided file. If a snapshot file is given,
+    the category tree with its keywords is restored from it instead of being built again (see
+    'CategoryTree.set_up_tree_with_keywords'). If a cache is given, the descriptions of the applications are taken
+    from it as far as they are cached (see DescriptionCache). Failed requests are retried according to the retry
+    policy. Applications whose description can still not be scraped (e.g. unknown applications or applications that
+    are not cached in the offline mode) are skipped and added to the failure report, which is printed at the end.
 
     :param csv_data: csv file to be read.
     :param language: language of the description in the file.
@@ -354,6 +493,10 @@ def get_matches_application_with_categories(csv_data, language, additional_stopw
     defined in the nltk package.
     :param keywords_file: json file containing the keywords for each category.
     :param applications: file containing all applications.
+    :param snapshot_file: file in which the snapshot of the category tree is stored (optional).
+    :param cache: cache of app ids and descriptions (optional).
+    :param retry_policy: policy for retrying failed requests (default policy, see RetryPolicy, if None).
+    :param failure_report: report to which the skipped applications are added (a new report if None).
     """
 
     try:
@@ -361,24 +504,33 @@ def get_matches_application_with_categories(csv_data, language, additional_stopw
         Validator.check_language(language)
         Validator.check_file_existence(applications)
 
-        category_list = CategoryTree.set_up_tree(csv_data)
+        category_list = CategoryTree.set_up_tree_with_keywords(csv_data, keywords_file, snapshot_file)
         stopwords_add = NLPHelper.read_additional_stopwords_from_file(additional_stopwords)
-        initialize_keywords_from_keywords_dict(category_list, keywords_file)
+        retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        failure_report = failure_report if failure_report is not None else FailureReport()
 
         with open(applications, 'r', encoding='utf-8') as file:
 
             for line in file:
                 application_name = line
                 application_name = application_name.replace('\n','')
-                CategoryScraper.get_application_description(application_name)
-                keywords_dictionary = NLPHelper.generate_keyword_dict_from_user_description('files/category_description.txt',
-                                                                                    language, stopwords_add)
+                try:
+                    description = retry_policy.call(CategoryScraper.scrape_application_description, application_name,
+                                                    cache=cache, description=application_name)
+                except RetryError as error:
+                    failure_report.add(error)
+                    continue
+                keywords_dictionary = NLPHelper.generate_keyword_dict_from_description(description, language,
+                                                                                       stopwords_add)
                 top10_dict = get_top10_best_matches_application(category_list, keywords_dictionary)
 
                 with open('files/application_matches.txt', "a", encoding='utf-8') as app_file:
                     string_to_write = application_name + ": " + str(top10_dict) + '\n'
                     app_file.write(string_to_write)
 
+        if len(failure_report) > 0:
+            print(failure_report.get_summary())
+
     except (ValueError, FileNotFoundError) as error:
         sys.exit(str(error))
 
@@ -386,7 +538,8 @@ def get_matches_application_with_categories(csv_data, language, additional_stopw
 # new function since version 2
 def calculate_main_category(category) -> Category:
     """
-    Calculates the presumed main category for this application.
+    Calculates the presumed main category for this application. For a category of a built tree, the main category is
+    already set (see 'CategoryTree.set_main_categories'), otherwise the parents are followed up to tier 1.
 
     :param category: one specific category of the category tree.
     :return: main category of a (sub)category.
@@ -395,6 +548,9 @@ def calculate_main_category(category) -> Category:
     try:
         Validator.check_existence_category(category)
 
+        if category.main_category is not None:
+            return category.main_category
+
         tier = Category.Category.get_tier(category)
         category_tmp = category
         exit_function = False
@@ -414,7 +570,8 @@ def calculate_main_category(category) -> Category:
 def calculate_main_category_application_absolute_number(matching_dict, category_list) -> dict:
     """
     dictionary containing all matching main categories for an application with their absolute number of
-    occurrences.
+    occurrences. The main categories are taken from the precomputed paths of ancestors (see CategoryArrays) and
+    counted at once.
 
     :param matching_dict: dictionary containing all matching categories for an application.
     :param category_list: list of type Category that contains all categories.
@@ -424,23 +581,11 @@ def calculate_main_category_application_absolute_number(matching_dict, category_
     try:
         Validator.check_empty_list(category_list)
 
-        result_dict = dict()
-        already_exists = False
-
-        for key in matching_dict.keys():
-            category_tmp = CategoryTree.find_category_by_name(category_list, key)
-            parent_category = calculate_main_category(category_tmp)
-
-            for result_key in result_dict.keys():
-                if result_key == parent_category.name:
-                    already_exists = True
-                    result_dict[result_key] = result_dict[result_key] + 1
-                    break
+        main_category_indices = get_main_category_indices(matching_dict, category_list)
+        main_category_indices = main_category_indices[main_category_indices != -1]
 
-            if already_exists is False:
-                result_dict[parent_category.name] = 1
-
-        return result_dict
+        return aggregate_main_categories(category_list, main_category_indices,
+                                         np.ones(len(main_category_indices), dtype=np.int64))
 
     except ValueError as error:
         sys.exit(str(error))
@@ -450,7 +595,8 @@ def calculate_main_category_application_absolute_number(matching_dict, category_
 def calculate_main_category_application_matching_values(matching_dict, category_list) -> dict:
     """
     Calculates the main categories of the given dictionary containing all matching categories for a specific
-    application.
+    application. The main categories are taken from the precomputed paths of ancestors (see CategoryArrays) and the
+    matching values are summarized at once.
 
     :param matching_dict: dictionary containing all matching categories for an application.
     :param category_list: list of type Category that contains all categories.
@@ -460,24 +606,81 @@ def calculate_main_category_application_matching_values(matching_dict, category_
     try:
         Validator.check_empty_list(category_list)
 
-        result_dict = dict()
-        already_exists = False
+        main_category_indices = get_main_category_indices(matching_dict, category_list)
+        matching_values = np.fromiter(matching_dict.values(), dtype=np.float64, count=len(matching_dict))
+        has_main_category = main_category_indices != -1
+
+        return aggregate_main_categories(category_list, main_category_indices[has_main_category],
+                                         matching_values[has_main_category])
+
+    except ValueError as error:
+        sys.exit(str(error))
 
-        for key, value in matching_dict.items():
-            category_tmp = CategoryTree.find_category_by_name(category_list, key)
-            if category_tmp.name != "Category":
-                parent_category = calculate_main_category(category_tmp)
 
-                for result_key in result_dict.keys():
-                    if result_key == parent_category.name:
-                        already_exists = True
-                        result_dict[result_key] = result_dict[result_key] + matching_dict[key]
-                        break
+def calculate_main_category_matching_values_all_categories(category_list, user_dict) -> dict:
+    """
+    Calculates the summarized matching values of all main categories, considering the matching values of all
+    categories (and not only the ones of the Top 10).
+
+    :param category_list: list of type Category that contains all categories.
+    :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the user
+    or the result of a matching (see 'match').
+    :return: dictionary containing all main categories with the summarized matching values of all their categories.
+    """
+
+    try:
+        Validator.check_empty_list(category_list)
+
+        if isinstance(user_dict, MatchResult):
+            scores = user_dict.scores
+        else:
+            scores = KeywordMatrix.for_categories(category_list).score(user_dict)
 
-                if already_exists is False:
-                    result_dict[parent_category.name] = matching_dict[key]
+        main_category_indices = CategoryArrays.for_categories(category_list).main_category_indices
+        has_main_category = main_category_indices != -1
 
-        return result_dict
+        return aggregate_main_categories(category_list, main_category_indices[has_main_category],
+                                         scores[has_main_category])
 
     except ValueError as error:
         sys.exit(str(error))
+
+
+def get_main_category_indices(matching_dict, category_list):
+    """
+    Looks up the index of the main category of every category in the given dictionary.
+
+    :param matching_dict: dictionary containing matching categories (names as keys).
+    :param category_list: list of type Category that contains all categories.
+    :return: array containing the index of the main category of every key (-1 for the root).
+    """
+
+    arrays = CategoryArrays.for_categories(category_list)
+
+    return np.fromiter((arrays.main_category_indices[
+                            arrays.get_position(CategoryTree.find_category_by_name(category_list, key))]
+                        for key in matching_dict), dtype=np.int64, count=len(matching_dict))
+
+
+def aggregate_main_categories(category_list, main_category_indices, values) -> dict:
+    """
+    Summarizes the given values per main category with a single bincount. The main categories are ordered by their
+    first occurrence.
+
+    :param category_list: list of type Category that contains all categories.
+    :param main_category_indices: array containing the index of the main category of every value.
+    :param values: array containing the values to be summarized.
+    :return: dictionary containing the names of the main categories with their summarized values.
+    """
+
+    if len(main_category_indices) == 0:
+        return dict()
+
+    sums = np.bincount(main_category_indices, weights=values, minlength=len(category_list))
+    if values.dtype.kind == "i":
+        sums = sums.astype(values.dtype)
+
+    unique_indices, first_occurrences = np.unique(main_category_indices, return_index=True)
+    ordered_indices = unique_indices[np.argsort(first_occurrences)].tolist()
+
+    return {category_list[index].name: value for index, value in zip(ordered_indices, sums[ordered_indices].tolist())}
@@ -0,0 +1,128 @@
+import json
+
+from application.Validator import Validator
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_descriptions(corpus_file, chunk_size=CHUNK_SIZE):
+    """
+    Reads the descriptions of a corpus file one after another, so that only one description at a time has to be held
+    in memory and the processing can start before the file is read completely. Two formats are supported: a json file
+    that contains one object with the names of the categories as keys and their descriptions as values (e.g.
+    dict.json) and a JSON Lines file (.jsonl) that contains one object {"category": ..., "description": ...} per line.
+
+    :param corpus_file: json or JSON Lines file that contains the descriptions of the categories.
+    :param chunk_size: number of characters that are read from a json file at once.
+    :return: generator of tuples containing the name of a category and its description.
+    """
+
+    Validator.check_file_existence(corpus_file)
+
+    if corpus_file.endswith(".jsonl"):
+        return read_json_lines(corpus_file)
+
+    return read_json_object(corpus_file, chunk_size)
+
+
+def read_json_lines(corpus_file):
+    """
+    Reads the descriptions of a JSON Lines file line by line. Empty lines are skipped.
+
+    :param corpus_file: JSON Lines file with one object {"category": ..., "description": ...} per line.
+    :return: generator of tuples containing the name of a category and its description.
+    """
+
+    with open(corpus_file, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                    yield entry["category"], entry["description"]
+                except (ValueError, KeyError, TypeError):
+                    raise ValueError('No valid json format.')
+
+
+def read_json_object(corpus_file, chunk_size=CHUNK_SIZE):
+    """
+    Reads the entries of the top-level object of a json file incrementally. The file is read in chunks and every key
+    and value is decoded as soon as it is completely read. If a value is not complete yet, the next chunk is read
+    (at least as many characters as are already buffered, so that long descriptions are decoded only a few times).
+
+    :param corpus_file: json file that contains one object with the names of the categories as keys and their
+    descriptions as values.
+    :param chunk_size: number of characters that are read at once.
+    :return: generator of tuples containing the name of a category and its description.
+    """
+
+    decoder = json.JSONDecoder()
+
+    with open(corpus_file, "r") as file:
+        buffer = ""
+        position = 0
+        end_of_file = False
+
+        def skip_whitespace():
+            nonlocal buffer, position, end_of_file
+            while True:
+                while position < len(buffer) and buffer[position].isspace():
+                    position = position + 1
+                if position < len(buffer) or end_of_file:
+                    return
+                buffer = file.read(chunk_size)
+                position = 0
+                end_of_file = not buffer
+
+        def expect(characters):
+            nonlocal position
+            skip_whitespace()
+            if position >= len(buffer) or buffer[position] not in characters:
+                raise ValueError('No valid json format.')
+            position = position + 1
+            return buffer[position - 1]
+
+        def decode():
+            nonlocal buffer, position, end_of_file
+            skip_whitespace()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                    if end < len(buffer) or end_of_file:
+                        position = end
+                        return value
+                except ValueError:
+                    if end_of_file:
+                        raise ValueError('No valid json format.')
+                data = file.read(max(chunk_size, len(buffer) - position))
+                buffer = buffer[position:] + data
+                position = 0
+                end_of_file = not data
+
+        expect("{")
+        skip_whitespace()
+        if position < len(buffer) and buffer[position] == "}":
+            return
+
+        while True:
+            key = decode()
+            if not isinstance(key, str):
+                raise ValueError('No valid json format.')
+            expect(":")
+            yield key, decode()
+
+            if expect(",}") == "}":
+                return
+
+
+def write_json_lines(descriptions, corpus_file):
+    """
+    Writes the given descriptions to a JSON Lines file (one object {"category": ..., "description": ...} per line),
+    e.g. in order to convert a json file into a file that can be appended and read line by line.
+
+    :param descriptions: iterable of tuples containing the name of a category and its description.
+    :param corpus_file: JSON Lines file to be written.
+    """
+
+    with open(corpus_file, "w", encoding="utf-8") as file:
+        for category_name, description in descriptions:
+            file.write(json.dumps({"category": category_name, "description": description}) + "\n")
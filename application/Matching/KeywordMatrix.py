@@ -0,0 +1,232 @@
+import numpy as np
+from scipy import sparse
+
+from application.Validator import Validator
+
+
+class KeywordMatrix:
+    """
+    This class represents the keywords of all categories as one sparse matrix. Every row of the matrix belongs to a
+    category of the category list (same order), every column to one keyword of the vocabulary. The values are the
+    normalized occurrences of the keywords, i.e. every row sums up to 1 (or 0 if the category has no keywords).
+    The transposed matrix serves as an inverted index (keyword -> categories with their normalized values), so that
+    a single description only touches the categories that share at least one keyword with it. Several descriptions
+    are stacked into one sparse matrix and multiplied with the category-keyword matrix at once.
+    The compiled matrix is stored with the category tree ('keyword_matrix'), so that it is only built once for the
+    same tree and the same keywords.
+    """
+
+    def __init__(self, category_list):
+        """
+        Builds the vocabulary and the normalized category-keyword matrix for the given category list.
+
+        :param category_list: list of type Category that contains all categories.
+        """
+
+        Validator.check_empty_list(category_list)
+
+        self.category_list = category_list
+        self.keyword_dicts = [category.keywords for category in category_list]
+        self.category_names = [category.name for category in category_list]
+        self.vocabulary = dict()
+
+        rows = []
+        columns = []
+        values = []
+
+        for row, keywords in enumerate(self.keyword_dicts):
+            total = sum(keywords.values())
+            for keyword, occurrences in keywords.items():
+                column = self.vocabulary.setdefault(keyword, len(self.vocabulary))
+                rows.append(row)
+                columns.append(column)
+                values.append(occurrences / total)
+
+        self.matrix = None
+        self.inverted_index = dict()
+        self.set_matrix(sparse.csr_matrix((values, (rows, columns)),
+                                          shape=(len(self.keyword_dicts), len(self.vocabulary)), dtype=np.float64))
+
+    @classmethod
+    def from_arrays(cls, category_list, vocabulary, data, indices, indptr):
+        """
+        Restores a compiled matrix from its arrays (e.g. read from a snapshot of the category tree) without
+        calculating the normalized values again. The keywords of the categories have to be the ones the arrays were
+        compiled from.
+
+        :param category_list: list of type Category that contains all categories.
+        :param vocabulary: list containing all keywords in the order of the columns.
+        :param data: normalized values of the matrix (CSR format).
+        :param indices: column indices of the values (CSR format).
+        :param indptr: index pointers of the rows (CSR format).
+        :return: compiled matrix of the given category list.
+        """
+
+        Validator.check_empty_list(category_list)
+
+        keyword_matrix = cls.__new__(cls)
+        keyword_matrix.category_list = category_list
+        keyword_matrix.keyword_dicts = [category.keywords for category in category_list]
+        keyword_matrix.category_names = [category.name for category in category_list]
+        keyword_matrix.vocabulary = {keyword: column for column, keyword in enumerate(vocabulary)}
+        keyword_matrix.matrix = None
+        keyword_matrix.inverted_index = dict()
+        keyword_matrix.set_matrix(sparse.csr_matrix((data, indices, indptr),
+                                                    shape=(len(category_list), len(vocabulary))))
+
+        return keyword_matrix
+
+    def set_matrix(self, matrix):
+        """
+        Sets the category-keyword matrix and builds the inverted index (keyword -> list of tuples containing the
+        index of the category and the normalized value of the keyword) from it.
+
+        :param matrix: sparse matrix with one row per category and one column per keyword of the vocabulary.
+        """
+
+        self.matrix = matrix
+        self.inverted_index = dict()
+
+        postings = self.matrix.T.tocsr()
+        for keyword, column in self.vocabulary.items():
+            start, end = postings.indptr[column], postings.indptr[column + 1]
+            self.inverted_index[keyword] = list(zip(postings.indices[start:end].tolist(),
+                                                    postings.data[start:end].tolist()))
+
+    @classmethod
+    def for_categories(cls, category_list):
+        """
+        Returns the compiled matrix for the given category list. The matrix is only rebuilt if the category list or
+        the keywords of one of its categories have changed since the last compilation. For a category tree, the
+        matrix is stored with the tree. Any other list of categories is compiled on every call.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: compiled matrix of the given category list.
+        """
+
+        compiled = getattr(category_list, "keyword_matrix", None)
+
+        if compiled is None or not compiled.is_up_to_date(category_list):
+            compiled = cls(category_list)
+            if hasattr(category_list, "keyword_matrix"):
+                category_list.keyword_matrix = compiled
+
+        return compiled
+
+    def is_up_to_date(self, category_list) -> bool:
+        """
+        Checks whether this matrix was compiled from the given category list with its current keywords.
+
+        :param category_list: list of type Category that contains all categories.
+        :return: True if the matrix can be used for the given category list.
+        """
+
+        if category_list is not self.category_list or len(category_list) != len(self.keyword_dicts):
+            return False
+
+        for category, keywords in zip(category_list, self.keyword_dicts):
+            if category.keywords is not keywords:
+                return False
+
+        return True
+
+    def score_candidates(self, user_dict):
+        """
+        Calculates the matching values of those categories that share at least one keyword with the user's
+        description. To do so, only the postings (categories with their normalized values) of the tokens of the
+        description are read from the inverted index, so that the effort depends on the number of matching postings
+        instead of the number of categories. Tokens that are not part of the vocabulary cannot match any category, but
+        they are still considered for the normalization of the description.
+
+        :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the
+        user.
+        :return: tuple of two arrays containing the indices of the candidate categories (ascending) and their
+        (non-rounded) matching values.
+        """
+
+        candidate_scores = dict()
+        total = sum(user_dict.values())
+
+        for token, occurrences in user_dict.items():
+            postings = self.inverted_index.get(token)
+            if postings:
+                weight = occurrences / total
+                for row, value in postings:
+                    candidate_scores[row] = candidate_scores.get(row, 0.0) + value * weight
+
+        candidates = np.fromiter(sorted(candidate_scores), dtype=np.intp, count=len(candidate_scores))
+
+        return candidates, np.fromiter((candidate_scores[row] for row in candidates.tolist()), dtype=np.float64,
+                                       count=len(candidates))
+
+    def vectorize_batch(self, user_dicts):
+        """
+        Converts the dictionaries of several user descriptions into one sparse matrix. Every row holds the normalized
+        occurrences of the tokens of one description that are part of the vocabulary.
+
+        :param user_dicts: list of dictionaries containing all tokens with their number of occurrences in the
+        descriptions of the users.
+        :return: sparse matrix with one row per description and one column per keyword of the vocabulary.
+        """
+
+        rows = []
+        columns = []
+        values = []
+
+        for row, user_dict in enumerate(user_dicts):
+            total = sum(user_dict.values())
+            if total:
+                for token, occurrences in user_dict.items():
+                    column = self.vocabulary.get(token)
+                    if column is not None:
+                        rows.append(row)
+                        columns.append(column)
+                        values.append(occurrences / total)
+
+        return sparse.csr_matrix((values, (rows, columns)), shape=(len(user_dicts), len(self.vocabulary)),
+                                 dtype=np.float64)
+
+    def score(self, user_dict):
+        """
+        Calculates the matching values of all categories for the given user's description. Categories that do not
+        share any keyword with the description keep a matching value of 0 (see score_candidates).
+
+        :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the
+        user.
+        :return: array holding the matching value (rounded to 4 digits) of every category in the order of the category
+        list.
+        """
+
+        candidates, candidate_scores = self.score_candidates(user_dict)
+        scores = np.zeros(len(self.keyword_dicts), dtype=np.float64)
+        scores[candidates] = np.round(candidate_scores, 4)
+
+        return scores
+
+    def score_batch(self, user_dicts):
+        """
+        Calculates the matching values of all categories for several user descriptions at once. The descriptions are
+        stacked into one sparse matrix that is multiplied with the category-keyword matrix a single time.
+
+        :param user_dicts: list of dictionaries containing all tokens with their number of occurrences in the
+        descriptions of the users.
+        :return: array with one row per description and one column per category holding the matching values (rounded
+        to 4 digits).
+        """
+
+        scores = self.vectorize_batch(user_dicts) @ self.matrix.T
+
+        return np.round(scores.toarray(), 4)
+
+    def calculate_matching_values(self, user_dict) -> dict:
+        """
+        Calculates the rounded matching values of all categories for the given user's description.
+
+        :param user_dict: dictionary containing all tokens with their number of occurrences in the description of the
+        user.
+        :return: dictionary holding matching values with every category in the category list.
+        """
+
+        scores = self.score(user_dict)
+
+        return dict(zip(self.category_names, scores.tolist()))
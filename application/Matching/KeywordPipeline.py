@@ -0,0 +1,267 @@
+import hashlib
+import json
+import re
+
+import nltk
+from nltk import FreqDist
+from nltk.corpus import stopwords
+from nltk.stem import WordNetLemmatizer
+from nltk.tag import PerceptronTagger
+
+from application.Matching.LemmaCache import LemmaCache
+from application.Validator import Validator
+
+LINKS = re.compile(r"http\S+")
+WEBSITES = re.compile(r"www\S+")
+EMAIL_ADDRESSES = re.compile(r"\S*@\S*\s?")
+SPECIAL_CHARACTERS = re.compile(r'[-.?!,:;()|0-9+&"/%$*=]')
+PUNCTUATION = re.compile(r'[-.?!,:;()|0-9]')
+
+VERSION = 1
+
+
+class KeywordPipeline:
+    """
+    This class represents the processing of descriptions into keywords (cleaning, tokenization, part of speech tagging,
+    removal of stopwords and lemmatization) for one language and one set of additional stopwords. All resources that
+    are needed for the processing (lemmatizer, tagger and stopword sets) are created once with the pipeline and reused
+    for every description, so that a pipeline should be created once and used for all descriptions of a run. The
+    regular expressions are compiled once with the module. The steps that do not depend on the language (normalizing,
+    cleaning and selecting tokens) are available without a pipeline.
+    The lemmas are looked up in a cache (see LemmaCache) that can be shared by several pipelines.
+    The functions of the NLPHelper delegate to a default pipeline per language and additional stopwords (see
+    'NLPHelper.get_pipeline').
+    """
+
+    def __init__(self, language, additional_stopwords=None, lemma_cache=None):
+        """
+        Initializes the pipeline for the given language. The stopwords of the nltk package are extended by the
+        additional stopwords.
+
+        :param language: language of the descriptions.
+        :param additional_stopwords: string containing additional stopwords (separated by commas) that can be set in
+        addition to the stopwords defined in the nltk package.
+        :param lemma_cache: cache for the lemmas (a new cache is created if None).
+        """
+
+        Validator.check_language(language)
+
+        self.language = language
+        self.additional_stopwords = additional_stopwords or None
+        self.lemmatizer = WordNetLemmatizer()
+        self.lemma_cache = lemma_cache if lemma_cache is not None else LemmaCache()
+        self.tagger = None
+
+        self.stop_words = frozenset(stopwords.words(language))
+        self.all_stop_words = self.stop_words
+
+        if self.additional_stopwords is not None:
+            additional_stopwords = self.additional_stopwords.lower().replace(" ", "").split(',')
+            self.all_stop_words = self.stop_words.union(additional_stopwords)
+
+    @classmethod
+    def from_stopwords_file(cls, language, stopwords_file, lemma_cache=None):
+        """
+        Initializes the pipeline for the given language with the additional stopwords of the given file (one stopword
+        per line, see 'NLPHelper.read_additional_stopwords_from_file').
+
+        :param language: language of the descriptions.
+        :param stopwords_file: path of the file that contains the additional stopwords.
+        :param lemma_cache: cache for the lemmas (a new cache is created if None).
+        :return: pipeline with the additional stopwords of the file.
+        """
+
+        Validator.check_file_existence(stopwords_file)
+
+        with open(stopwords_file, "r", encoding="mbcs") as file:
+            additional_stopwords = file.read().replace("\n", ",")
+
+        return cls(language, additional_stopwords, lemma_cache)
+
+    def get_fingerprint(self) -> str:
+        """
+        Calculates a fingerprint of the configuration of the pipeline (language, stopwords and version of the
+        processing), so that keywords that were generated with a different configuration can be recognized. The
+        version (VERSION) has to be increased whenever the processing of the descriptions is changed.
+
+        :return: hexadecimal SHA-256 hash of the configuration.
+        """
+
+        configuration = json.dumps([VERSION, self.language, sorted(self.stop_words), sorted(self.all_stop_words)])
+
+        return hashlib.sha256(configuration.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def normalize(cls, description) -> str:
+        """
+        Converts a description in ASCII (all non-ASCII characters are removed) and lower case characters and joins
+        all lines.
+
+        :param description: description to be normalized.
+        :return: ASCII formatted string in lower case.
+        """
+
+        Validator.check_empty_string(description)
+
+        text = description.encode("ascii", "ignore").lower().decode('utf-8')
+
+        return " ".join(text.splitlines())
+
+    @classmethod
+    def clean(cls, text) -> str:
+        """
+        Removes all links to websites (http, https, www), email addresses as well as special characters in ASCII.
+
+        :param text: string where websites, email addresses, and special characters are removed.
+        :return: string without any links to websites, email addresses, and special characters.
+        """
+
+        Validator.check_empty_string(text)
+
+        text = LINKS.sub("", text)
+        text = WEBSITES.sub("", text)
+        text = EMAIL_ADDRESSES.sub("", text)
+
+        return SPECIAL_CHARACTERS.sub('', text)
+
+    def tag(self, text) -> list:
+        """
+        Tokenizes the given text and tags every token with its part of speech (NLTK parts of speech tagging). The
+        tagger is loaded with the first text.
+
+        :param text: text to be tagged.
+        :return: list of tuples containing the tokens with their pos tags.
+        """
+
+        if self.tagger is None:
+            self.tagger = PerceptronTagger()
+
+        return self.tagger.tag(nltk.word_tokenize(text))
+
+    def remove_stopwords(self, pos_tagged_token_list, with_additional_stopwords=True) -> list:
+        """
+        Removes punctuation, numbers, and stopwords from a given list of tuples containing a token (at index 0)
+        and its part of speech tag (at index 1).
+
+        :param pos_tagged_token_list: list with tuples containing tokens with their pos tags.
+        :param with_additional_stopwords: True if the additional stopwords are removed as well.
+        :return: list of tuples containing only the tokens that are not numbers or stopwords.
+        """
+
+        Validator.check_empty_list(pos_tagged_token_list)
+
+        stop_words = self.all_stop_words if with_additional_stopwords else self.stop_words
+
+        return [word for word in pos_tagged_token_list
+                if len(PUNCTUATION.sub("", word[0])) > 0 and word[0] not in stop_words]
+
+    @classmethod
+    def select_tokens(cls, pos_tagged_token_list) -> list:
+        """
+        Lists only the tokens with the part of speech 'noun', 'verb', 'adjective', and 'adverb' with the simpler
+        notation of their tags (see 'define_pos_tag').
+
+        :param pos_tagged_token_list: list of tokens that are tagged with their parts of speech.
+        :return: list of tokens that are nouns, verbs, adjectives, and adverbs only.
+        """
+
+        Validator.check_empty_list(pos_tagged_token_list)
+
+        list_specific_tokens = []
+
+        for token, tag in pos_tagged_token_list:
+            result = cls.define_pos_tag(tag)
+            if result is not None:
+                list_specific_tokens.append((token, result))
+
+        return list_specific_tokens
+
+    @classmethod
+    def define_pos_tag(cls, tag):
+        """
+        Checks the part of speech and converts the different forms of nouns, verb, adjectives and adverbs to a simpler
+        form. Tokens of the other parts of speech do not carry enough meaning. Therefore, they are not considered.
+
+        :param tag: part of speech tag that are used within the lemmatizer of NLTK.
+        :return: part of speech tag in a simpler notation.
+        """
+
+        if tag in ['NN', 'NNP', 'NNPS', 'NNS']:
+            return 'n'
+        elif tag in ['VB', 'VBD', 'VBN', 'VBP', 'VBZ', 'VBG']:
+            return 'v'
+        elif tag in ['JJ', 'JJR', 'JJS']:
+            return 'a'
+        elif tag in ['RB', 'RBR', 'RBS']:
+            return 'r'
+        else:
+            return None
+
+    def lemmatize(self, list_with_pos_tagged_tokens) -> list:
+        """
+        Lemmatizes a given list containing tokens with their part of speech tags ('n' for noun, 'v' for verb, 'a' for
+        adjective, 'r' for adverb) and removes all lemmas that are stopwords (including the additional stopwords).
+        Every pair of token and tag is only lemmatized once (see LemmaCache).
+
+        :param list_with_pos_tagged_tokens: list of tokens with their part of speech tags.
+        :return: list of tokens in their lemmatized form.
+        """
+
+        Validator.check_empty_list(list_with_pos_tagged_tokens)
+
+        lemmatize = self.lemma_cache.lemmatize
+        lemmatized_content = [lemmatize(token, tag, self.lemmatizer) for token, tag in list_with_pos_tagged_tokens]
+
+        return [word for word in lemmatized_content if word not in self.all_stop_words]
+
+    def extract_from_text(self, text) -> list:
+        """
+        Converts an already prepared text into a lemmatized list containing the tokens that are nouns, verbs,
+        adjectives and adverbs. Before the lemmatization, only the stopwords of the nltk package are removed, the
+        additional stopwords are removed from the lemmas.
+
+        :param text: text to be processed.
+        :return: list of lemmatized tokens.
+        """
+
+        list_cleaned = self.remove_stopwords(self.tag(text), with_additional_stopwords=False)
+
+        return self.lemmatize(self.select_tokens(list_cleaned))
+
+    def extract(self, description) -> list:
+        """
+        Normalizes and cleans a description and converts it into a lemmatized list containing the tokens that are
+        nouns, verbs, adjectives and adverbs.
+
+        :param description: description to be processed.
+        :return: list of lemmatized tokens.
+        """
+
+        return self.extract_from_text(self.clean(self.normalize(description)))
+
+    @classmethod
+    def top_tokens(cls, token_list, number_of_tokens) -> dict:
+        """
+        Calculates the most common tokens in the given list containing tokenized words.
+
+        :param token_list: list containing tokenized words.
+        :param number_of_tokens: number of the most common tokens that is needed.
+        :return: dictionary containing the most common tokens including the frequency of their occurrences.
+        """
+
+        freq_dist = FreqDist(token.lower() for token in token_list)
+
+        return dict(freq_dist.most_common(number_of_tokens))
+
+    def extract_keyword_dict(self, description, number_of_keywords=None) -> dict:
+        """
+        Converts a description into a dictionary of its most common keywords with their number of occurrences.
+
+        :param description: description to be processed.
+        :param number_of_keywords: number of the most common keywords (all keywords if None).
+        :return: dictionary containing the keywords with their number of occurrences.
+        """
+
+        keywords_list = self.extract(description)
+
+        return self.top_tokens(keywords_list, number_of_keywords or len(keywords_list))
@@ -0,0 +1,159 @@
+import json
+import os
+from collections import OrderedDict
+
+
+class LemmaCache:
+    """
+    This class represents a bounded cache for lemmas. The lemma of a token only depends on the token and its part of
+    speech tag, so that every pair (token, pos) is lemmatized only once and looked up afterwards. If the cache is
+    full, the least recently used lemma is removed. The cache counts its hits and misses, so that its hit rate can be
+    checked, and it can be stored in a json file in order to reuse the lemmas in the next run.
+    One cache can be shared by several pipelines (see KeywordPipeline), since the lemmas do not depend on the
+    stopwords. The cache of a worker process can record the lemmas it adds, so that they are merged into the cache of
+    the main process (see 'take_new_lemmas' and 'merge').
+    """
+
+    def __init__(self, maximum_size=100000):
+        """
+        Initializes an empty cache.
+
+        :param maximum_size: maximum number of lemmas that are stored.
+        """
+
+        self.maximum_size = maximum_size
+        self.lemmas = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.new_lemmas = None
+
+    def lemmatize(self, token, pos, lemmatizer) -> str:
+        """
+        Returns the lemma of the given token with the given part of speech tag. The lemmatizer is only called if the
+        lemma is not cached yet.
+
+        :param token: token to be lemmatized.
+        :param pos: part of speech tag of the token ('n', 'v', 'a' or 'r').
+        :param lemmatizer: lemmatizer of the nltk package (WordNetLemmatizer).
+        :return: lemma of the token.
+        """
+
+        key = (token, pos)
+        lemma = self.lemmas.get(key)
+
+        if lemma is not None:
+            self.hits = self.hits + 1
+            self.lemmas.move_to_end(key)
+            return lemma
+
+        self.misses = self.misses + 1
+        lemma = lemmatizer.lemmatize(token, pos)
+        self.lemmas[key] = lemma
+
+        if self.new_lemmas is not None:
+            self.new_lemmas.append([token, pos, lemma])
+
+        if len(self.lemmas) > self.maximum_size:
+            self.lemmas.popitem(last=False)
+
+        return lemma
+
+    def get_hit_rate(self) -> float:
+        """
+        Calculates the share of lookups that were answered by the cache.
+
+        :return: hit rate between 0 and 1 (0 if the cache was not used yet).
+        """
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def get_statistics(self) -> dict:
+        """
+        Returns the counters of the cache, e.g. to write them to a log.
+
+        :return: dictionary containing the number of lemmas, hits and misses as well as the hit rate.
+        """
+
+        return {"lemmas": len(self.lemmas), "hits": self.hits, "misses": self.misses,
+                "hit rate": round(self.get_hit_rate(), 4)}
+
+    def track_new_lemmas(self):
+        """
+        Starts to record the lemmas that are added to the cache from now on (see 'take_new_lemmas').
+        """
+
+        self.new_lemmas = []
+
+    def take_new_lemmas(self) -> list:
+        """
+        Returns the lemmas that were added since the last call (or since 'track_new_lemmas') and starts a new record.
+
+        :return: list containing the token, the part of speech tag and the lemma of every added lemma.
+        """
+
+        if self.new_lemmas is None:
+            return []
+
+        new_lemmas = self.new_lemmas
+        self.new_lemmas = []
+
+        return new_lemmas
+
+    def merge(self, entries, hits=0, misses=0):
+        """
+        Adds the lemmas and the counters of another cache, e.g. of a worker process (see 'take_new_lemmas').
+
+        :param entries: list containing the token, the part of speech tag and the lemma of every lemma to be added.
+        :param hits: number of hits of the other cache.
+        :param misses: number of misses of the other cache.
+        """
+
+        self.add_lemmas(entries)
+        self.hits = self.hits + hits
+        self.misses = self.misses + misses
+
+    def add_lemmas(self, entries):
+        """
+        Adds the given lemmas as the most recently used ones. If the cache is full afterwards, the least recently used
+        lemmas are removed.
+
+        :param entries: list containing the token, the part of speech tag and the lemma of every lemma to be added.
+        """
+
+        for token, pos, lemma in entries:
+            self.lemmas[(token, pos)] = lemma
+            self.lemmas.move_to_end((token, pos))
+
+        while len(self.lemmas) > self.maximum_size:
+            self.lemmas.popitem(last=False)
+
+    def save(self, cache_file):
+        """
+        Stores all cached lemmas (from the least to the most recently used one) in a json file.
+
+        :param cache_file: json file in which the lemmas are stored.
+        """
+
+        with open(cache_file, "w") as file:
+            json.dump([[token, pos, lemma] for (token, pos), lemma in self.lemmas.items()], file)
+
+    def load(self, cache_file):
+        """
+        Adds the lemmas of a json file (see 'save') to the cache. If the file does not exist yet, the cache is not
+        changed.
+
+        :param cache_file: json file in which the lemmas are stored.
+        """
+
+        if not os.path.isfile(cache_file):
+            return
+
+        with open(cache_file) as file:
+            try:
+                entries = json.load(file)
+            except:
+                raise ValueError('No valid json format.')
+
+        self.add_lemmas(entries)
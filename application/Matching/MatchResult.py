@@ -0,0 +1,60 @@
+from functools import cached_property
+
+
+class MatchResult:
+    """
+    This class represents the result of matching one description against all categories of the category tree. The
+    matching values of all categories are calculated only once and every derived result (best match, Top 10, main
+    categories) is stored with it, so that the result can be reused and logged without calculating the matching
+    values again.
+    All functions of the Calculator that take a dictionary of a user's description also accept a MatchResult instead.
+    """
+
+    def __init__(self, category_list, category_names, scores, best_match, top_matches, top_matches_application,
+                 main_categories):
+        """
+        Sets all results of one matching. The object is created by the function 'match' of the Calculator.
+
+        :param category_list: list of type Category that contains all categories.
+        :param category_names: names of the categories in the order of the category list (shared by all results of
+        the same category list).
+        :param scores: array holding the matching value of every category in the order of the category list.
+        :param best_match: best matching category or -1 if no category reaches the minimum matching value.
+        :param top_matches: dictionary containing the 10 best fitting categories that reach the minimum matching value.
+        :param top_matches_application: dictionary containing the 10 best fitting categories without a minimum.
+        :param main_categories: dictionary containing the main categories of the categories in
+        'top_matches_application' with their summarized matching values.
+        """
+
+        self.category_list = category_list
+        self.category_names = category_names
+        self.scores = scores
+        self.best_match = best_match
+        self.has_match = best_match != -1
+        self.top_matches = top_matches
+        self.top_matches_application = top_matches_application
+        self.main_categories = main_categories
+
+    @cached_property
+    def matching_values(self) -> dict:
+        """
+        Matching values of all categories by their names. The dictionary is only created when it is needed for the
+        first time, since most results are only read through their best match and Top 10.
+
+        :return: dictionary holding the matching value of every category in the category list.
+        """
+
+        return dict(zip(self.category_names, self.scores.tolist()))
+
+    def to_dict(self) -> dict:
+        """
+        Converts the result into a dictionary that can be written to a log or a json file. The matching values of
+        all categories are not part of it.
+
+        :return: dictionary containing the best match, the Top 10 and the main categories.
+        """
+
+        return {"best match": self.best_match.name if self.has_match else None,
+                "top matches": self.top_matches,
+                "top matches application": self.top_matches_application,
+                "main categories": self.main_categories}
@@ -1,13 +1,64 @@
-import re
 import sys
+import os
 import json
-import nltk
-
-from nltk import FreqDist
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from application.Matching import CorpusReader
+from application.Matching.KeywordMatrix import KeywordMatrix
+from application.Matching.KeywordPipeline import KeywordPipeline
+from application.Matching.LemmaCache import LemmaCache
 from application.Validator import Validator
 
+pipelines = dict()
+lemma_cache = LemmaCache()
+
+
+def get_pipeline(language, additional_stopwords=None) -> KeywordPipeline:
+    """
+    Returns the default pipeline for the given language and additional stopwords. Every pipeline is created only once
+    per process and reused by all functions of this module, so that the lemmatizer, the tagger and the stopwords are
+    not loaded again for every description. All default pipelines share one lemma cache.
+
+    :param language: language of the descriptions.
+    :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
+    defined in the nltk package.
+    :return: pipeline for the given language and additional stopwords.
+    """
+
+    key = (language, additional_stopwords or None)
+
+    if key not in pipelines:
+        pipelines[key] = KeywordPipeline(language, additional_stopwords, lemma_cache)
+
+    return pipelines[key]
+
+
+def load_lemma_cache(cache_file):
+    """
+    Adds the lemmas of a file that was stored by a previous run to the lemma cache of the default pipelines.
+
+    :param cache_file: json file containing the lemmas (see 'save_lemma_cache').
+    """
+
+    try:
+        lemma_cache.load(cache_file)
+
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def save_lemma_cache(cache_file):
+    """
+    Stores the lemma cache of the default pipelines in a file, so that it can be loaded by the next run.
+
+    :param cache_file: json file in which the lemmas are stored.
+    """
+
+    lemma_cache.save(cache_file)
+
 
 def read_description_string(description):
     """
@@ -19,13 +70,7 @@ def read_description_string(description):
     """
 
     try:
-        Validator.check_empty_string(description)
-        file_only_ascii = description.encode("ascii", "ignore")
-        text = file_only_ascii
-        text = text.lower()
-        text = text.decode('utf-8')
-        new_string = " ".join(text.splitlines())
-        return new_string
+        return KeywordPipeline.normalize(description)
 
     except ValueError as error:
         sys.exit(str(error))
@@ -64,13 +109,7 @@ def clean_file(text_for_cleaning) -> str:
     """
 
     try:
-        Validator.check_empty_string(text_for_cleaning)
-
-        text_cleaned = re.sub(r"http\S+", "", text_for_cleaning)
-        text_cleaned = re.sub(r"www\S+", "", text_cleaned)
-        text_cleaned = re.sub(r"\S*@\S*\s?", "", text_cleaned)
-        text_cleaned = re.sub(r'[-.?!,:;()|0-9+&"/%$*=]', '', text_cleaned)
-        return text_cleaned
+        return KeywordPipeline.clean(text_for_cleaning)
 
     except ValueError as error:
         sys.exit(str(error))
@@ -86,17 +125,7 @@ def top_tokens(token_list, number_of_tokens) -> dict:
     :return: dictionary containing the most common tokens including the frequency of their occurrences.
     """
 
-    freq_dist = FreqDist()
-    token_dict = dict()
-
-    for token in token_list:
-        freq_dist[token.lower()] += 1
-
-    most_common = freq_dist.most_common(number_of_tokens)
-    for element in most_common:
-        token_dict[element[0]] = element[1]
-
-    return token_dict
+    return KeywordPipeline.top_tokens(token_list, number_of_tokens)
 
 
 def remove_stopwords_from_pos_tagged_token_list(pos_tagged_token_list, language, additional_stopwords=None) -> list:
@@ -113,29 +142,8 @@ def remove_stopwords_from_pos_tagged_token_list(pos_tagged_token_list, language,
 
     try:
         Validator.check_empty_list(pos_tagged_token_list)
-        Validator.check_language(language)
-
-        stop_words = set(stopwords.words(language))
 
-        if additional_stopwords is not None:
-            additional_stopwords = additional_stopwords.lower().replace(" ", "")
-            additional_stopwords = additional_stopwords.split(',')
-            stop_words.update(additional_stopwords)
-
-        punctuation = re.compile(r'[-.?!,:;()|0-9]')
-        token_list_post_punctuation = []
-        pos_tagged_token_list_cleaned = []
-
-        for word in pos_tagged_token_list:
-            tmp = punctuation.sub("", word[0])
-            if len(tmp) > 0:
-                token_list_post_punctuation.append(word)
-
-        for word in token_list_post_punctuation:
-            if word[0] not in stop_words:
-                pos_tagged_token_list_cleaned.append(word)
-
-        return pos_tagged_token_list_cleaned
+        return get_pipeline(language, additional_stopwords).remove_stopwords(pos_tagged_token_list)
 
     except ValueError as error:
         sys.exit(str(error))
@@ -149,16 +157,8 @@ def define_pos_tag(tag):
     :param tag: part of speech tag that are used within the lemmatizer of NLTK.
     :return: part of speech tag in a simpler notation.
     """
-    if tag in ['NN', 'NNP', 'NNPS', 'NNS']:
-        return 'n'
-    elif tag in ['VB', 'VBD', 'VBN', 'VBP', 'VBZ', 'VBG']:
-        return 'v'
-    elif tag in ['JJ', 'JJR', 'JJS']:
-        return 'a'
-    elif tag in ['RB', 'RBR', 'RBS']:
-        return 'r'
-    else:
-        return None
+
+    return KeywordPipeline.define_pos_tag(tag)
 
 
 def lemmatize_list(list_with_lemmatized_tokens) -> list:
@@ -171,16 +171,7 @@ def lemmatize_list(list_with_lemmatized_tokens) -> list:
     """
 
     try:
-        Validator.check_empty_list(list_with_lemmatized_tokens)
-
-        list_specific_tokens = []
-
-        for token, tag in list_with_lemmatized_tokens:
-            result = define_pos_tag(tag)
-            if result is not None:
-                list_specific_tokens.append((token, result))
-
-        return list_specific_tokens
+        return KeywordPipeline.select_tokens(list_with_lemmatized_tokens)
 
     except ValueError as error:
         sys.exit(str(error))
@@ -200,27 +191,8 @@ def lemmatize(list_with_pos_tagged_tokens, language, additional_stopwords=None)
 
     try:
         Validator.check_empty_list(list_with_pos_tagged_tokens)
-        Validator.check_language(language)
-
-        lemmatizer = WordNetLemmatizer()
-        lemmatized_content = []
-        list_lemma = []
 
-        for token, tag in list_with_pos_tagged_tokens:
-            lemmatized_content.append(lemmatizer.lemmatize(token, tag))
-
-        stop_words = set(stopwords.words(language))
-
-        if additional_stopwords is not None:
-            additional_stopwords = additional_stopwords.lower().replace(" ", "")
-            additional_stopwords = additional_stopwords.split(',')
-            stop_words.update(additional_stopwords)
-
-        for word in lemmatized_content:
-            if word not in stop_words:
-                list_lemma.append(word)
-
-        return list_lemma
+        return get_pipeline(language, additional_stopwords).lemmatize(list_with_pos_tagged_tokens)
 
     except ValueError as error:
         sys.exit(str(error))
@@ -240,17 +212,7 @@ def generate_keyword_list_from_string(description, language, additional_stopword
     """
 
     try:
-        Validator.check_language(language)
-
-        text = read_description_string(description)
-        text = clean_file(text)
-        tokenized_pos_tagged_list = nltk.pos_tag(nltk.word_tokenize(text))
-
-        list_cleaned = remove_stopwords_from_pos_tagged_token_list(tokenized_pos_tagged_list, language)
-        lemmatized_list_relevant = lemmatize_list(list_cleaned)
-        list_lemmatized_tokens = lemmatize(lemmatized_list_relevant, language, additional_stopwords)
-
-        return list_lemmatized_tokens
+        return get_pipeline(language, additional_stopwords).extract(description)
 
     except ValueError as error:
         sys.exit(str(error))
@@ -271,16 +233,11 @@ def generate_keyword_list(description, language, additional_stopwords=None) -> l
 
     try:
         Validator.check_file_existence(description)
-        Validator.check_language(language)
 
+        pipeline = get_pipeline(language, additional_stopwords)
         text = read_description(description)
-        text = clean_file(text)
-        tokenized_pos_tagged_list = nltk.pos_tag(nltk.word_tokenize(text))
 
-        list_cleaned = remove_stopwords_from_pos_tagged_token_list(tokenized_pos_tagged_list, language)
-        lemmatized_list_relevant = lemmatize_list(list_cleaned)
-        list_lemmatized_tokens = lemmatize(lemmatized_list_relevant, language, additional_stopwords)
-        return list_lemmatized_tokens
+        return pipeline.extract_from_text(pipeline.clean(text))
 
     except (FileNotFoundError, ValueError) as error:
         sys.exit(str(error))
@@ -315,7 +272,8 @@ def initialize_keywords_from_json(category, json_file, language, additional_stop
     """
     Generates a keywords list based on the several methods using a file with descriptions and the language setting for
     those descriptions and sets the 15 most frequent keywords of this list as the keywords of the given category. The
-    descriptions are stored in a json file that is read at the beginning.
+    descriptions are stored in a json or JSON Lines file that is read until the description of the category is found
+    (see 'CorpusReader.read_descriptions').
 
     :param category: Category for which the keywords should be set.
     :param json_file: file that contains descriptions of the category.
@@ -329,63 +287,259 @@ def initialize_keywords_from_json(category, json_file, language, additional_stop
         Validator.check_file_existence(json_file)
         Validator.check_language(language)
 
-        with open(json_file) as f:
-            try:
-                data = json.load(f)
-            except:
-                raise ValueError('No valid json format.')
-
-            data = data[category.name]
-            tokenized_pos_tagged_list = nltk.pos_tag(nltk.word_tokenize(data))
+        description = next((description for name, description in CorpusReader.read_descriptions(json_file)
+                            if name == category.name), None)
+        if description is None:
+            raise ValueError('Error: The description of the category ' + category.name + ' is missing.')
 
-            list_cleaned = remove_stopwords_from_pos_tagged_token_list(tokenized_pos_tagged_list, language)
-            lemmatized_list_relevant = lemmatize_list(list_cleaned)
-            list_lemmatized_tokens = lemmatize(lemmatized_list_relevant, language, additional_stopwords)
-            keywords_list = top_tokens(list_lemmatized_tokens, 15)
-            category.set_keywords(keywords_list)
+        keywords_list = generate_keywords_of_description(description, language, additional_stopwords, False)
+        category.set_keywords(keywords_list)
 
     except (FileNotFoundError, ValueError) as error:
         sys.exit(str(error))
 
 
-def generate_keyword_dict(json_file, language, additional_stopwords=None):
+def initialize_worker(language, additional_stopwords=None, lemma_cache_file=None):
     """
-    Reads a json file that contains all names of the categories and their descriptions. After that, for every category
-    the 15 most common keywords are calculated based on the description and stored in a dictionary that is saved as
-    a json file that can be used for setting the keywords of each category.
+    Initializes a worker process of the parallel keyword generation (see 'generate_keyword_dict'): the default
+    pipeline of the worker is created once and the lemmas of the previous run are loaded. Afterwards, the lemma cache
+    records the lemmas it adds, so that they are sent back with the keywords of every chunk.
 
-    :param json_file: json file that contains all category names and their descriptions.
     :param language: language of the descriptions.
     :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
     defined in the nltk package.
+    :param lemma_cache_file: json file in which the lemma cache is stored between runs (optional).
+    """
+
+    pipeline = get_pipeline(language, additional_stopwords)
+
+    if lemma_cache_file is not None:
+        pipeline.lemma_cache.load(lemma_cache_file)
+
+    pipeline.lemma_cache.track_new_lemmas()
+
+
+def generate_keywords_of_description(description, language, additional_stopwords=None, clean_description=True) -> dict:
+    """
+    Calculates the 15 most common keywords of the description of a category with the default pipeline.
+
+    :param description: description of the category.
+    :param language: language of the description.
+    :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
+    defined in the nltk package.
+    :param clean_description: True if the description is converted in ASCII and cleaned before the tokenization.
+    :return: dictionary containing the 15 most common keywords with their number of occurrences.
+    """
+
+    pipeline = get_pipeline(language, additional_stopwords)
+
+    if clean_description:
+        return top_tokens(pipeline.extract(description), 15)
+
+    return top_tokens(pipeline.extract_from_text(description), 15)
+
+
+def generate_keywords_of_chunk(descriptions, language, additional_stopwords=None, clean_descriptions=True) -> tuple:
+    """
+    Calculates the 15 most common keywords of a chunk of descriptions that is sent to a worker process at once (see
+    'generate_keywords_of_descriptions'). Together with the keywords, the lemmas that were added to the lemma cache of
+    the worker and its hits and misses for this chunk are returned, so that they can be merged into the lemma cache of
+    the main process.
+
+    :param descriptions: list of descriptions of the categories.
+    :param language: language of the descriptions.
+    :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
+    defined in the nltk package.
+    :param clean_descriptions: True if the descriptions are converted in ASCII and cleaned before the tokenization.
+    :return: tuple containing the list of dictionaries of keywords in the order of the descriptions, the list of new
+    lemmas as well as the number of hits and misses of the lemma cache.
+    """
+
+    lemma_cache = get_pipeline(language, additional_stopwords).lemma_cache
+    hits, misses = lemma_cache.hits, lemma_cache.misses
+
+    keywords = [generate_keywords_of_description(description, language, additional_stopwords, clean_descriptions)
+                for description in descriptions]
+
+    return keywords, lemma_cache.take_new_lemmas(), lemma_cache.hits - hits, lemma_cache.misses - misses
+
+
+def generate_keywords_of_descriptions(descriptions, language, additional_stopwords=None, clean_descriptions=True,
+                                      workers=1, chunk_size=8, lemma_cache_file=None):
+    """
+    Calculates the 15 most common keywords of several descriptions of categories (see
+    'generate_keywords_of_description'). The descriptions are consumed one after another (e.g. from
+    'CorpusReader.read_descriptions') and the keywords are returned as soon as they are generated, so that only a
+    limited number of descriptions is held in memory. With more than one worker, the descriptions are processed in
+    parallel by a pool of processes. Every process creates its pipeline once (see 'initialize_worker') and receives
+    the descriptions in chunks. At most two chunks per process are pending at a time. The lemmas and the counters of
+    the workers are merged into the lemma cache of the main process with every chunk (see
+    'generate_keywords_of_chunk').
+
+    :param descriptions: iterable of tuples containing the name of a category and its description.
+    :param language: language of the descriptions.
+    :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
+    defined in the nltk package.
+    :param clean_descriptions: True if the descriptions are converted in ASCII and cleaned before the tokenization.
+    :param workers: number of processes that generate the keywords (1 for a sequential generation).
+    :param chunk_size: number of descriptions that are sent to a process at once.
+    :param lemma_cache_file: json file containing the lemmas of a previous run that is loaded by every process
+    (optional).
+    :return: generator of tuples containing the name of a category and its dictionary of keywords in the order of the
+    descriptions.
+    """
+
+    descriptions = iter(descriptions)
+
+    if workers <= 1:
+        for name, description in descriptions:
+            yield name, generate_keywords_of_description(description, language, additional_stopwords,
+                                                         clean_descriptions)
+        return
+
+    pipeline = get_pipeline(language, additional_stopwords)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=initialize_worker,
+                             initargs=(language, additional_stopwords, lemma_cache_file)) as executor:
+        pending = deque()
+
+        while True:
+            while len(pending) < 2 * workers:
+                chunk = list(islice(descriptions, chunk_size))
+                if not chunk:
+                    break
+                names = [name for name, _ in chunk]
+                future = executor.submit(generate_keywords_of_chunk, [description for _, description in chunk],
+                                         language, additional_stopwords, clean_descriptions)
+                pending.append((names, future))
+
+            if not pending:
+                return
+
+            names, future = pending.popleft()
+            keywords, new_lemmas, hits, misses = future.result()
+            pipeline.lemma_cache.merge(new_lemmas, hits, misses)
+
+            yield from zip(names, keywords)
+
+
+def calculate_description_hash(description) -> str:
+    """
+    Calculates the fingerprint of the description of a category.
+
+    :param description: description of the category.
+    :return: hexadecimal SHA-256 hash of the description.
+    """
+
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def get_fingerprints_file(keywords_file) -> str:
+    """
+    Returns the path of the file in which the fingerprints of a keyword file are stored (e.g.
+    files/keywords_dictionaries_fingerprints.json for files/keywords_dictionaries.json).
+
+    :param keywords_file: json file containing the keywords for each category.
+    :return: path of the json file containing the fingerprints.
+    """
+
+    return os.path.splitext(keywords_file)[0] + "_fingerprints.json"
+
+
+def read_previous_keywords(keywords_file, configuration) -> tuple:
+    """
+    Reads the keywords of a previous run together with the fingerprints of the descriptions they were generated from.
+    The keywords can only be reused if they were generated with the same configuration of the pipeline (see
+    'KeywordPipeline.get_fingerprint'). Otherwise or if one of the files is missing or invalid, no keywords are
+    returned.
+
+    :param keywords_file: json file containing the keywords for each category.
+    :param configuration: fingerprint of the configuration of the current pipeline.
+    :return: tuple containing the dictionary of keywords and the dictionary of description hashes per category.
+    """
+
+    fingerprints_file = get_fingerprints_file(keywords_file)
+
+    if not os.path.isfile(keywords_file) or not os.path.isfile(fingerprints_file):
+        return dict(), dict()
+
+    try:
+        with open(fingerprints_file) as f:
+            fingerprints = json.load(f)
+        with open(keywords_file) as f:
+            keyword_dict = json.load(f)
+    except ValueError:
+        return dict(), dict()
+
+    if not isinstance(fingerprints, dict) or fingerprints.get("configuration") != configuration:
+        return dict(), dict()
+
+    return keyword_dict, fingerprints.get("descriptions", dict())
+
+
+def generate_keyword_dict(json_file, language, additional_stopwords=None, lemma_cache_file=None, workers=1,
+                          chunk_size=8, keywords_file='files/keywords_dictionaries.json', incremental=False):
+    """
+    Reads a json or JSON Lines file that contains all names of the categories and their descriptions. The descriptions
+    are read one after another (see 'CorpusReader.read_descriptions'), so that the file is not loaded into memory at
+    once. For every category the 15 most common keywords are calculated based on the description and stored in a
+    dictionary that is saved as a json file that can be used for setting the keywords of each category. If a file for
+    the lemma cache is given, the lemmas of the previous run are loaded before and all lemmas are stored afterwards.
+    With more than one worker, the descriptions are processed in parallel (see 'generate_keywords_of_descriptions').
+    The categories keep the order of the json file and the lemma cache file contains the lemmas of all workers.
+    Next to the keyword file, the hash of every description and the fingerprint of the configuration of the pipeline
+    are stored (see 'get_fingerprints_file'). In the incremental mode, only the keywords of the categories whose
+    description changed or that are new are calculated, the keywords of all other categories are taken from the
+    existing keyword file. If the configuration changed (e.g. other stopwords), all keywords are calculated again.
+
+    :param json_file: json or JSON Lines file that contains all category names and their descriptions.
+    :param language: language of the descriptions.
+    :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
+    defined in the nltk package.
+    :param lemma_cache_file: json file in which the lemma cache is stored between runs (optional).
+    :param workers: number of processes that generate the keywords (1 for a sequential generation).
+    :param chunk_size: number of descriptions that are sent to a process at once.
+    :param keywords_file: json file in which the keywords for each category are stored.
+    :param incremental: True if only the keywords of new or changed descriptions are calculated.
     """
 
     try:
         Validator.check_file_existence(json_file)
-        Validator.check_language(language)
 
-        with open(json_file) as f:
-            try:
-                description_dict = json.load(f)
-            except:
-                raise ValueError('No valid json format.')
+        pipeline = get_pipeline(language, additional_stopwords)
+        configuration = pipeline.get_fingerprint()
 
-            keyword_dict = dict()
+        if lemma_cache_file is not None:
+            pipeline.lemma_cache.load(lemma_cache_file)
 
-            data_dict = description_dict.items()
-            for key, value in data_dict:
+        previous_keywords, previous_hashes = dict(), dict()
+        if incremental:
+            previous_keywords, previous_hashes = read_previous_keywords(keywords_file, configuration)
+
+        description_hashes = dict()
+
+        def changed_descriptions():
+            for key, description in CorpusReader.read_descriptions(json_file):
                 if key != 'Category':
-                    key_new = key
-                    if additional_stopwords == "":
-                        keywords_list = generate_keyword_list_from_string(value, language)
-                    else:
-                        keywords_list = generate_keyword_list_from_string(value, language, additional_stopwords)
-                    keywords_dict = top_tokens(keywords_list, 15)
-                    value_new = keywords_dict
-                    keyword_dict.__setitem__(key_new, value_new)
-
-            with open('files/keywords_dictionaries.json', 'w') as path:
-                json.dump(keyword_dict, path)
+                    description_hash = calculate_description_hash(description)
+                    description_hashes[key] = description_hash
+                    if key not in previous_keywords or previous_hashes.get(key) != description_hash:
+                        yield key, description
+
+        calculated_keywords = dict(generate_keywords_of_descriptions(changed_descriptions(), language,
+                                                                     additional_stopwords, True, workers, chunk_size,
+                                                                     lemma_cache_file))
+        keyword_dict = {key: calculated_keywords[key] if key in calculated_keywords else previous_keywords[key]
+                        for key in description_hashes}
+
+        with open(keywords_file, 'w') as path:
+            json.dump(keyword_dict, path)
+
+        with open(get_fingerprints_file(keywords_file), 'w') as path:
+            json.dump({"configuration": configuration, "descriptions": description_hashes}, path)
+
+        if lemma_cache_file is not None:
+            pipeline.lemma_cache.save(lemma_cache_file)
 
     except (FileNotFoundError, ValueError) as error:
         sys.exit(str(error))
@@ -394,7 +548,8 @@ def generate_keyword_dict(json_file, language, additional_stopwords=None):
 def initialize_keywords_from_keywords_dict(category_list, json_file):
     """
     Reads a json file containing all keywords with their occurrences for each category and sets those keywords to
-    their respective category.
+    their respective category. Afterwards, the keywords of all categories are compiled into the sparse keyword matrix
+    that is used for the matching.
 
     :param category_list: list of type Category that contains all categories.
     :param json_file: json file containing the keywords for each category.
@@ -415,6 +570,8 @@ def initialize_keywords_from_keywords_dict(category_list, json_file):
                 keywords = keywords_dict[category.name]
                 category.set_keywords(keywords)
 
+        KeywordMatrix.for_categories(category_list)
+
     except (ValueError, FileNotFoundError) as error:
         sys.exit(str(error))
 
@@ -442,15 +599,47 @@ def generate_keyword_dict_from_user_description(description_file, language, addi
         sys.exit(str(error))
 
 
-def initialize_keywords_from_json_all_categories(category_list, json_file, language, additional_stopwords=None):
+def generate_keyword_dict_from_description(description, language, additional_stopwords=None) -> dict:
     """
-    Initializes the keywords for all categories in the category tree.
+    Generates a keyword dictionary from the given description (e.g. of an application that was scraped, see
+    'CategoryScraper.get_application_description') consisting of the token and the frequency. The description is
+    processed in the same way as a description in a file (see 'generate_keyword_dict_from_user_description').
+
+    :param description: description to be processed.
+    :param language: language of the description.
+    :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
+    defined in the nltk package.
+    :return: dictionary of tokenized and lemmatized keywords of the description.
+    """
+
+    try:
+        Validator.check_language(language)
+
+        keyword_list = generate_keyword_list_from_string(description, language, additional_stopwords)
+        return top_tokens(keyword_list, len(keyword_list))
+
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def initialize_keywords_from_json_all_categories(category_list, json_file, language, additional_stopwords=None,
+                                                 lemma_cache_file=None, workers=1, chunk_size=8):
+    """
+    Initializes the keywords for all categories in the category tree. The json or JSON Lines file is read only once
+    and description by description (see 'CorpusReader.read_descriptions'). The keywords of all categories of the tree
+    are generated from it (see 'initialize_keywords_from_json'), optionally in parallel processes (see
+    'generate_keywords_of_descriptions'), while descriptions of categories that are not part of the tree are skipped.
+    Afterwards, the keywords are compiled into the sparse keyword matrix that is used for the matching. If a file for
+    the lemma cache is given, the lemmas of the previous run are loaded before and all lemmas are stored afterwards.
 
     :param category_list: list of type Category that contains all categories.
     :param json_file: file that contains all descriptions of the category.
     :param language: language of the description.
     :param additional_stopwords: string containing additional stopwords that can be set in addition to the stopwords
     defined in the nltk package.
+    :param lemma_cache_file: json file in which the lemma cache is stored between runs (optional).
+    :param workers: number of processes that generate the keywords (1 for a sequential generation).
+    :param chunk_size: number of descriptions that are sent to a process at once.
     """
 
     try:
@@ -458,9 +647,34 @@ def initialize_keywords_from_json_all_categories(category_list, json_file, langu
         Validator.check_file_existence(json_file)
         Validator.check_language(language)
 
+        pipeline = get_pipeline(language, additional_stopwords)
+
+        if lemma_cache_file is not None:
+            pipeline.lemma_cache.load(lemma_cache_file)
+
+        categories = dict()
         for category in category_list:
             if category.name != 'Category':
-                initialize_keywords_from_json(category, json_file, language, additional_stopwords)
+                categories.setdefault(category.name, []).append(category)
+
+        descriptions = ((name, description) for name, description in CorpusReader.read_descriptions(json_file)
+                        if name in categories)
+        initialized = set()
+
+        for name, keywords_dict in generate_keywords_of_descriptions(descriptions, language, additional_stopwords,
+                                                                     False, workers, chunk_size, lemma_cache_file):
+            for category in categories[name]:
+                category.set_keywords(keywords_dict)
+            initialized.add(name)
+
+        for name in categories:
+            if name not in initialized:
+                raise ValueError('Error: The description of the category ' + name + ' is missing.')
+
+        KeywordMatrix.for_categories(category_list)
+
+        if lemma_cache_file is not None:
+            pipeline.lemma_cache.save(lemma_cache_file)
 
     except (ValueError, FileNotFoundError) as error:
         sys.exit(str(error))
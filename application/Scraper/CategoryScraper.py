@@ -1,82 +1,233 @@
 import sys
+import os
 import play_scraper
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from application.Matching import NLPHelper
+from application.Matching.KeywordPipeline import KeywordPipeline
+from application.Scraper.RateLimiter import TokenBucket
+from application.Scraper.Retry import RetryError, RetryPolicy, FailureReport
+from application.Scraper.Checkpoint import Checkpoint
 from application.Validator import Validator
 
 
-def get_application_description(application_name):
+def find_app_id(application_name, scraper=play_scraper, cache=None) -> str:
     """
-    Fetches the description text for the given application by using the Google Play Scraper. The results are stored
-    to "./files/category_description.txt"
+    Searches the app id of the given application in the Play Store. If a cache is given, the app id is looked up in
+    the cache first and stored in it after the search.
 
     :param application_name: name of the application that is searched.
+    :param scraper: module or object that provides the function 'search' of the play_scraper package.
+    :param cache: cache of app ids and descriptions (see DescriptionCache, optional).
+    :return: app id of the application.
+    """
+
+    app_id = cache.get_app_id(application_name) if cache is not None else None
+
+    if app_id is not None:
+        return app_id
+
+    if cache is not None and cache.offline:
+        raise ValueError(f"Error: The app '{application_name}' is not cached (offline mode).")
+
+    for element in scraper.search(application_name):
+        if element['title'] == application_name:
+            app_id = element['app_id']
+            break
+
+    if not app_id:
+        raise ValueError('Error: The app was not found. Please check whether you entered the full and correct name '
+                         'of the application.')
+
+    if cache is not None:
+        cache.set_app_id(application_name, app_id)
+
+    return app_id
+
+
+def fetch_application_description(application_name, scraper=play_scraper, cache=None) -> str:
+    """
+    Fetches the description of the given application from the Play Store (not cleaned). If a cache is given, the
+    description is looked up in the cache first and stored in it after the request.
+
+    :param application_name: name of the application that is searched.
+    :param scraper: module or object that provides the functions 'search' and 'details' of the play_scraper package.
+    :param cache: cache of app ids and descriptions (see DescriptionCache, optional).
     :return: description of the given application from the Play Store.
     """
 
-    try:
-        Validator.check_empty_string(application_name)
+    app_id = find_app_id(application_name, scraper, cache)
+    description = cache.get_description(app_id) if cache is not None else None
+
+    if description is not None:
+        return description
 
-        matches = play_scraper.search(application_name)
-        app_id = ''
+    if cache is not None and cache.offline:
+        raise ValueError(f"Error: The description of the app '{application_name}' is not cached (offline mode).")
 
-        for element in matches:
-            if element['title'] == application_name:
-                app_id = element['app_id']
-                break
+    description = scraper.details(app_id)['description']
 
-        if app_id == '':
-            raise ValueError('Error: The app was not found. Please check whether you entered the full and correct name '
-                             'of the application.')
+    if cache is not None:
+        cache.set_description(app_id, description)
 
-        application = play_scraper.details(app_id)
-        description = application['description']
+    return description
 
-        description = NLPHelper.clean_file(description)
 
-        with open("./files/category_description.txt", "w", encoding="utf-8") as file:
-            file.write(description)
+def scrape_application_description(application_name, scraper=play_scraper, cache=None) -> str:
+    """
+    Fetches the description text for the given application (see 'fetch_application_description') and cleans it (see
+    'KeywordPipeline.clean'). In contrast to 'get_application_description', errors are raised instead of stopping the
+    program (e.g. a ValueError if the app is not found), so that this function can be called by a retry policy (see
+    RetryPolicy) that skips the application.
+
+    :param application_name: name of the application that is searched.
+    :param scraper: module or object that provides the functions 'search' and 'details' of the play_scraper package.
+    :param cache: cache of app ids and descriptions (see DescriptionCache, optional).
+    :return: cleaned description of the given application from the Play Store.
+    """
+
+    Validator.check_empty_string(application_name)
+
+    return KeywordPipeline.clean(fetch_application_description(application_name, scraper, cache))
+
+
+def get_application_description(application_name, scraper=play_scraper, cache=None, description_file=None) -> str:
+    """
+    Fetches the description text for the given application by using the Google Play Scraper and cleans it (see
+    'scrape_application_description'). The description is returned and, if a file is given, additionally stored in
+    this file (e.g. "./files/category_description.txt"). If the description cannot be fetched, the program is stopped
+    with an error message.
+
+    :param application_name: name of the application that is searched.
+    :param scraper: module or object that provides the functions 'search' and 'details' of the play_scraper package
+    (e.g. a local stub for offline runs).
+    :param cache: cache of app ids and descriptions, so that every application is only scraped once (see
+    DescriptionCache, optional).
+    :param description_file: text file in which the description is stored (optional).
+    :return: cleaned description of the given application from the Play Store.
+    """
+
+    try:
+        description = scrape_application_description(application_name, scraper, cache)
+
+        if description_file is not None:
+            with open(description_file, "w", encoding="utf-8") as file:
+                file.write(description)
+
+        return description
 
     except ValueError as error:
         sys.exit(str(error))
 
 
-def store_all_descriptions(category_list) -> dict:
+def scrape_category_description(category_name, scraper=play_scraper) -> str:
+    """
+    Scrapes the descriptions of all applications that are found in the Play Store for the name of a category and
+    joins them (cleaned, see 'clean_description_file') to the description of the category. Applications without a
+    description are skipped.
+
+    :param category_name: name of the category that is searched.
+    :param scraper: module or object that provides the function 'search' of the play_scraper package.
+    :return: description of the category.
+    """
+
+    description = ""
+
+    for item in scraper.search(category_name, detailed=True):
+        for key, value in item.items():
+            if key == "description" and value:
+                description = description + clean_description_file(value)
+
+    return description
+
+
+def store_all_descriptions(category_list, workers=1, requests_per_second=None, scraper=play_scraper,
+                           dict_file="./files/dict.json", retry_policy=None, failure_report=None,
+                           checkpoint_file=None, resume=True, compaction_interval=100) -> dict:
     """
     Scrapes all descriptions for every category in the given category list and stores the result in a dictionary.
+    After every category, its description is appended to a checkpoint (see Checkpoint), which is compacted regularly.
+    If the scraping is resumed, the categories that are already contained in the checkpoint (e.g. of a run that was
+    interrupted) are not scraped again, and the checkpoint is compacted before, so that an incomplete last line is
+    removed. At the end, the dictionary is written to the json file once. If all categories were scraped, the
+    checkpoint is removed afterwards, so that the next run scrapes all categories again. Otherwise, the checkpoint is
+    kept and the next run only scrapes the missing categories. With more than one worker, several categories are
+    scraped at once by a pool of threads. In both cases, the dictionary keeps the order of the category list, so that
+    the json file has the same content. Every category name is only scraped once.
+    Failed requests are retried according to the retry policy. Categories that still fail are skipped and added to the
+    failure report, which is printed at the end.
 
     :param category_list: list of type Category that contains all categories.
-    :return: dictionary containing all names and the descriptions for each category.
+    :param workers: number of categories that are scraped at once (1 for a sequential scraping).
+    :param requests_per_second: maximum number of requests per second to the Play Store (no limit if None).
+    :param scraper: module or object that provides the function 'search' of the play_scraper package (e.g. a local
+    stub for offline runs).
+    :param dict_file: json file where the dictionary is written to.
+    :param retry_policy: policy for retrying failed requests (default policy, see RetryPolicy, if None).
+    :param failure_report: report to which the skipped categories are added (a new report if None).
+    :param checkpoint_file: JSON Lines file of the checkpoint (the json file with the extension .jsonl if None).
+    :param resume: True if the categories of the checkpoint are kept, False if the checkpoint is cleared before.
+    :param compaction_interval: number of appended categories after which the checkpoint is compacted.
+    :return: dictionary containing all names and the descriptions for each category that was scraped successfully.
     """
 
     try:
         Validator.check_empty_list(category_list)
 
-        category_dict = dict()
-        for category in category_list:
-            if category.name == 'Category':
-                pass
-            else:
-                success = False
-                while success is False:
-                    try:
-                        dict_key = category.name
-                        dict_value = ""
-                        dict_value_tmp = play_scraper.search(category.name, detailed=True)
-                        for item in dict_value_tmp:
-                            for key, value in item.items():
-                                if key == "description":
-                                    value = clean_description_file(value)
-                                    dict_value = dict_value + value
-                        category_dict[dict_key] = dict_value
-                        write_dict_to_file(category_dict, "./files/dict.json")
-
-                        success = True
-                        print(category.name + ": successful")
-                    except:
-                        pass
+        names = list(dict.fromkeys(category.name for category in category_list if category.name != 'Category'))
+        rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        failure_report = failure_report if failure_report is not None else FailureReport()
+        checkpoint = Checkpoint(checkpoint_file or os.path.splitext(dict_file)[0] + ".jsonl")
+
+        if resume:
+            descriptions = checkpoint.compact(names)
+        else:
+            checkpoint.clear()
+            descriptions = dict()
+
+        remaining_names = [name for name in names if name not in descriptions]
+        if len(remaining_names) < len(names):
+            print(f"{len(names) - len(remaining_names)} categories are already scraped and skipped.")
+
+        def scrape(name):
+            return retry_policy.call(scrape_category_description, name, scraper, description=name,
+                                     rate_limiter=rate_limiter)
+
+        def store(name, scraping):
+            try:
+                descriptions[name] = scraping()
+            except RetryError as error:
+                failure_report.add(error)
+                print(name + ": failed")
+                return
+            checkpoint.append(name, descriptions[name])
+            if checkpoint.appended_entries >= compaction_interval:
+                checkpoint.compact(names)
+            print(name + ": successful")
+
+        if workers <= 1:
+            for name in remaining_names:
+                store(name, lambda: scrape(name))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(scrape, name): name for name in remaining_names}
+                for future in as_completed(futures):
+                    store(futures[future], future.result)
+
+        checkpoint.compact(names)
+        category_dict = {name: descriptions[name] for name in names if name in descriptions}
+        write_dict_to_file(category_dict, dict_file)
+
+        if len(category_dict) == len(names):
+            checkpoint.clear()
+        else:
+            print(f"{len(names) - len(category_dict)} categories are missing. They are scraped with the next run, "
+                  f"the other categories are kept in {checkpoint.checkpoint_file}.")
+
+        if len(failure_report) > 0:
+            print(failure_report.get_summary())
 
         return category_dict
 
@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+
+
+class Checkpoint:
+    """
+    This class represents an append-only checkpoint of scraped descriptions in a JSON Lines file (one object
+    {"category": ..., "description": ...} per line, see 'CorpusReader.read_json_lines'). Every scraped category is
+    appended as one line immediately, so that a scraping run that is interrupted can be resumed without losing the
+    categories that were already scraped. If a category is contained several times, the last entry is valid. The
+    compaction rewrites the file with one entry per category (atomically by replacing the file), which also removes a
+    last line that was only written partly when the run was interrupted.
+    """
+
+    def __init__(self, checkpoint_file):
+        """
+        Initializes the checkpoint for the given file. The file is created with the first entry.
+
+        :param checkpoint_file: JSON Lines file in which the descriptions are stored.
+        """
+
+        self.checkpoint_file = checkpoint_file
+        self.appended_entries = 0
+        self.lock = threading.Lock()
+
+    def load(self) -> dict:
+        """
+        Reads all descriptions of the checkpoint. An incomplete last line (e.g. after a crash) is ignored.
+
+        :return: dictionary containing the names of the categories and their descriptions in the order of the file.
+        """
+
+        descriptions = dict()
+
+        if not os.path.isfile(self.checkpoint_file):
+            return descriptions
+
+        with open(self.checkpoint_file, "r", encoding="utf-8") as file:
+            lines = file.readlines()
+
+        for number, line in enumerate(lines):
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                    descriptions[entry["category"]] = entry["description"]
+                except (ValueError, KeyError, TypeError):
+                    if number < len(lines) - 1:
+                        raise ValueError('No valid json format.')
+
+        return descriptions
+
+    def append(self, category_name, description):
+        """
+        Appends the description of a category to the checkpoint. The line is flushed immediately.
+
+        :param category_name: name of the category.
+        :param description: description of the category.
+        """
+
+        line = json.dumps({"category": category_name, "description": description}) + "\n"
+
+        with self.lock:
+            with open(self.checkpoint_file, "a", encoding="utf-8") as file:
+                file.write(line)
+                file.flush()
+            self.appended_entries = self.appended_entries + 1
+
+    def compact(self, order=None) -> dict:
+        """
+        Rewrites the checkpoint with one entry per category. The new file is written next to the checkpoint first and
+        replaces it afterwards, so that the checkpoint is never lost.
+
+        :param order: list of category names that defines the order of the entries (categories that are not contained
+        follow in the order of the file).
+        :return: dictionary containing the names of the categories and their descriptions in the new order.
+        """
+
+        with self.lock:
+            descriptions = self.load()
+
+            if order is not None:
+                ordered = {name: descriptions[name] for name in order if name in descriptions}
+                ordered.update(descriptions)
+                descriptions = ordered
+
+            temporary_file = self.checkpoint_file + ".tmp"
+
+            with open(temporary_file, "w", encoding="utf-8") as file:
+                for category_name, description in descriptions.items():
+                    file.write(json.dumps({"category": category_name, "description": description}) + "\n")
+
+            os.replace(temporary_file, self.checkpoint_file)
+            self.appended_entries = 0
+
+        return descriptions
+
+    def clear(self):
+        """
+        Removes all entries of the checkpoint, e.g. to start a new scraping run from scratch.
+        """
+
+        with self.lock:
+            if os.path.isfile(self.checkpoint_file):
+                os.remove(self.checkpoint_file)
+            self.appended_entries = 0
@@ -0,0 +1,134 @@
+import sqlite3
+import threading
+import time
+
+TIME_TO_LIVE = 30 * 24 * 60 * 60
+
+
+class DescriptionCache:
+    """
+    This class represents a persistent cache of application descriptions of the Play Store in a SQLite database, so that
+    the same application is only scraped once (see 'CategoryScraper.get_application_description'). Two lookups are
+    cached: the app id that is found for the name of an application and the description of an app id. The
+    descriptions are stored as they are scraped (not cleaned). Entries that are older than the time to live are
+    scraped again. In the offline mode, no requests are sent at all: every entry is used regardless of its age and an
+    application that is not cached results in an error, so that a batch evaluation can be reproduced without network.
+    One cache can be used by several threads. The cache can be used as a context manager that closes the database at
+    the end.
+    """
+
+    def __init__(self, database_file="./files/descriptions.sqlite", time_to_live=TIME_TO_LIVE, offline=False):
+        """
+        Opens the cache in the given database file (the file and the tables are created if they do not exist).
+
+        :param database_file: SQLite database in which the cache is stored (':memory:' for a temporary cache).
+        :param time_to_live: time in seconds after which an entry is scraped again (None for no expiry).
+        :param offline: True if only cached entries are used and no requests are sent.
+        """
+
+        self.time_to_live = time_to_live
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(database_file, check_same_thread=False)
+
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS app_ids "
+                                    "(name TEXT PRIMARY KEY, app_id TEXT NOT NULL, updated REAL NOT NULL)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS descriptions "
+                                    "(app_id TEXT PRIMARY KEY, description TEXT NOT NULL, updated REAL NOT NULL)")
+
+    def is_valid(self, updated) -> bool:
+        """
+        Checks whether an entry that was stored at the given time can still be used.
+
+        :param updated: time (seconds since the epoch) at which the entry was stored.
+        :return: True if the entry is not expired or the cache is offline.
+        """
+
+        return self.offline or self.time_to_live is None or time.time() - updated <= self.time_to_live
+
+    def get(self, table, key_column, value_column, key):
+        """
+        Looks up a valid entry of one of the tables.
+
+        :param table: name of the table ('app_ids' or 'descriptions').
+        :param key_column: name of the column of the key.
+        :param value_column: name of the column of the value.
+        :param key: key that is looked up.
+        :return: cached value or None if the key is not cached or expired.
+        """
+
+        with self.lock:
+            row = self.connection.execute(f"SELECT {value_column}, updated FROM {table} WHERE {key_column} = ?",
+                                          (key,)).fetchone()
+
+        if row is None or not self.is_valid(row[1]):
+            return None
+
+        return row[0]
+
+    def set(self, table, key, value):
+        """
+        Stores an entry in one of the tables (an existing entry is replaced).
+
+        :param table: name of the table ('app_ids' or 'descriptions').
+        :param key: key of the entry.
+        :param value: value of the entry.
+        """
+
+        with self.lock, self.connection:
+            self.connection.execute(f"INSERT OR REPLACE INTO {table} VALUES (?, ?, ?)", (key, value, time.time()))
+
+    def get_app_id(self, application_name):
+        """
+        Returns the cached app id of an application.
+
+        :param application_name: name of the application.
+        :return: app id or None if it is not cached.
+        """
+
+        return self.get("app_ids", "name", "app_id", application_name)
+
+    def set_app_id(self, application_name, app_id):
+        """
+        Stores the app id of an application.
+
+        :param application_name: name of the application.
+        :param app_id: app id that was found for the name.
+        """
+
+        self.set("app_ids", application_name, app_id)
+
+    def get_description(self, app_id):
+        """
+        Returns the cached description of an application.
+
+        :param app_id: app id of the application.
+        :return: description as it was scraped or None if it is not cached.
+        """
+
+        return self.get("descriptions", "app_id", "description", app_id)
+
+    def set_description(self, app_id, description):
+        """
+        Stores the description of an application.
+
+        :param app_id: app id of the application.
+        :param description: description as it was scraped.
+        """
+
+        self.set("descriptions", app_id, description)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the database.
+        """
+
+        with self.lock:
+            self.connection.close()
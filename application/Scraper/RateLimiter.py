@@ -0,0 +1,47 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    This class represents a token bucket that limits the number of requests per second, e.g. to the Play Store. The
+    bucket is refilled continuously with the given rate up to its capacity and every request takes one token. If no
+    token is left, the request waits until the next token is available. The tokens are reserved under a lock, so that
+    one bucket can be shared by several threads (see 'CategoryScraper.store_all_descriptions'), but the waiting itself
+    takes place outside of the lock.
+    """
+
+    def __init__(self, rate, capacity=1):
+        """
+        Initializes a full bucket.
+
+        :param rate: number of tokens that are added per second.
+        :param capacity: maximum number of tokens, i.e. number of requests that may be sent at once.
+        """
+
+        if rate <= 0 or capacity < 1:
+            raise ValueError('Error: The rate has to be positive and the capacity at least 1.')
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes one token from the bucket and waits until it is available.
+
+        :return: time in seconds that was waited for the token.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate) - 1
+            self.updated = now
+            waiting_time = -self.tokens / self.rate if self.tokens < 0 else 0
+
+        if waiting_time > 0:
+            time.sleep(waiting_time)
+
+        return waiting_time
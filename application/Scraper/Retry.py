@@ -0,0 +1,164 @@
+import json
+import random
+import threading
+import time
+
+
+class RetryError(Exception):
+    """
+    This exception is raised if a call failed permanently, i.e. the error is not worth a retry or the maximum number of
+    attempts is reached (see 'RetryPolicy.call'). The last error is kept as its cause.
+    """
+
+    def __init__(self, description, attempts, error):
+        """
+        Initializes the exception for a failed call.
+
+        :param description: description of the call (e.g. the name of the category or application that was scraped).
+        :param attempts: number of attempts that were made.
+        :param error: last error that occurred.
+        """
+
+        super().__init__(f"Error: '{description}' failed after {attempts} attempt(s): {type(error).__name__}: {error}")
+        self.description = description
+        self.attempts = attempts
+        self.error = error
+
+
+class FailureReport:
+    """
+    This class collects the calls that failed permanently (see 'RetryError'), so that a batch run can skip them and
+    report at the end what was skipped instead of stopping or hanging. One report can be shared by several threads.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty report.
+        """
+
+        self.failures = []
+        self.lock = threading.Lock()
+
+    def add(self, retry_error):
+        """
+        Adds a failed call to the report.
+
+        :param retry_error: exception of the failed call.
+        """
+
+        with self.lock:
+            self.failures.append({"description": retry_error.description, "attempts": retry_error.attempts,
+                                  "error": f"{type(retry_error.error).__name__}: {retry_error.error}"})
+
+    def __len__(self):
+        return len(self.failures)
+
+    def get_descriptions(self) -> list:
+        """
+        Returns the descriptions of all failed calls, e.g. the names of the skipped categories.
+
+        :return: list of the descriptions in the order in which the calls failed.
+        """
+
+        return [failure["description"] for failure in self.failures]
+
+    def get_summary(self) -> str:
+        """
+        Creates a summary of the report that can be printed.
+
+        :return: string containing one line per failed call.
+        """
+
+        if not self.failures:
+            return "No failures."
+
+        lines = [f"{len(self.failures)} failure(s), skipped:"]
+        lines.extend(f"  {failure['description']} ({failure['attempts']} attempt(s)): {failure['error']}"
+                     for failure in self.failures)
+
+        return "\n".join(lines)
+
+    def write(self, report_file):
+        """
+        Writes the report to a json file.
+
+        :param report_file: json file where the report is written to.
+        """
+
+        with open(report_file, "w") as file:
+            json.dump(self.failures, file, indent=2)
+
+
+class RetryPolicy:
+    """
+    This class represents the policy for retrying calls that may fail temporarily, e.g. requests to the Play Store.
+    A call is attempted at most 'maximum_attempts' times. Between two attempts, the policy waits for a random time
+    between 0 and the backoff (full jitter), which starts with 'initial_backoff' and doubles after every attempt up to
+    'maximum_backoff', so that several threads do not retry at the same moment. Errors are classified into temporary
+    errors that are retried ('retry_on') and permanent errors that are not worth a retry ('give_up_on', e.g. an
+    application that does not exist). Errors that are not an Exception (e.g. SystemExit or KeyboardInterrupt) are never
+    caught.
+    """
+
+    def __init__(self, maximum_attempts=5, initial_backoff=1.0, maximum_backoff=60.0, retry_on=(Exception,),
+                 give_up_on=(ValueError,)):
+        """
+        Initializes the policy.
+
+        :param maximum_attempts: maximum number of attempts of a call (at least 1).
+        :param initial_backoff: maximum time in seconds that is waited after the first failed attempt.
+        :param maximum_backoff: maximum time in seconds that is waited between two attempts.
+        :param retry_on: tuple of the types of errors that are retried.
+        :param give_up_on: tuple of the types of errors that are not retried (even if they are in 'retry_on').
+        """
+
+        if maximum_attempts < 1:
+            raise ValueError('Error: At least one attempt is needed.')
+
+        self.maximum_attempts = maximum_attempts
+        self.initial_backoff = initial_backoff
+        self.maximum_backoff = maximum_backoff
+        self.retry_on = retry_on
+        self.give_up_on = give_up_on
+
+    def is_retryable(self, error) -> bool:
+        """
+        Checks whether a call should be attempted again after the given error.
+
+        :param error: error that occurred.
+        :return: True if the error is temporary.
+        """
+
+        return isinstance(error, self.retry_on) and not isinstance(error, self.give_up_on)
+
+    def get_backoff(self, attempt) -> float:
+        """
+        Calculates the time that is waited after the given failed attempt.
+
+        :param attempt: number of the failed attempt (starting with 1).
+        :return: time in seconds.
+        """
+
+        return random.uniform(0, min(self.maximum_backoff, self.initial_backoff * 2 ** (attempt - 1)))
+
+    def call(self, function, *args, description=None, rate_limiter=None, **kwargs):
+        """
+        Calls the given function with the given arguments until it succeeds, a permanent error occurs or the maximum
+        number of attempts is reached. Every attempt takes one token of the rate limiter before the call.
+
+        :param function: function to be called.
+        :param description: description of the call for the error message (name of the function if None).
+        :param rate_limiter: token bucket that limits the number of calls per second (optional).
+        :return: result of the function.
+        """
+
+        for attempt in range(1, self.maximum_attempts + 1):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                return function(*args, **kwargs)
+            except Exception as error:
+                if not self.is_retryable(error) or attempt == self.maximum_attempts:
+                    raise RetryError(description or getattr(function, "__name__", repr(function)), attempt,
+                                     error) from error
+                time.sleep(self.get_backoff(attempt))
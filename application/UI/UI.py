@@ -1,8 +1,11 @@
 import csv
+import os
 import sys
 import nltk
 
 from application.Scraper import CategoryScraper
+from application.Scraper.Retry import RetryError, RetryPolicy, FailureReport
+from application.Scraper.DescriptionCache import DescriptionCache, TIME_TO_LIVE
 from application.Matching import NLPHelper, Calculator
 from application.Validator import Validator
 from application.Category.CategoryTree import CategoryTree
@@ -25,6 +28,8 @@ class UserInterface:
             stopwords_input = input()
             Validator.check_file_existence(stopwords_input)
 
+            category_list = CategoryTree.set_up_tree(path_input)
+
             cls.__print_question_main()
             user_input = input()
 
@@ -35,22 +40,22 @@ class UserInterface:
                     exit_function = True
 
                 elif user_input == "1":
-                    cls.sub_case1(path_input, language_input, stopwords_input)
+                    cls.sub_case1(category_list, language_input, stopwords_input)
                     cls.__print_question_main()
                     user_input = input()
 
                 elif user_input == "2":
-                    cls.sub_case2(path_input, language_input, stopwords_input)
+                    cls.sub_case2(category_list, language_input, stopwords_input)
                     cls.__print_question_main()
                     user_input = input()
 
                 elif user_input == "3":
-                    cls.test_single_description(path_input, language_input, stopwords_input)
+                    cls.test_single_description(category_list, language_input, stopwords_input)
                     cls.__print_question_main()
                     user_input = input()
 
                 elif user_input == "4":
-                    cls.test_all(path_input, language_input, stopwords_input)
+                    cls.test_all(category_list, language_input, stopwords_input)
                     cls.__print_question_main()
                     user_input = input()
 
@@ -71,10 +76,9 @@ class UserInterface:
               "4: Measure possible exaptations for a list of applications and applications.")
 
     @classmethod
-    def sub_case1(cls, path_input, language_input, stopwords_input):
+    def sub_case1(cls, category_list, language_input, stopwords_input):
 
         try:
-            category_list = CategoryTree.set_up_tree(path_input)
             cls.__print_question_sub_case1()
             user_input = input()
 
@@ -109,11 +113,22 @@ class UserInterface:
 
     @classmethod
     def sub_case1_1(cls, category_list, language_input, user_description, additional_stopwords=None):
-        description_dict = CategoryScraper.store_all_descriptions(category_list)
+        failure_report = FailureReport()
+        description_dict = CategoryScraper.store_all_descriptions(category_list, workers=4, requests_per_second=2,
+                                                                  resume=True, failure_report=failure_report)
+
+        if len(failure_report) > 0:
+            print("The descriptions of " + str(len(failure_report)) + " categories could not be scraped, so that "
+                  "their keywords cannot be generated. Please try again later.")
+            return
+
         NLPHelper.initialize_keywords_from_json_all_categories(category_list, "files/dict.json", language_input,
-                                                               additional_stopwords)
+                                                               additional_stopwords,
+                                                               lemma_cache_file="files/lemma_cache.json",
+                                                               workers=os.cpu_count() or 1)
         keyword_dict_user = NLPHelper.generate_keyword_dict_from_user_description(user_description, language_input,
                                                                                   additional_stopwords)
+        match_result = Calculator.match(category_list, keyword_dict_user)
 
         print("Please indicate the name of the application you want to measure the distance")
         application_name = input()
@@ -133,15 +148,15 @@ class UserInterface:
                 cls.__print_question_sub_case1_1()
                 user_input = input()
             if user_input == "2":
-                cls.sub_case1_1_1_2(category_list, keyword_dict_user)
+                cls.sub_case1_1_1_2(category_list, match_result)
                 cls.__print_question_sub_case1_1()
                 user_input = input()
             if user_input == "3":
-                cls.sub_case1_1_1_3(category_list, keyword_dict_user)
+                cls.sub_case1_1_1_3(category_list, match_result)
                 cls.__print_question_sub_case1_1()
                 user_input = input()
             if user_input == "4":
-                cls.sub_case1_1_1_4(category_list, keyword_dict_user, category_comparison)
+                cls.sub_case1_1_1_4(category_list, match_result, category_comparison)
                 cls.__print_question_sub_case1_1()
                 user_input = input()
 
@@ -160,8 +175,8 @@ class UserInterface:
         print(keyword_dict_user)
 
     @classmethod
-    def sub_case1_1_1_2(cls, category_list, keyword_dict_user):
-        best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
+    def sub_case1_1_1_2(cls, category_list, match_result):
+        best_match = Calculator.calculate_best_matching_category(category_list, match_result)
 
         if best_match == -1:
             print("No match found!")
@@ -169,18 +184,25 @@ class UserInterface:
             print(best_match)
 
     @classmethod
-    def sub_case1_1_1_3(cls, category_list, keyword_dict_user):
-        top10 = Calculator.get_top10_best_matches(category_list, keyword_dict_user)
+    def sub_case1_1_1_3(cls, category_list, match_result):
+        top10 = Calculator.get_top10_best_matches(category_list, match_result)
         print(top10)
 
     @classmethod
-    def sub_case1_1_1_4(cls, category_list, keyword_dict_user, category_comparison):
-        best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
+    def sub_case1_1_1_4(cls, category_list, match_result, category_comparison):
+        best_match = Calculator.calculate_best_matching_category(category_list, match_result)
 
         if best_match == -1:
             print("Cannot calculate the distance since no matching category was found.")
         else:
-            distance = Calculator.calculate_distance(best_match.structure_id, category_comparison.structure_id)
+            category_application_name = ""
+
+            for key in category_comparison:
+                category_application_name = key
+
+            category_application = CategoryTree.find_category_by_name(category_list, category_application_name)
+            distance = Calculator.calculate_distance_between_categories(category_list, best_match,
+                                                                        category_application)
             print(distance)
 
     @classmethod
@@ -195,7 +217,9 @@ class UserInterface:
             keyword_dict_user = NLPHelper.generate_keyword_dict_from_user_description(user_description,
                                                                                       language_input,
                                                                                       additional_stopwords)
-            NLPHelper.initialize_keywords_from_keywords_dict(category_list, json_file)
+            category_list = CategoryTree.set_up_tree_with_keywords(category_list.csv_data, json_file,
+                                                                   "files/category_tree.npz")
+            match_result = Calculator.match(category_list, keyword_dict_user)
 
             print("Please indicate the name of the application you want to measure the distance")
             application_name = input()
@@ -215,15 +239,15 @@ class UserInterface:
                     cls.__print_question_sub_case1_2()
                     user_input = input()
                 if user_input == "2":
-                    cls.sub_case1_1_2_2(category_list, keyword_dict_user)
+                    cls.sub_case1_1_2_2(category_list, match_result)
                     cls.__print_question_sub_case1_2()
                     user_input = input()
                 if user_input == "3":
-                    cls.sub_case1_1_2_3(category_list, keyword_dict_user)
+                    cls.sub_case1_1_2_3(category_list, match_result)
                     cls.__print_question_sub_case1_2()
                     user_input = input()
                 if user_input == "4":
-                    cls.sub_case1_1_2_4(category_list, keyword_dict_user, category_comparison, application_name)
+                    cls.sub_case1_1_2_4(category_list, match_result, category_comparison, application_name)
                     cls.__print_question_sub_case1_2()
                     user_input = input()
 
@@ -245,8 +269,8 @@ class UserInterface:
         print(f"The keywords for this description are: {keyword_dict_user}.")
 
     @classmethod
-    def sub_case1_1_2_2(cls, category_list, keyword_dict_user):
-        best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
+    def sub_case1_1_2_2(cls, category_list, match_result):
+        best_match = Calculator.calculate_best_matching_category(category_list, match_result)
 
         if best_match == -1:
             print("No match found!")
@@ -254,13 +278,13 @@ class UserInterface:
             print(f"The best matching category for this description is: {best_match.name}.")
 
     @classmethod
-    def sub_case1_1_2_3(cls, category_list, keyword_dict_user):
-        top10 = Calculator.get_top10_best_matches(category_list, keyword_dict_user)
+    def sub_case1_1_2_3(cls, category_list, match_result):
+        top10 = Calculator.get_top10_best_matches(category_list, match_result)
         print(f"The best matching categories for this description are the following: {top10}.")
 
     @classmethod
-    def sub_case1_1_2_4(cls, category_list, keyword_dict_user, category_comparison, application_name):
-        best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
+    def sub_case1_1_2_4(cls, category_list, match_result, category_comparison, application_name):
+        best_match = Calculator.calculate_best_matching_category(category_list, match_result)
 
         if best_match == -1:
             print("Cannot calculate the distance since no matching category was found.")
@@ -272,7 +296,8 @@ class UserInterface:
                 category_application_name = key
 
             category_application = CategoryTree.find_category_by_name(category_list, category_application_name)
-            distance = Calculator.calculate_distance(best_match.structure_id, category_application.structure_id)
+            distance = Calculator.calculate_distance_between_categories(category_list, best_match,
+                                                                        category_application)
             print(distance)
             print(f"The distance between the application '{application_name}' ({category_application_name}) "
                   f"and the determined category for the user description is {distance}.")
@@ -283,9 +308,7 @@ class UserInterface:
                 print(f"This specific use of '{application_name}' is probably not an exaptation.")
 
     @classmethod
-    def sub_case2(cls, path_input, language_input, stopwords):
-        category_list = CategoryTree.set_up_tree(path_input)
-
+    def sub_case2(cls, category_list, language_input, stopwords):
         cls.__print_question_sub_case2()
         user_input = input()
 
@@ -326,15 +349,14 @@ class UserInterface:
               "the Play Store. The shown result does not contain any numbers or non ASCII characters (cleaned text).")
         test_category = input()
 
-        success = False
-        while success is False:
-            try:
-                CategoryScraper.get_application_description(test_category)
-                success = True
-            except:
-                pass
+        try:
+            description = RetryPolicy().call(CategoryScraper.scrape_application_description, test_category,
+                                             description=test_category)
+        except RetryError as error:
+            print(str(error))
+            return
 
-        description = NLPHelper.read_description("files/category_description.txt")
+        description = NLPHelper.read_description_string(description)
         description_cleaned = CategoryScraper.clean_description_file(description)
         print(description_cleaned)
         print("\n")
@@ -454,7 +476,7 @@ class UserInterface:
             category_2 = CategoryTree.find_category_by_name(category_list, category_two)
 
             print(f"The distance between '{category_1.name}' and '{category_2.name}' is: "
-                  f"{Calculator.calculate_distance(category_1.structure_id, category_2.structure_id)}.")
+                  f"{Calculator.calculate_distance_between_categories(category_list, category_1, category_2)}.")
 
         except IOError:
             print("One of the categories or both categories do not exist in the csv file. Please check.")
@@ -468,9 +490,11 @@ class UserInterface:
 
             additional_stopwords = NLPHelper.read_additional_stopwords_from_file(stopwords_input)
 
-            print('\nThis process may take a little moment (approximately 10 minutes).')
+            print('\nThis process may take a little moment (approximately 10 minutes on a single core).')
 
-            NLPHelper.generate_keyword_dict(json_input, language, additional_stopwords)
+            NLPHelper.generate_keyword_dict(json_input, language, additional_stopwords,
+                                            lemma_cache_file="files/lemma_cache.json", workers=os.cpu_count() or 1,
+                                            incremental=True)
 
             print("\nKeywords are successfully stored in json file")
 
@@ -478,7 +502,7 @@ class UserInterface:
             sys.exit(str(error))
 
     @classmethod
-    def test_single_description(cls, csv_input, language_input, stopwords_input):
+    def test_single_description(cls, category_list, language_input, stopwords_input):
         try:
             print('Please indicate the path of the json file that contains the keywords for every category.')
             keywords_input = input()
@@ -487,9 +511,9 @@ class UserInterface:
             print('Please indicate the path of the file where the results should be written to.')
             result_input = input()
 
-            category_list = CategoryTree.set_up_tree(csv_input)
             additional_stopwords = NLPHelper.read_additional_stopwords_from_file(stopwords_input)
-            NLPHelper.initialize_keywords_from_keywords_dict(category_list, keywords_input)
+            category_list = CategoryTree.set_up_tree_with_keywords(category_list.csv_data, keywords_input,
+                                                                   "files/category_tree.npz")
 
             cls.print_start_test()
             user_input = input()
@@ -534,7 +558,8 @@ class UserInterface:
                 category_name = key
 
             category_comparison = CategoryTree.find_category_by_name(category_list, category_name)
-            best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
+            match_result = Calculator.match(category_list, keyword_dict_user)
+            best_match = match_result.best_match
 
             print(f"\nDetermined category for the application '{app_input}': {category_name}")
 
@@ -548,12 +573,12 @@ class UserInterface:
             else:
                 print(f"Best Match between '{app_input}' and the description: {best_match.name}")
 
-                top10 = Calculator.get_top10_best_matches(category_list, keyword_dict_user)
+                top10 = match_result.top_matches
 
                 print(f"Best Matches between '{app_input}' and the description: {top10}")
 
-                best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
-                distance = Calculator.calculate_distance(best_match.structure_id, category_comparison.structure_id)
+                distance = Calculator.calculate_distance_between_categories(category_list, best_match,
+                                                                            category_comparison)
                 print(f"Distance between the application '{app_input}' and the determined category "
                       f"'{category_comparison.name}': {distance} \n")
 
@@ -572,7 +597,7 @@ class UserInterface:
             sys.exit(str(error))
 
     @classmethod
-    def test_all(cls, csv_input, language_input, stopwords_input):
+    def test_all(cls, category_list, language_input, stopwords_input):
         try:
             print('Please indicate the path of the json file that contains the keywords for every category.')
             keywords_input = input()
@@ -581,9 +606,21 @@ class UserInterface:
             print('Please indicate the path of the file where the results should be written to.')
             result_input = input()
 
-            category_list = CategoryTree.set_up_tree(csv_input)
+            print("\nShould only cached descriptions of the applications be used (offline mode)?")
+            print("0: No\n"
+                  "1: Yes")
+            offline = input() == "1"
+
+            time_to_live = TIME_TO_LIVE
+            if not offline:
+                print("\nPlease indicate after how many days cached descriptions are scraped again (default: 30).")
+                days_input = input()
+                if days_input.strip():
+                    time_to_live = float(days_input) * 24 * 60 * 60
+
             additional_stopwords = NLPHelper.read_additional_stopwords_from_file(stopwords_input)
-            NLPHelper.initialize_keywords_from_keywords_dict(category_list, keywords_input)
+            category_list = CategoryTree.set_up_tree_with_keywords(category_list.csv_data, keywords_input,
+                                                                   "files/category_tree.npz")
 
             cls.print_start_test()
             user_input = input()
@@ -593,7 +630,8 @@ class UserInterface:
                 if user_input == "0":
                     exit_function = True
                 if user_input == "1":
-                    cls.__request_test_all(language_input, additional_stopwords, category_list, result_input)
+                    cls.__request_test_all(language_input, additional_stopwords, category_list, result_input, offline,
+                                           time_to_live)
                     cls.print_start_test()
                     user_input = input()
         except ValueError as error:
@@ -602,35 +640,45 @@ class UserInterface:
             sys.exit(str(error))
 
     @classmethod
-    def __request_test_all(cls, language_input, stopwords_input, category_list, results_path):
+    def __request_test_all(cls, language_input, stopwords_input, category_list, results_path, offline=False,
+                           time_to_live=TIME_TO_LIVE, cache_file="files/descriptions.sqlite"):
         try:
             with open("files/considered_apps.csv", "r") as read_file:
-                lines = csv.reader(read_file, delimiter=";")
-
-                for line in lines:
-                    user_descriptions_input = line[0]
-                    user_descriptions_input = user_descriptions_input.replace("ï»¿", "")
-
+                lines = list(csv.reader(read_file, delimiter=";"))
+
+            user_descriptions = [line[0].replace("ï»¿", "") for line in lines]
+            keyword_dicts_user = [NLPHelper.generate_keyword_dict_from_user_description(user_description,
+                                                                                        language_input,
+                                                                                        stopwords_input)
+                                  for user_description in user_descriptions]
+            match_results = Calculator.match_batch(category_list, keyword_dicts_user)
+            failure_report = FailureReport()
+
+            with DescriptionCache(cache_file, time_to_live, offline) as cache:
+                for line, user_descriptions_input, match_result in zip(lines, user_descriptions, match_results):
                     app_input = line[1]
+                    best_match = match_result.best_match
+                    top10 = match_result.top_matches
 
-                    keyword_dict_user = NLPHelper.generate_keyword_dict_from_user_description(user_descriptions_input,
-                                                                                              language_input,
-                                                                                              stopwords_input)
                     best_matches = CategoryTree.create_category_profile(app_input, category_list, language_input,
-                                                                        stopwords_input)
+                                                                        stopwords_input, failure_report=failure_report,
+                                                                        cache=cache)
+                    if best_matches is None:
+                        print(f"\nThe description of the application '{app_input}' could not be scraped. Skipped.")
+                        continue
 
                     category_name = ""
                     for key in best_matches:
                         category_name = key
 
                     category_comparison = CategoryTree.find_category_by_name(category_list, category_name)
-                    best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
 
                     print(f"\nDetermined category for the application '{app_input}': {category_name}")
 
                     if best_match == -1:
                         print("No match found!\n")
-                        line_to_store = user_descriptions_input + ";" + app_input + ";" + category_name + ";No Match" + "\n"
+                        line_to_store = user_descriptions_input + ";" + app_input + ";" + category_name + \
+                                        ";No Match" + "\n"
 
                         with open(results_path, 'a') as file:
                             file.write(line_to_store)
@@ -638,13 +686,10 @@ class UserInterface:
                     else:
                         print(f"Best Match between '{app_input} and the description': {best_match.name}")
 
-                        top10 = Calculator.get_top10_best_matches(category_list, keyword_dict_user)
-
                         print(f"Best Matches between '{app_input}' and the description: {top10}")
 
-                        best_match = Calculator.calculate_best_matching_category(category_list, keyword_dict_user)
-                        distance = Calculator.calculate_distance(best_match.structure_id,
-                                                                 category_comparison.structure_id)
+                        distance = Calculator.calculate_distance_between_categories(category_list, best_match,
+                                                                                    category_comparison)
                         print(f"Distance between the application '{app_input}' and the determined category "
                               f"'{category_comparison.name}': {distance} \n")
 
@@ -654,5 +699,8 @@ class UserInterface:
                         with open(results_path, 'a', encoding='utf-8') as file:
                             file.write(line_to_store)
 
+            if len(failure_report) > 0:
+                print(failure_report.get_summary())
+
         except ValueError as error:
             sys.exit(str(error))
@@ -34,3 +34,8 @@ def check_language(language):
 def check_existence_category(category):
     if category is None:
         raise ValueError('Error: Category was not found.')
+
+
+def check_structure_id(structure_id):
+    if not isinstance(structure_id, str) or len(structure_id) != 8 or not structure_id.isdigit():
+        raise ValueError('Error: A structure id must consist of 8 digits.')
@@ -0,0 +1,104 @@
+import codecs
+import os
+import random
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# the Calculator has to be imported first because of the circular imports between the modules
+import application.Matching.Calculator  # noqa: E402
+from application.Category.CategoryTree import CategoryTree  # noqa: E402
+from application.Matching import NLPHelper  # noqa: E402
+from application.Matching.KeywordPipeline import KeywordPipeline  # noqa: E402
+from application.Matching.LemmaCache import LemmaCache  # noqa: E402
+
+# the descriptions of the users are read with the Windows codec 'mbcs', which does not exist on other systems
+try:
+    codecs.lookup("mbcs")
+except LookupError:
+    codecs.register(lambda name: codecs.lookup("cp1252") if name == "mbcs" else None)
+
+CSV_FILE = os.path.join(ROOT, "files", "all_categories.csv")
+KEYWORDS_FILE = os.path.join(ROOT, "files", "keywords_dictionaries.json")
+
+
+class FakeLemmatizer:
+
+    def __init__(self):
+        self.calls = 0
+
+    def lemmatize(self, token, pos):
+        self.calls = self.calls + 1
+        return token[:-1] if token.endswith("s") else token
+
+
+class FakePipeline(KeywordPipeline):
+    """
+    Keyword pipeline without the corpora of the nltk package: every token is tagged as a noun, the lemma of a token is
+    the token without a trailing 's' and only a few stopwords are known.
+    """
+
+    def __init__(self, language, additional_stopwords=None, lemma_cache=None):
+        self.language = language
+        self.additional_stopwords = additional_stopwords or None
+        self.lemmatizer = FakeLemmatizer()
+        self.lemma_cache = lemma_cache if lemma_cache is not None else LemmaCache()
+        self.tagger = None
+        self.stop_words = frozenset(["the", "a", "and", "with", "is", "your"])
+        self.all_stop_words = self.stop_words
+
+        if self.additional_stopwords is not None:
+            self.all_stop_words = self.stop_words.union(self.additional_stopwords.lower().replace(" ", "").split(','))
+
+    def tag(self, text) -> list:
+        return [(token, "NN") for token in text.split()]
+
+
+def create_user_dicts(category_list, number, seed=7):
+    """
+    Creates user descriptions from the keywords of the given categories: random keywords with random occurrences,
+    mixed with tokens that are not a keyword of any category.
+    """
+
+    generator = random.Random(seed)
+    vocabulary = sorted({keyword for category in category_list for keyword in category.keywords})
+    user_dicts = [dict(), {"unknown": 3}]
+
+    for _ in range(number - len(user_dicts)):
+        tokens = generator.sample(vocabulary, generator.randint(1, 12)) + ["unknown"] * generator.randint(0, 1)
+        user_dicts.append({token: generator.randint(1, 5) for token in tokens})
+
+    return user_dicts
+
+
+@pytest.fixture
+def fake_pipeline(monkeypatch):
+    """
+    Replaces the default pipelines of the NLPHelper by pipelines that do not need the corpora of the nltk package.
+    """
+
+    monkeypatch.setattr(NLPHelper, "KeywordPipeline", FakePipeline)
+    monkeypatch.setattr(NLPHelper, "pipelines", dict())
+    monkeypatch.setattr(NLPHelper, "lemma_cache", LemmaCache())
+
+    return FakePipeline
+
+
+@pytest.fixture(scope="session")
+def category_list():
+    """
+    Category tree of the repository with the keywords of all categories.
+    """
+
+    category_list = CategoryTree.set_up_tree(CSV_FILE)
+    NLPHelper.initialize_keywords_from_keywords_dict(category_list, KEYWORDS_FILE)
+
+    return category_list
+
+
+@pytest.fixture(scope="session")
+def user_dicts(category_list):
+    return create_user_dicts(category_list, 200)
@@ -0,0 +1,193 @@
+"""
+Implementations of the original version of the matching, which are used to check that the optimized implementations
+calculate the same results.
+"""
+
+import sys
+
+from application.Matching import Calculator
+
+
+def calculate_matching_values_all_categories(category_list, user_dict) -> dict:
+    matching_values_dict = dict()
+    user_dict_normalized = Calculator.calculate_normalized_values_of_keywords(user_dict)
+
+    for category in category_list:
+        normalized_keywords_dict = Calculator.calculate_normalized_values_of_keywords(category.keywords)
+        result = Calculator.calculate_matching_values(
+            Calculator.calculate_normalized_values_of_keywords(normalized_keywords_dict), user_dict_normalized)
+        matching_values_dict[category.name] = result
+
+    return matching_values_dict
+
+
+def get_top10_best_matches(category_list, user_dict, threshold=0.01) -> dict:
+    matching_values_dict = calculate_matching_values_all_categories(category_list, user_dict)
+    sorted_items = sorted(matching_values_dict.items(), key=lambda item: item[1], reverse=True)
+
+    return {name: value for name, value in sorted_items[:10] if value >= threshold}
+
+
+def calculate_best_matching_category(category_list, user_dict):
+    best_matching_category_name = ""
+    best_matching_category_occurrences = 0
+    matching_values_dict = calculate_matching_values_all_categories(category_list, user_dict)
+
+    for element in matching_values_dict:
+        if matching_values_dict[element] > best_matching_category_occurrences:
+            best_matching_category_occurrences = matching_values_dict[element]
+            best_matching_category_name = element
+
+    if best_matching_category_occurrences >= 0.01:
+        return next(category for category in category_list if category.name == best_matching_category_name)
+
+    return -1
+
+
+def check_distances(structure_id_1):
+    if structure_id_1[0] == "0" and structure_id_1[1] == "0":
+        raise Exception("Incorrect structure id!")
+    if (structure_id_1[2] == "0" and structure_id_1[3] == "0"
+            and ((structure_id_1[4] == "0" and structure_id_1[5] != "0")
+                 or (structure_id_1[4] != "0" and structure_id_1[5] == "0")
+                 or (structure_id_1[6] == "0" and structure_id_1[7] != "0")
+                 or (structure_id_1[6] != "0" and structure_id_1[7] == "0"))):
+        raise Exception("Incorrect structure id!")
+
+    if (structure_id_1[4] == "0" and structure_id_1[5] == "0"
+            and ((structure_id_1[6] == "0" and structure_id_1[7] != "0") or (
+                    structure_id_1[6] != "0" and structure_id_1[7] == "0"))):
+        raise Exception("Incorrect structure id!")
+
+
+def calculate_distance(structure_id_1, structure_id_2):
+    check_distances(structure_id_1)
+    check_distances(structure_id_2)
+
+    distance = 0
+    if structure_id_1 != structure_id_2:
+        if structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1]:
+            if ((structure_id_1[0] == "0" and structure_id_1[1] == "0")
+                and not (structure_id_2[0] == "0" and structure_id_2[1] == "0")) \
+                    or ((structure_id_2[0] == "0" and structure_id_2[1] == "0")
+                        and not (structure_id_1[0] == "0" and structure_id_1[1] == "0")):
+                distance = distance + 2
+            else:
+                distance = distance + 2 * 2
+
+        if (structure_id_1[2] != structure_id_2[2] or structure_id_1[3] != structure_id_2[3]) \
+                or ((structure_id_1[2] == structure_id_2[2] and structure_id_1[3] == structure_id_2[3])
+                    and (structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1])):
+            if ((structure_id_1[2] == "0" and structure_id_1[3] == "0") and not (
+                    structure_id_2[2] == "0" and structure_id_2[3] == "0")) \
+                    or ((structure_id_2[2] == "0" and structure_id_2[3] == "0") and not (
+                    structure_id_1[2] == "0" and structure_id_1[3] == "0")):
+                distance = distance + 0.5
+            else:
+                distance = distance + 0.5 * 2
+
+        if (structure_id_1[4] != structure_id_2[4] or structure_id_1[5] != structure_id_2[5]) \
+                or ((structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
+                    and (structure_id_1[2] != structure_id_2[2] or structure_id_1[3] != structure_id_2[3])) \
+                or ((structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
+                    and (structure_id_1[2] == structure_id_2[2] and structure_id_1[3] == structure_id_2[3])
+                    and (structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1])):
+            if ((structure_id_1[4] == "0" and structure_id_1[5] == "0") and not (
+                    structure_id_2[4] == "0" and structure_id_2[5] == "0")) \
+                    or ((structure_id_2[4] == "0" and structure_id_2[5] == "0") and not (
+                    structure_id_1[4] == "0" and structure_id_1[5] == "0")):
+                distance = distance + 0.25
+            else:
+                distance = distance + 0.25 * 2
+
+        if (structure_id_1[6] != structure_id_2[6] or structure_id_1[7] != structure_id_2[7]) \
+                or ((structure_id_1[6] == structure_id_2[6] and structure_id_1[7] == structure_id_2[7])
+                    and (structure_id_1[4] != structure_id_2[4] or structure_id_1[5] != structure_id_2[5])) \
+                or ((structure_id_1[6] == structure_id_2[6] and structure_id_1[7] == structure_id_2[7])
+                    and (structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
+                    and (structure_id_1[2] != structure_id_2[2] or structure_id_1[3] != structure_id_2[3])) \
+                or ((structure_id_1[6] == structure_id_2[6] and structure_id_1[7] == structure_id_2[7])
+                    and (structure_id_1[4] == structure_id_2[4] and structure_id_1[5] == structure_id_2[5])
+                    and (structure_id_1[2] == structure_id_2[2] or structure_id_1[3] == structure_id_2[3])
+                    and structure_id_1[0] != structure_id_2[0] or structure_id_1[1] != structure_id_2[1]):
+            if ((structure_id_1[6] == "0" and structure_id_1[7] == "0") and not (
+                    structure_id_2[6] == "0" and structure_id_2[7] == "0")) \
+                    or ((structure_id_2[6] == "0" and structure_id_2[7] == "0") and not (
+                    structure_id_1[6] == "0" and structure_id_1[7] == "0")):
+                distance = distance + 0.125
+            else:
+                distance = distance + 0.125 * 2
+
+    return distance
+
+
+def calculate_main_category(category):
+    try:
+        Calculator.Validator.check_existence_category(category)
+
+        tier = category.get_tier()
+        category_tmp = category
+        exit_function = False
+
+        while exit_function is False:
+            if tier != "1":
+                category_tmp = category_tmp.get_parent()
+                tier = category_tmp.get_tier()
+            else:
+                return category_tmp
+
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def calculate_main_category_application_absolute_number(matching_dict, category_list) -> dict:
+    try:
+        Calculator.Validator.check_empty_list(category_list)
+
+        result_dict = dict()
+        already_exists = False
+
+        for key in matching_dict.keys():
+            category_tmp = Calculator.CategoryTree.find_category_by_name(category_list, key)
+            parent_category = calculate_main_category(category_tmp)
+
+            for result_key in result_dict.keys():
+                if result_key == parent_category.name:
+                    already_exists = True
+                    result_dict[result_key] = result_dict[result_key] + 1
+                    break
+
+            if already_exists is False:
+                result_dict[parent_category.name] = 1
+
+        return result_dict
+
+    except ValueError as error:
+        sys.exit(str(error))
+
+
+def calculate_main_category_application_matching_values(matching_dict, category_list) -> dict:
+    try:
+        Calculator.Validator.check_empty_list(category_list)
+
+        result_dict = dict()
+        already_exists = False
+
+        for key, value in matching_dict.items():
+            category_tmp = Calculator.CategoryTree.find_category_by_name(category_list, key)
+            if category_tmp.name != "Category":
+                parent_category = calculate_main_category(category_tmp)
+
+                for result_key in result_dict.keys():
+                    if result_key == parent_category.name:
+                        already_exists = True
+                        result_dict[result_key] = result_dict[result_key] + matching_dict[key]
+                        break
+
+                if already_exists is False:
+                    result_dict[parent_category.name] = matching_dict[key]
+
+        return result_dict
+
+    except ValueError as error:
+        sys.exit(str(error))
@@ -0,0 +1,31 @@
+import numpy as np
+
+from application.Matching import Calculator
+from application.Matching.KeywordMatrix import KeywordMatrix
+
+import reference
+
+
+def test_batch_scores_equal_single_scores(category_list, user_dicts):
+    keyword_matrix = KeywordMatrix.for_categories(category_list)
+
+    scores = Calculator.score_batch(category_list, user_dicts)
+
+    assert scores.shape == (len(user_dicts), len(category_list))
+    for row, user_dict in zip(scores, user_dicts):
+        assert np.array_equal(row, keyword_matrix.score(user_dict))
+        assert row.tolist() == list(reference.calculate_matching_values_all_categories(category_list,
+                                                                                        user_dict).values())
+
+
+def test_batch_results_equal_the_original_results(category_list, user_dicts):
+    match_results = Calculator.match_batch(category_list, user_dicts)
+
+    for match_result, user_dict in zip(match_results, user_dicts):
+        assert match_result.best_match is reference.calculate_best_matching_category(category_list, user_dict)
+        assert list(match_result.top_matches.items()) == \
+               list(reference.get_top10_best_matches(category_list, user_dict).items())
+
+
+def test_empty_batch(category_list):
+    assert Calculator.score_batch(category_list, []).shape == (0, len(category_list))
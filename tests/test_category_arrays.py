@@ -0,0 +1,93 @@
+import pytest
+
+from application.Category import StructureId
+from application.Category.Category import Category
+from application.Category.CategoryArrays import CategoryArrays
+from application.Category.CategoryTree import CategoryTree
+from conftest import CSV_FILE
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return CategoryTree.set_up_tree(CSV_FILE)
+
+
+def test_arrays_follow_tree(tree):
+    arrays = tree.get_arrays()
+
+    assert len(arrays.tiers) == len(tree)
+
+    for index, category in enumerate(tree):
+        assert arrays.get_position(category) == index
+        assert arrays.get_category(index) is category
+        assert arrays.tiers[index] == int(category.tier)
+        assert arrays.structure_ids[index] == StructureId.pack(category.structure_id)
+
+        if category.parent is None:
+            assert arrays.get_parent(index) == -1
+        else:
+            assert arrays.get_category(arrays.get_parent(index)) is category.parent
+
+        assert [arrays.get_category(child) for child in arrays.get_children(index)] == category.children
+
+
+def test_root_structure_id_is_string(tree):
+    assert tree[0].structure_id == "00000000"
+    assert tree.get_arrays().structure_ids[0] == 0
+
+
+def test_arrays_are_cached_per_tree(tree):
+    assert tree.get_arrays() is tree.get_arrays()
+    assert CategoryArrays.for_categories(tree) is tree.get_arrays()
+
+
+def link(parent, child):
+    child.parent = parent
+    parent.children.append(child)
+
+
+def test_arrays_are_rebuilt_after_changes():
+    main_category = Category("1", "Main")
+    main_category.set_tier("1")
+    sub_category = Category("2", "Sub")
+    sub_category.set_tier("2")
+    other_category = Category("3", "Other")
+    other_category.set_tier("1")
+
+    tree = CategoryTree([main_category, sub_category])
+    link(tree.root, main_category)
+    link(main_category, sub_category)
+    arrays = tree.get_arrays()
+
+    tree[2] = other_category
+    link(tree.root, other_category)
+
+    assert tree.get_arrays() is not arrays
+    assert tree.get_arrays().get_position(other_category) == 2
+    with pytest.raises(ValueError):
+        tree.get_arrays().get_position(sub_category)
+
+
+def test_plain_list_does_not_change_tree(tree):
+    arrays = tree.get_arrays()
+    sports = CategoryTree.find_category_by_name(tree, "Sports")
+    category_list = [sports] + sports.children
+
+    list_arrays = CategoryArrays.for_categories(category_list)
+
+    assert list_arrays is not arrays
+    assert tree.get_arrays() is arrays
+    assert list_arrays.get_position(sports) == 0
+    assert arrays.get_position(sports) == tree.index(sports)
+    assert list_arrays.get_parent(0) == -1
+    assert [list_arrays.get_category(child) for child in list_arrays.get_children(0)] == sports.children
+
+    for position, child in enumerate(sports.children, start=1):
+        assert list_arrays.get_parent(position) == 0
+        assert arrays.get_position(child) == tree.index(child)
+        assert list(list_arrays.get_children(position)) == []
+
+
+def test_unknown_category_has_no_position(tree):
+    with pytest.raises(ValueError):
+        tree.get_arrays().get_position(Category("0", "Unknown"))
@@ -0,0 +1,114 @@
+import play_scraper
+import pytest
+
+from application.Category.CategoryTree import CategoryTree
+from application.Matching import NLPHelper
+from application.Scraper import CategoryScraper
+from application.Scraper.Retry import FailureReport, RetryError, RetryPolicy
+from application.UI.UI import UserInterface
+
+DESCRIPTION = "Track your budget and expenses, manage your bank account and save money with the finance planner."
+
+
+class StubPlayStore:
+
+    def __init__(self, known_apps):
+        self.known_apps = known_apps
+        self.searches = []
+
+    def search(self, query, detailed=False):
+        self.searches.append(query)
+        return [{"title": name, "app_id": "id." + name} for name in self.known_apps if name == query]
+
+    def details(self, app_id):
+        return {"description": DESCRIPTION}
+
+
+@pytest.fixture
+def play_store(monkeypatch):
+    store = StubPlayStore(["Budget Planner"])
+    monkeypatch.setattr(play_scraper, "search", store.search)
+    monkeypatch.setattr(play_scraper, "details", store.details)
+    return store
+
+
+def test_unknown_app_is_reported_and_skipped(fake_pipeline, category_list, play_store):
+    failure_report = FailureReport()
+
+    result = CategoryTree.create_category_profile("Unknown App", category_list, "english",
+                                                  retry_policy=RetryPolicy(initial_backoff=0),
+                                                  failure_report=failure_report)
+
+    assert result is None
+    assert failure_report.get_descriptions() == ["Unknown App"]
+    assert "The app was not found" in failure_report.failures[0]["error"]
+    assert failure_report.failures[0]["attempts"] == 1
+
+
+def test_unknown_app_without_report_stops_with_message(fake_pipeline, category_list, play_store):
+    with pytest.raises(SystemExit, match="The app was not found"):
+        CategoryTree.create_category_profile("Unknown App", category_list, "english")
+
+
+def test_batch_evaluation_skips_unknown_app(fake_pipeline, category_list, play_store, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "files").mkdir()
+    (tmp_path / "user.txt").write_text("Budget and money of my bank account")
+    rows = ["user.txt;Budget Planner", "user.txt;Unknown App", "user.txt;Budget Planner"]
+    (tmp_path / "files" / "considered_apps.csv").write_text("\n".join(rows) + "\n")
+    results = tmp_path / "results.txt"
+
+    UserInterface._UserInterface__request_test_all("english", None, category_list, str(results))
+
+    lines = results.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert all(line.startswith("user.txt;Budget Planner;") for line in lines)
+    assert "Unknown App (1 attempt(s))" in capsys.readouterr().out
+    assert play_store.searches.count("Budget Planner") == 1
+
+
+def test_unknown_app_returns_to_the_menu(fake_pipeline, play_store, monkeypatch, capsys):
+    monkeypatch.setattr("builtins.input", lambda *args: "Unknown App")
+
+    UserInterface.sub_case2_1("english")
+
+    assert "The app was not found" in capsys.readouterr().out
+
+
+def test_incomplete_scrape_does_not_generate_keywords(category_list, monkeypatch, capsys):
+    def store_all_descriptions(category_list, failure_report=None, **kwargs):
+        failure_report.add(RetryError("Sports", 5, ConnectionError("timeout")))
+        return dict()
+
+    def initialize_keywords(*args, **kwargs):
+        raise AssertionError("The keywords must not be generated from an incomplete file.")
+
+    monkeypatch.setattr(CategoryScraper, "store_all_descriptions", store_all_descriptions)
+    monkeypatch.setattr(NLPHelper, "initialize_keywords_from_json_all_categories", initialize_keywords)
+
+    UserInterface.sub_case1_1(category_list, "english", "user.txt")
+
+    assert "The descriptions of 1 categories could not be scraped" in capsys.readouterr().out
+
+
+def test_description_is_passed_in_memory(fake_pipeline, category_list, play_store, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    description_file = tmp_path / "description.txt"
+    description_file.write_text(DESCRIPTION)
+
+    result = CategoryTree.create_category_profile("Budget Planner", category_list, "english")
+
+    assert result is not None
+    assert list(tmp_path.iterdir()) == [description_file]
+    assert NLPHelper.generate_keyword_dict_from_description(DESCRIPTION, "english") == \
+        NLPHelper.generate_keyword_dict_from_user_description(str(description_file), "english")
+
+
+def test_description_file_is_optional(play_store, tmp_path):
+    description_file = tmp_path / "description.txt"
+
+    description = CategoryScraper.get_application_description("Budget Planner")
+
+    assert description == CategoryScraper.get_application_description("Budget Planner",
+                                                                     description_file=str(description_file))
+    assert description_file.read_text(encoding="utf-8") == description
@@ -0,0 +1,129 @@
+import builtins
+import json
+import os
+import pickle
+
+import pytest
+
+from application.Category.Category import Category
+from application.Category.CategoryTree import CategoryTree
+
+from conftest import CSV_FILE
+
+
+def test_indexes_find_the_same_categories_as_the_linear_search(category_list):
+    assert isinstance(category_list, CategoryTree)
+    category_plain_list = list(category_list)
+
+    for category in category_list:
+        assert CategoryTree.find_category_by_name(category_list, category.name) is \
+               CategoryTree.find_category_by_name(category_plain_list, category.name)
+        assert CategoryTree.find_category_by_id(category_list, category.category_id) is \
+               CategoryTree.find_category_by_id(category_plain_list, category.category_id)
+        assert CategoryTree.find_category_by_structure_id(category_list, category.structure_id) is \
+               CategoryTree.find_category_by_structure_id(category_plain_list, category.structure_id)
+
+
+def test_first_category_wins_for_duplicates_and_indexes_follow_changes():
+    first, second = Category("1", "Finance"), Category("2", "Finance")
+    category_list = CategoryTree([first, second])
+
+    assert CategoryTree.find_category_by_name(category_list, "Finance") is first
+
+    category_list.append(Category("3", "Games"))
+    assert CategoryTree.find_category_by_id(category_list, 3).name == "Games"
+
+    category_list.remove(first)
+    category_list.append(Category("4", "Music"))
+    assert CategoryTree.find_category_by_name(category_list, "Finance") is second
+
+
+@pytest.mark.parametrize("category_list", [CategoryTree(), [Category(0, "Category")]])
+def test_unknown_categories_are_an_error(category_list):
+    with pytest.raises(Exception, match="does not exist"):
+        CategoryTree.find_category_by_name(category_list, "Unknown")
+    with pytest.raises(Exception, match="No category with the given id!"):
+        CategoryTree.find_category_by_id(category_list, 999)
+    with pytest.raises(Exception, match="No category with the given structure id!"):
+        CategoryTree.find_category_by_structure_id(category_list, "99000000")
+
+
+def test_replaced_categories_are_indexed_again():
+    category_list = CategoryTree([Category("1", "Finance")])
+    CategoryTree.find_category_by_name(category_list, "Finance")
+
+    category_list[1] = Category("2", "Games")
+
+    assert CategoryTree.find_category_by_name(category_list, "Games").category_id == "2"
+    with pytest.raises(Exception, match="does not exist"):
+        CategoryTree.find_category_by_name(category_list, "Finance")
+
+
+REASSIGNED = {
+    # the structure id of the root is a string like every other structure id
+    "Category": ["0", "Category", "0", "00000000", None],
+    "Horse Racing": ["497", "Horse Racing", "4", "13091001", "Equine Sports"],
+    "Communication": ["80DV8O", "Communication", "4", "25030314", "Computer Software and Applications"],
+    "Maps & Navigation": ["WQC6HR", "Maps & Navigation", "4", "25030315", "Computer Software and Applications"],
+    "Productivity": ["W3CW2J", "Productivity", "4", "25030316", "Computer Software and Applications"],
+}
+
+
+def describe(category):
+    return [category.category_id, category.name, category.tier, category.structure_id,
+            category.parent.name if category.parent is not None else None]
+
+
+def test_tree_equals_the_original_tree_except_for_the_reassigned_categories():
+    with open(os.path.join(os.path.dirname(__file__), "data", "baseline_tree.json")) as file:
+        baseline_tree = json.load(file)
+
+    category_list = CategoryTree.set_up_tree(CSV_FILE)
+
+    assert [category.name for category in category_list] == [row[1] for row in baseline_tree]
+    for category, row in zip(category_list, baseline_tree):
+        assert describe(category) == REASSIGNED.get(category.name, row)
+
+
+def test_children_are_linked_once_with_their_positions_in_the_structure_ids():
+    category_list = CategoryTree.set_up_tree(CSV_FILE)
+
+    for category in category_list:
+        assert len(set(map(id, category.children))) == len(category.children)
+        for position, child in enumerate(category.children, start=1):
+            assert child.parent is category
+            assert int(child.tier) == int(category.tier) + 1
+            tier = int(child.tier)
+            assert child.structure_id[:2 * tier - 2] == str(category.structure_id)[:2 * tier - 2]
+            assert int(child.structure_id[2 * tier - 2:2 * tier]) == position
+            assert set(child.structure_id[2 * tier:]) <= {"0"}
+
+
+def test_csv_file_is_read_once_and_repeated_builds_are_equal(monkeypatch):
+    opened_files = []
+    original_open = builtins.open
+
+    def tracking_open(file, *args, **kwargs):
+        opened_files.append(file)
+        return original_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", tracking_open)
+    first = [describe(category) for category in CategoryTree.set_up_tree(CSV_FILE)]
+    assert opened_files == [CSV_FILE]
+
+    category_list = CategoryTree.set_up_tree(CSV_FILE)
+    assert [describe(category) for category in category_list] == first
+    assert len(category_list[0].children) == len([category for category in category_list if category.tier == "1"])
+
+
+def test_trees_have_their_own_roots_and_can_be_pickled(category_list):
+    other = CategoryTree.set_up_tree(CSV_FILE)
+
+    assert other.root is not category_list.root
+    assert category_list.root is category_list[0]
+    assert set(map(id, category_list.root.children)).isdisjoint(map(id, other.root.children))
+
+    restored = pickle.loads(pickle.dumps(category_list))
+    assert [describe(category) for category in restored] == [describe(category) for category in category_list]
+    assert CategoryTree.find_category_by_name(restored, "Horse Racing").parent is \
+           CategoryTree.find_category_by_name(restored, "Equine Sports")
@@ -0,0 +1,122 @@
+import json
+import threading
+
+import pytest
+
+from application.Category.Category import Category
+from application.Scraper import CategoryScraper
+from application.Scraper.Checkpoint import Checkpoint
+from application.Scraper.Retry import RetryPolicy
+
+
+class StubPlayStore:
+
+    def __init__(self, crash_after=None, failing=()):
+        self.crash_after = crash_after
+        self.failing = failing
+        self.searches = []
+        self.lock = threading.Lock()
+
+    def search(self, query, detailed=False):
+        with self.lock:
+            if self.crash_after is not None and len(self.searches) >= self.crash_after:
+                raise KeyboardInterrupt
+            self.searches.append(query)
+        if query in self.failing:
+            raise ValueError("Invalid query")
+        return [{"title": query, "description": f"Description of {query}"}]
+
+
+@pytest.fixture
+def categories():
+    return [Category(0, "Category")] + [Category(i, f"Category {i}") for i in range(1, 11)]
+
+
+@pytest.fixture
+def dict_file(tmp_path):
+    dict_file = tmp_path / "dict.json"
+    dict_file.write_text("{}")
+    return dict_file
+
+
+def scrape(categories, dict_file, store, **kwargs):
+    return CategoryScraper.store_all_descriptions(categories, scraper=store, dict_file=str(dict_file),
+                                                  retry_policy=RetryPolicy(initial_backoff=0), **kwargs)
+
+
+def test_last_entry_wins_and_incomplete_last_line_is_ignored(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "dict.jsonl"))
+    checkpoint.append("A", "first")
+    checkpoint.append("B", "second")
+    checkpoint.append("A", "third")
+
+    with open(checkpoint.checkpoint_file, "a") as file:
+        file.write('{"category": "C", "descr')
+
+    assert checkpoint.load() == {"A": "third", "B": "second"}
+
+
+def test_invalid_line_within_the_file_is_an_error(tmp_path):
+    checkpoint_file = tmp_path / "dict.jsonl"
+    checkpoint_file.write_text('{"category": "A", "description": "a"}\nno json\n'
+                               '{"category": "B", "description": "b"}\n')
+
+    with pytest.raises(ValueError):
+        Checkpoint(str(checkpoint_file)).load()
+
+
+def test_compaction_keeps_one_entry_per_category_in_the_given_order(tmp_path):
+    checkpoint = Checkpoint(str(tmp_path / "dict.jsonl"))
+    for category_name, description in [("B", "b1"), ("A", "a"), ("B", "b2"), ("C", "c")]:
+        checkpoint.append(category_name, description)
+
+    descriptions = checkpoint.compact(["A", "B"])
+
+    assert list(descriptions.items()) == [("A", "a"), ("B", "b2"), ("C", "c")]
+    lines = (tmp_path / "dict.jsonl").read_text().splitlines()
+    assert [json.loads(line)["category"] for line in lines] == ["A", "B", "C"]
+    assert checkpoint.appended_entries == 0
+    assert not (tmp_path / "dict.jsonl.tmp").exists()
+
+
+def test_interrupted_scraping_is_resumed(categories, dict_file, tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        scrape(categories, dict_file, StubPlayStore(crash_after=4), compaction_interval=3)
+    with open(tmp_path / "dict.jsonl", "a") as file:
+        file.write('{"category": "Category 9", "desc')
+
+    store = StubPlayStore()
+    descriptions = scrape(categories, dict_file, store)
+
+    assert store.searches == [f"Category {i}" for i in range(5, 11)]
+    assert list(descriptions) == [f"Category {i}" for i in range(1, 11)]
+    assert json.loads(dict_file.read_text()) == descriptions
+
+
+def test_complete_scraping_removes_the_checkpoint(categories, dict_file, tmp_path):
+    scrape(categories, dict_file, StubPlayStore())
+    assert not (tmp_path / "dict.jsonl").exists()
+
+    store = StubPlayStore()
+    scrape(categories, dict_file, store)
+    assert len(store.searches) == 10
+
+
+def test_incomplete_scraping_keeps_the_checkpoint(categories, dict_file, tmp_path):
+    descriptions = scrape(categories, dict_file, StubPlayStore(failing=("Category 3",)))
+    assert "Category 3" not in descriptions
+    assert (tmp_path / "dict.jsonl").exists()
+
+    store = StubPlayStore()
+    descriptions = scrape(categories, dict_file, store)
+    assert store.searches == ["Category 3"]
+    assert list(descriptions) == [f"Category {i}" for i in range(1, 11)]
+    assert not (tmp_path / "dict.jsonl").exists()
+
+
+def test_scraping_without_resume_starts_from_scratch(categories, dict_file):
+    scrape(categories, dict_file, StubPlayStore(failing=("Category 3",)))
+
+    store = StubPlayStore()
+    scrape(categories, dict_file, store, resume=False)
+    assert len(store.searches) == 10
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from application.Matching import CorpusReader
+
+DESCRIPTIONS = {
+    "Budget": "Track your budget and expenses.",
+    "Games \"Arcade\"": "Jump, run and shoot {with} [brackets], \\ escapes and ümlauts.",
+    "Empty": "",
+    "Long": "word " * 5000,
+}
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    json_file = tmp_path / "dict.json"
+    json_file.write_text(json.dumps(DESCRIPTIONS, indent=2))
+    return str(json_file)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, CorpusReader.CHUNK_SIZE])
+def test_json_object_is_read_in_order(json_file, chunk_size):
+    descriptions = list(CorpusReader.read_descriptions(json_file, chunk_size))
+
+    assert descriptions == list(DESCRIPTIONS.items())
+
+
+def test_empty_object_contains_no_descriptions(tmp_path):
+    json_file = tmp_path / "dict.json"
+    json_file.write_text(" { \n } ")
+
+    assert list(CorpusReader.read_descriptions(str(json_file), 1)) == []
+
+
+def test_json_lines_round_trip(json_file, tmp_path):
+    corpus_file = str(tmp_path / "dict.jsonl")
+
+    CorpusReader.write_json_lines(CorpusReader.read_descriptions(json_file), corpus_file)
+
+    assert list(CorpusReader.read_descriptions(corpus_file)) == list(DESCRIPTIONS.items())
+
+
+def test_empty_lines_are_skipped(tmp_path):
+    corpus_file = tmp_path / "dict.jsonl"
+    corpus_file.write_text('\n{"category": "A", "description": "a"}\n\n')
+
+    assert list(CorpusReader.read_descriptions(str(corpus_file))) == [("A", "a")]
+
+
+@pytest.mark.parametrize("content", ['["Budget"]', '{"Budget": "a" "Games": "b"}', '{"Budget": "a",', '{1: "a"}',
+                                     '{"Budget": "a'])
+def test_invalid_json_is_an_error(tmp_path, content):
+    json_file = tmp_path / "dict.json"
+    json_file.write_text(content)
+
+    with pytest.raises(ValueError, match="No valid json format."):
+        list(CorpusReader.read_descriptions(str(json_file), 4))
+
+
+@pytest.mark.parametrize("line", ['no json', '{"category": "A"}', '["A", "a"]'])
+def test_invalid_json_line_is_an_error(tmp_path, line):
+    corpus_file = tmp_path / "dict.jsonl"
+    corpus_file.write_text(line + "\n")
+
+    with pytest.raises(ValueError, match="No valid json format."):
+        list(CorpusReader.read_descriptions(str(corpus_file)))
+
+
+def test_missing_file_is_an_error(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CorpusReader.read_descriptions(str(tmp_path / "missing.json"))
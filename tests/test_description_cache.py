@@ -0,0 +1,132 @@
+import sqlite3
+
+import pytest
+
+from application.Matching import Calculator
+from application.Scraper import CategoryScraper, DescriptionCache as description_cache_module
+from application.Scraper.DescriptionCache import DescriptionCache
+from application.Scraper.Retry import FailureReport
+from application.UI.UI import UserInterface
+
+from conftest import CSV_FILE, KEYWORDS_FILE
+
+DESCRIPTION = "Track your budget and expenses, manage your bank account and save money with the finance planner."
+
+
+class StubPlayStore:
+
+    def __init__(self):
+        self.requests = 0
+
+    def search(self, query, detailed=False):
+        self.requests = self.requests + 1
+        return [{"title": "Other App", "app_id": "id.other"}, {"title": query, "app_id": "id." + query}]
+
+    def details(self, app_id):
+        self.requests = self.requests + 1
+        return {"description": DESCRIPTION}
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(description_cache_module, "time", clock)
+    return clock
+
+
+def fill_cache(cache_file, application_names):
+    with DescriptionCache(cache_file) as cache:
+        for application_name in application_names:
+            CategoryScraper.fetch_application_description(application_name, StubPlayStore(), cache)
+
+
+def test_repeated_application_is_fetched_once():
+    store = StubPlayStore()
+
+    with DescriptionCache(":memory:") as cache:
+        descriptions = [CategoryScraper.fetch_application_description("Budget Planner", store, cache)
+                        for _ in range(10)]
+
+    assert descriptions == [DESCRIPTION] * 10
+    assert store.requests == 2
+
+
+def test_expired_entries_are_fetched_again(clock):
+    store = StubPlayStore()
+
+    with DescriptionCache(":memory:", time_to_live=60) as cache:
+        CategoryScraper.fetch_application_description("Budget Planner", store, cache)
+        clock.now = clock.now + 60
+        CategoryScraper.fetch_application_description("Budget Planner", store, cache)
+        assert store.requests == 2
+
+        clock.now = clock.now + 1
+        CategoryScraper.fetch_application_description("Budget Planner", store, cache)
+        assert store.requests == 4
+
+
+def test_offline_mode_ignores_age_and_sends_no_requests(tmp_path, clock):
+    cache_file = str(tmp_path / "descriptions.sqlite")
+    fill_cache(cache_file, ["Budget Planner"])
+    clock.now = clock.now + 10 ** 9
+    store = StubPlayStore()
+
+    with DescriptionCache(cache_file, time_to_live=60, offline=True) as cache:
+        assert CategoryScraper.fetch_application_description("Budget Planner", store, cache) == DESCRIPTION
+        with pytest.raises(ValueError, match="not cached"):
+            CategoryScraper.fetch_application_description("Unknown App", store, cache)
+
+    assert store.requests == 0
+
+
+def test_context_manager_closes_the_database():
+    with DescriptionCache(":memory:") as cache:
+        cache.set_app_id("Budget Planner", "id.budget")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.get_app_id("Budget Planner")
+
+
+def test_offline_batch_evaluation_skips_uncached_app(fake_pipeline, category_list, tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "files").mkdir()
+    fill_cache("files/descriptions.sqlite", ["Budget Planner"])
+    (tmp_path / "user.txt").write_text("Budget and money of my bank account")
+    rows = ["user.txt;Budget Planner", "user.txt;Unknown App", "user.txt;Budget Planner"]
+    (tmp_path / "files" / "considered_apps.csv").write_text("\n".join(rows) + "\n")
+    results = tmp_path / "results.txt"
+
+    UserInterface._UserInterface__request_test_all("english", None, category_list, str(results), offline=True)
+
+    assert len(results.read_text(encoding="utf-8").splitlines()) == 2
+    assert "Unknown App (1 attempt(s)): ValueError: Error: The app 'Unknown App' is not cached" in \
+           capsys.readouterr().out
+
+
+def test_offline_application_matches_skip_uncached_app(fake_pipeline, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "files").mkdir()
+    fill_cache("files/descriptions.sqlite", ["Budget Planner"])
+    applications = tmp_path / "applications.txt"
+    applications.write_text("Budget Planner\nUnknown App\n", encoding="utf-8")
+    stopwords = tmp_path / "stopwords.txt"
+    stopwords.write_text("app\n")
+    failure_report = FailureReport()
+
+    with DescriptionCache("files/descriptions.sqlite", offline=True) as cache:
+        Calculator.get_matches_application_with_categories(CSV_FILE, "english", str(stopwords), KEYWORDS_FILE,
+                                                           str(applications), cache=cache,
+                                                           failure_report=failure_report)
+
+    matches = (tmp_path / "files" / "application_matches.txt").read_text(encoding="utf-8").splitlines()
+    assert [line.split(":")[0] for line in matches] == ["Budget Planner"]
+    assert failure_report.get_descriptions() == ["Unknown App"]
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+import reference
+from application.Category.Category import Category
+from application.Category.DistanceMatrix import DistanceMatrix
+from application.Category.CategoryTree import CategoryTree
+from conftest import CSV_FILE
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return CategoryTree.set_up_tree(CSV_FILE)
+
+
+def test_matrix_equals_original_distances(tree):
+    distance_matrix = tree.get_distance_matrix()
+
+    assert distance_matrix.matrix.dtype == np.float16
+    assert distance_matrix.matrix.shape == (len(tree), len(tree))
+
+    for index, category in enumerate(tree[1:], start=1):
+        expected = [reference.calculate_distance(category.structure_id, other.structure_id)
+                    for other in tree[index:]]
+
+        assert distance_matrix.matrix[index, index:].tolist() == expected
+        assert distance_matrix.matrix[index:, index].tolist() == expected
+
+
+def test_root_has_no_distances(tree):
+    distance_matrix = tree.get_distance_matrix()
+
+    assert np.isnan(distance_matrix.get_row(tree.root)).all()
+    assert np.isnan(distance_matrix.matrix[:, 0]).all()
+
+
+def test_lookups(tree):
+    distance_matrix = tree.get_distance_matrix()
+    horse_racing = CategoryTree.find_category_by_name(tree, "Horse Racing")
+    others = tree[1::13]
+    expected = [reference.calculate_distance(horse_racing.structure_id, other.structure_id) for other in others]
+
+    assert [distance_matrix.distance(horse_racing, other) for other in others] == expected
+    assert distance_matrix.get_distances(horse_racing, others).tolist() == expected
+    assert distance_matrix.get_distances(horse_racing, others).dtype == np.float64
+
+    row = distance_matrix.get_row(horse_racing)
+    assert row[1::13].tolist() == expected
+    with pytest.raises(ValueError):
+        row[1] = 0
+
+    with pytest.raises(ValueError):
+        distance_matrix.distance(horse_racing, Category("0", "Unknown"))
+
+
+def test_matrix_is_cached_per_tree(tree):
+    assert tree.get_distance_matrix() is tree.get_distance_matrix()
+    assert DistanceMatrix.for_categories(tree) is tree.get_distance_matrix()
+
+
+def test_matrix_is_recalculated_after_changes():
+    tree = CategoryTree.set_up_tree(CSV_FILE)
+    distance_matrix = tree.get_distance_matrix()
+    horse_racing = CategoryTree.find_category_by_name(tree, "Horse Racing")
+    sports = CategoryTree.find_category_by_name(tree, "Sports")
+
+    tree.remove(horse_racing)
+    tree.append(horse_racing)
+
+    assert tree.get_distance_matrix() is not distance_matrix
+    assert tree.get_distance_matrix().distance(horse_racing, sports) == distance_matrix.distance(horse_racing, sports)
+    assert tree.get_distance_matrix().get_row(horse_racing)[1:].tolist() != distance_matrix.get_row(horse_racing)[
+        1:].tolist()
+
+
+def test_plain_lists_are_calculated_on_every_call(tree):
+    category_list = list(tree)
+
+    assert DistanceMatrix.for_categories(category_list) is not DistanceMatrix.for_categories(category_list)
+    assert DistanceMatrix.for_categories(category_list).distance(tree[1], tree[5]) == \
+        tree.get_distance_matrix().distance(tree[1], tree[5])
+
+
+def test_matrix_has_to_fit_the_categories(tree):
+    with pytest.raises(ValueError):
+        DistanceMatrix(tree, np.zeros((3, 3), dtype=np.float16))
@@ -0,0 +1,37 @@
+import numpy as np
+
+from application.Matching.KeywordMatrix import KeywordMatrix
+
+import reference
+
+
+def test_postings_hold_the_normalized_values_of_the_categories(category_list):
+    keyword_matrix = KeywordMatrix.for_categories(category_list)
+
+    for keyword, postings in keyword_matrix.inverted_index.items():
+        for row, value in postings:
+            keywords = category_list[row].keywords
+            assert value == keywords[keyword] / sum(keywords.values())
+
+    assert sum(len(postings) for postings in keyword_matrix.inverted_index.values()) == keyword_matrix.matrix.nnz
+
+
+def test_only_categories_that_share_a_keyword_are_candidates(category_list, user_dicts):
+    keyword_matrix = KeywordMatrix.for_categories(category_list)
+
+    for user_dict in user_dicts:
+        candidates, _ = keyword_matrix.score_candidates(user_dict)
+        expected = [row for row, category in enumerate(category_list) if category.keywords.keys() & user_dict.keys()]
+
+        assert candidates.tolist() == expected
+
+
+def test_scores_equal_the_original_scoring_and_the_batch_scores(category_list, user_dicts):
+    keyword_matrix = KeywordMatrix.for_categories(category_list)
+    batch_scores = keyword_matrix.score_batch(user_dicts)
+
+    for row, user_dict in zip(batch_scores, user_dicts):
+        scores = keyword_matrix.score(user_dict)
+        assert scores.tolist() == list(reference.calculate_matching_values_all_categories(category_list,
+                                                                                           user_dict).values())
+        assert np.array_equal(scores, row)
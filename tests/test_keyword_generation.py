@@ -0,0 +1,164 @@
+import functools
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from application.Category.Category import Category
+from application.Matching import NLPHelper
+
+WORDS = ["budgets", "games", "maps", "photos", "music", "videos", "weather", "news", "books", "sports", "travel",
+         "shops", "health", "events", "comics", "tools", "social", "dating", "finance", "parents", "cars"]
+DESCRIPTIONS = {f"Category {i}": " ".join(WORDS[(i * j) % len(WORDS)] for j in range(3 * i + 5)) for i in range(1, 21)}
+
+
+@pytest.fixture
+def fork(monkeypatch):
+    """
+    Starts the worker processes with 'fork', so that they inherit the fake pipelines of the test.
+    """
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("The start method 'fork' is not available.")
+
+    monkeypatch.setattr(NLPHelper, "ProcessPoolExecutor",
+                        functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("fork")))
+
+
+@pytest.fixture
+def json_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "files").mkdir()
+
+    json_file = tmp_path / "dict.json"
+    json_file.write_text(json.dumps({"Category": "", **DESCRIPTIONS}))
+    return str(json_file)
+
+
+def generate(json_file, keywords_file="files/keywords_dictionaries.json", **kwargs):
+    NLPHelper.generate_keyword_dict(json_file, "english", keywords_file=str(keywords_file), **kwargs)
+
+    with open(keywords_file) as file:
+        return json.load(file)
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(2, 1), (3, 4), (4, 50)])
+def test_parallel_generation_equals_sequential_generation(fake_pipeline, fork, json_file, workers, chunk_size):
+    sequential = generate(json_file)
+    parallel = generate(json_file, workers=workers, chunk_size=chunk_size)
+
+    assert list(parallel.items()) == list(sequential.items())
+    assert list(sequential) == list(DESCRIPTIONS)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_keywords_of_descriptions_keep_their_order(fake_pipeline, fork, workers):
+    descriptions = list(DESCRIPTIONS.items())
+
+    keywords = list(NLPHelper.generate_keywords_of_descriptions(iter(descriptions), "english", workers=workers,
+                                                                chunk_size=3))
+
+    assert [name for name, _ in keywords] == list(DESCRIPTIONS)
+    assert keywords[0][1] == NLPHelper.generate_keywords_of_description(DESCRIPTIONS["Category 1"], "english")
+
+
+def test_lemma_cache_file_is_used_and_updated(fake_pipeline, json_file, tmp_path):
+    lemma_cache_file = tmp_path / "lemmas.json"
+
+    generate(json_file, lemma_cache_file=str(lemma_cache_file))
+
+    assert ["budgets", "n", "budget"] in json.loads(lemma_cache_file.read_text())
+
+
+def test_lemmas_of_the_workers_are_merged(fake_pipeline, fork, json_file, tmp_path):
+    lemma_cache_file = tmp_path / "lemmas.json"
+    lemma_cache_file.write_text(json.dumps([["budgets", "n", "budget"]]))
+
+    generate(json_file, lemma_cache_file=str(lemma_cache_file), workers=2, chunk_size=3)
+
+    lemmas = json.loads(lemma_cache_file.read_text())
+    statistics = NLPHelper.lemma_cache.get_statistics()
+
+    assert sorted(lemmas) == sorted([word, "n", word[:-1] if word.endswith("s") else word] for word in WORDS)
+    assert statistics["misses"] > 0
+    assert statistics["hits"] + statistics["misses"] == sum(len(description.split())
+                                                           for description in DESCRIPTIONS.values())
+
+
+def test_keywords_of_a_chunk_contain_the_new_lemmas(fake_pipeline):
+    NLPHelper.initialize_worker("english")
+
+    keywords, new_lemmas, hits, misses = NLPHelper.generate_keywords_of_chunk(["games games maps", "maps"], "english")
+
+    assert keywords == [NLPHelper.generate_keywords_of_description(description, "english")
+                        for description in ["games games maps", "maps"]]
+    assert new_lemmas == [["games", "n", "game"], ["maps", "n", "map"]]
+    assert (hits, misses) == (2, 2)
+    assert NLPHelper.generate_keywords_of_chunk(["maps"], "english")[1:] == ([], 1, 0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_all_categories_equal_single_categories(fake_pipeline, fork, json_file, tmp_path, workers):
+    categories = [Category(str(position), name) for position, name in enumerate(DESCRIPTIONS, start=1)]
+    single_categories = [Category(str(position), name) for position, name in enumerate(DESCRIPTIONS, start=1)]
+    lemma_cache_file = tmp_path / "lemmas.json"
+
+    NLPHelper.initialize_keywords_from_json_all_categories(categories, json_file, "english",
+                                                           lemma_cache_file=str(lemma_cache_file), workers=workers,
+                                                           chunk_size=3)
+    for category in single_categories:
+        NLPHelper.initialize_keywords_from_json(category, json_file, "english")
+
+    assert [category.keywords for category in categories] == [category.keywords for category in single_categories]
+    assert ["budgets", "n", "budget"] in json.loads(lemma_cache_file.read_text())
+
+
+@pytest.fixture
+def calculated(monkeypatch):
+    calculated = []
+    generate_keywords_of_description = NLPHelper.generate_keywords_of_description
+
+    def record(description, *args):
+        calculated.append(description)
+        return generate_keywords_of_description(description, *args)
+
+    monkeypatch.setattr(NLPHelper, "generate_keywords_of_description", record)
+    return calculated
+
+
+def test_incremental_generation_only_calculates_changed_categories(fake_pipeline, json_file, tmp_path, calculated):
+    keywords_file = tmp_path / "keywords.json"
+    generate(json_file, keywords_file)
+    descriptions = {**DESCRIPTIONS, "Category 3": "maps and photos", "Category 21": "games and cars"}
+    del descriptions["Category 5"]
+    (tmp_path / "dict.json").write_text(json.dumps(descriptions))
+    calculated.clear()
+
+    incremental = generate(json_file, keywords_file, incremental=True)
+
+    assert calculated == ["maps and photos", "games and cars"]
+    assert incremental == generate(json_file, tmp_path / "full.json")
+    assert list(incremental) == list(descriptions)
+
+
+def test_changed_configuration_calculates_all_categories(fake_pipeline, json_file, tmp_path, calculated):
+    keywords_file = tmp_path / "keywords.json"
+    assert any("car" in category_keywords for category_keywords in generate(json_file, keywords_file).values())
+    calculated.clear()
+
+    keywords = generate(json_file, keywords_file, additional_stopwords="car", incremental=True)
+
+    assert len(calculated) == len(DESCRIPTIONS)
+    assert not any("car" in category_keywords for category_keywords in keywords.values())
+
+
+def test_missing_fingerprints_calculate_all_categories(fake_pipeline, json_file, tmp_path, calculated):
+    keywords_file = tmp_path / "keywords.json"
+    generate(json_file, keywords_file)
+    (tmp_path / "keywords_fingerprints.json").unlink()
+    calculated.clear()
+
+    generate(json_file, keywords_file, incremental=True)
+
+    assert len(calculated) == len(DESCRIPTIONS)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from application.Category.Category import Category
+from application.Matching import Calculator
+from application.Matching.KeywordMatrix import KeywordMatrix
+
+import reference
+
+
+def test_matching_values_equal_the_original_scoring(category_list, user_dicts):
+    for user_dict in user_dicts:
+        assert Calculator.calculate_matching_values_all_categories(category_list, user_dict) == \
+               reference.calculate_matching_values_all_categories(category_list, user_dict)
+
+
+def test_rows_are_normalized(category_list):
+    keyword_matrix = KeywordMatrix.for_categories(category_list)
+    row_sums = np.asarray(keyword_matrix.matrix.sum(axis=1)).ravel()
+
+    assert keyword_matrix.matrix.shape[0] == len(category_list)
+    assert np.allclose(row_sums, [1.0 if category.keywords else 0.0 for category in category_list])
+
+
+def test_matrix_is_compiled_once_per_category_list(category_list):
+    keyword_matrix = KeywordMatrix.for_categories(category_list)
+
+    assert KeywordMatrix.for_categories(category_list) is keyword_matrix
+    assert KeywordMatrix.for_categories(list(category_list)) is not keyword_matrix
+
+
+def test_changed_keywords_rebuild_the_matrix():
+    categories = [Category(0, "Category"), Category(1, "Finance"), Category(2, "Games")]
+    categories[1].set_keywords({"money": 3, "bank": 1})
+    categories[2].set_keywords({"game": 1})
+
+    assert Calculator.calculate_matching_values_all_categories(categories, {"money": 1}) == \
+           {"Category": 0, "Finance": 0.75, "Games": 0}
+
+    categories[2].set_keywords({"money": 1})
+
+    assert Calculator.calculate_matching_values_all_categories(categories, {"money": 1}) == \
+           {"Category": 0, "Finance": 0.75, "Games": 1.0}
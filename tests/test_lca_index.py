@@ -0,0 +1,146 @@
+import csv
+import itertools
+
+import numpy as np
+import pytest
+
+import reference
+from application.Category.CategoryTree import CategoryTree
+from application.Category.LcaIndex import LcaIndex
+from application.Matching import Calculator
+from application.UI import UI
+from conftest import CSV_FILE
+
+TIERS = 5
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return CategoryTree.set_up_tree(CSV_FILE)
+
+
+@pytest.fixture(scope="module")
+def deep_tree(tmp_path_factory):
+    """
+    Tree with 5 tiers, in which one category has 120 children, written as csv file in the format of the IAB taxonomy.
+    """
+
+    rows = []
+
+    def add(path, parent_id):
+        category_id = str(len(rows) + 1)
+        rows.append([category_id, parent_id, path[-1]] + path + [""] * (TIERS - len(path)))
+        if len(path) < TIERS:
+            number = 120 if path == ["C1", "C1.2"] else 2
+            for position in range(1, number + 1):
+                add(path + [f"{path[-1]}.{position}"], category_id)
+
+    for main in range(1, 4):
+        add([f"C{main}"], "")
+
+    csv_file = tmp_path_factory.mktemp("deep") / "deep_categories.csv"
+    with open(csv_file, "w", newline="") as file:
+        writer = csv.writer(file, delimiter=";")
+        writer.writerow(["Unique ID ", "Parent", "Name"] + [f"Tier {tier}" for tier in range(1, TIERS + 1)])
+        writer.writerows(rows)
+
+    return CategoryTree.set_up_tree(str(csv_file))
+
+
+def ancestors(category):
+    path = []
+    while category is not None:
+        path.append(category)
+        category = category.parent
+    return path
+
+
+def depth(category):
+    return len(ancestors(category)) - 1
+
+
+def tier_distance(category_1, category_2, tree_depth):
+    """
+    Distance of two categories tier by tier: from the tier below their lowest common ancestor down to the deepest tier
+    of the tree, every tier counts once if only one of the categories reaches it and twice otherwise.
+    """
+
+    if category_1 is category_2:
+        return 0
+
+    lca_depth = depth(next(category for category in ancestors(category_1) if category in ancestors(category_2)))
+    weights = [2] + [0.5 ** (tier - 1) for tier in range(2, tree_depth + 1)]
+    distance = 0
+
+    for tier in range(lca_depth + 1, tree_depth + 1):
+        if (depth(category_1) < tier) != (depth(category_2) < tier):
+            distance = distance + weights[tier - 1]
+        else:
+            distance = distance + weights[tier - 1] * 2
+
+    return distance
+
+
+def test_distances_equal_original_distances(tree):
+    lca_index = tree.get_lca_index()
+    positions = np.arange(1, len(tree))
+    distances = lca_index.calculate_distances(positions[:, None], positions[None, :])
+
+    for row, category in enumerate(tree[1:]):
+        assert distances[row, row:].tolist() == [reference.calculate_distance(category.structure_id, other.structure_id)
+                                                 for other in tree[row + 1:]]
+
+
+def test_find_lca(tree):
+    lca_index = tree.get_lca_index()
+    arrays = tree.get_arrays()
+
+    for category_1, category_2 in itertools.combinations(tree[::9], 2):
+        expected = next(category for category in ancestors(category_1) if category in ancestors(category_2))
+        lca = lca_index.find_lca(arrays.get_position(category_1), arrays.get_position(category_2))
+
+        assert arrays.get_category(int(lca)) is expected
+
+
+def test_index_is_cached_per_tree(tree):
+    assert tree.get_lca_index() is tree.get_lca_index()
+    assert LcaIndex.for_categories(tree) is tree.get_lca_index()
+
+
+def test_deep_tree_structure_ids(deep_tree):
+    assert max(int(category.tier) for category in deep_tree) == TIERS
+    assert {len(category.structure_id) for category in deep_tree[1:]} == {3 * TIERS}
+    assert CategoryTree.find_category_by_name(deep_tree, "C1.2.120").structure_id == "001002120000000"
+    assert (deep_tree.get_arrays().structure_ids[1:] == -1).all()
+
+
+def test_deep_tree_distances(deep_tree):
+    lca_index = deep_tree.get_lca_index()
+    categories = deep_tree[1::17] + [CategoryTree.find_category_by_name(deep_tree, "C1.1.1.1.1"),
+                                     CategoryTree.find_category_by_name(deep_tree, "C1.1.1.1.2")]
+
+    for category_1, category_2 in itertools.product(categories, repeat=2):
+        expected = tier_distance(category_1, category_2, TIERS)
+
+        assert lca_index.distance(category_1, category_2) == expected
+        assert Calculator.calculate_distance_between_categories(deep_tree, category_1, category_2) == expected
+        assert deep_tree.get_distance_matrix().distance(category_1, category_2) == expected
+
+
+def test_deepest_siblings_are_not_equal(deep_tree):
+    category_1 = CategoryTree.find_category_by_name(deep_tree, "C1.1.1.1.1")
+    category_2 = CategoryTree.find_category_by_name(deep_tree, "C1.1.1.1.2")
+
+    assert Calculator.calculate_distance_between_categories(deep_tree, category_1, category_2) == 0.125
+
+    with pytest.raises(ValueError):
+        Calculator.calculate_distance(category_1.structure_id, category_2.structure_id)
+
+
+def test_ui_distance_uses_the_tree(deep_tree, monkeypatch, capsys):
+    answers = iter(["C1.1.1.1.1", "C1.1.1.1.2"])
+    monkeypatch.setattr("builtins.input", lambda *args: next(answers))
+
+    UI.UserInterface.sub_case2_3_1(deep_tree)
+
+    assert "is: 0.125." in capsys.readouterr().out
@@ -0,0 +1,91 @@
+import pytest
+
+from application.Matching.LemmaCache import LemmaCache
+
+from conftest import FakeLemmatizer
+
+
+def test_every_pair_is_lemmatized_once():
+    cache = LemmaCache()
+    lemmatizer = FakeLemmatizer()
+
+    lemmas = [cache.lemmatize(token, pos, lemmatizer) for token, pos in [("apps", "n"), ("apps", "n"), ("apps", "v"),
+                                                                         ("games", "n"), ("apps", "n")]]
+
+    assert lemmas == ["app", "app", "app", "game", "app"]
+    assert lemmatizer.calls == 3
+    assert cache.get_statistics() == {"lemmas": 3, "hits": 2, "misses": 3, "hit rate": 0.4}
+
+
+def test_unused_cache_has_no_hit_rate():
+    assert LemmaCache().get_hit_rate() == 0.0
+
+
+def test_least_recently_used_lemma_is_removed():
+    cache = LemmaCache(maximum_size=2)
+    lemmatizer = FakeLemmatizer()
+
+    cache.lemmatize("apps", "n", lemmatizer)
+    cache.lemmatize("games", "n", lemmatizer)
+    cache.lemmatize("apps", "n", lemmatizer)
+    cache.lemmatize("maps", "n", lemmatizer)
+
+    assert list(cache.lemmas) == [("apps", "n"), ("maps", "n")]
+
+    cache.lemmatize("games", "n", lemmatizer)
+    assert lemmatizer.calls == 4
+
+
+def test_saved_lemmas_are_loaded_in_order(tmp_path):
+    cache_file = str(tmp_path / "lemmas.json")
+    cache = LemmaCache()
+    for token in ["apps", "games", "maps"]:
+        cache.lemmatize(token, "n", FakeLemmatizer())
+    cache.save(cache_file)
+
+    loaded = LemmaCache(maximum_size=2)
+    loaded.load(cache_file)
+    lemmatizer = FakeLemmatizer()
+
+    assert list(loaded.lemmas.items()) == [(("games", "n"), "game"), (("maps", "n"), "map")]
+    assert loaded.lemmatize("maps", "n", lemmatizer) == "map"
+    assert lemmatizer.calls == 0
+
+
+def test_missing_file_is_ignored(tmp_path):
+    cache = LemmaCache()
+    cache.load(str(tmp_path / "missing.json"))
+
+    assert len(cache.lemmas) == 0
+
+
+def test_invalid_file_is_an_error(tmp_path):
+    cache_file = tmp_path / "lemmas.json"
+    cache_file.write_text("no json")
+
+    with pytest.raises(ValueError, match="No valid json format."):
+        LemmaCache().load(str(cache_file))
+
+
+def test_merged_lemmas_are_most_recently_used():
+    cache = LemmaCache(maximum_size=2)
+    cache.merge([["apps", "n", "app"], ["games", "n", "game"]], hits=3, misses=2)
+    cache.merge([["maps", "n", "map"], ["apps", "n", "app"]], misses=2)
+
+    assert list(cache.lemmas.items()) == [(("maps", "n"), "map"), (("apps", "n"), "app")]
+    assert (cache.hits, cache.misses) == (3, 4)
+
+
+def test_new_lemmas_are_only_recorded_when_tracked():
+    cache = LemmaCache()
+    cache.lemmatize("apps", "n", FakeLemmatizer())
+
+    assert cache.take_new_lemmas() == []
+
+    cache.track_new_lemmas()
+    cache.lemmatize("apps", "n", FakeLemmatizer())
+    cache.lemmatize("games", "n", FakeLemmatizer())
+
+    assert cache.take_new_lemmas() == [["games", "n", "game"]]
+    assert cache.take_new_lemmas() == []
+
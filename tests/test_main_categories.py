@@ -0,0 +1,134 @@
+import pytest
+
+import reference
+from application.Category.Category import Category
+from application.Category.CategoryTree import CategoryTree
+from application.Matching import Calculator
+from conftest import CSV_FILE, KEYWORDS_FILE
+
+
+def aggregate(matching_dict, category_list, count):
+    """
+    Summarizes the values (or occurrences) per main category like the original loops, but for every main category.
+    """
+
+    result_dict = dict()
+
+    for key, value in matching_dict.items():
+        category = CategoryTree.find_category_by_name(category_list, key)
+        if category.name != "Category":
+            main_category = reference.calculate_main_category(category).name
+            result_dict[main_category] = result_dict.get(main_category, 0) + (1 if count else value)
+
+    return result_dict
+
+
+def has_lost_main_categories(matching_dict, category_list):
+    main_categories = [reference.calculate_main_category(CategoryTree.find_category_by_name(category_list, key)).name
+                       for key in matching_dict]
+    first_repetition = next((position for position, name in enumerate(main_categories)
+                             if name in main_categories[:position]), None)
+
+    return first_repetition is not None and any(name not in main_categories[:position] for position, name
+                                                in enumerate(main_categories) if position > first_repetition)
+
+
+@pytest.fixture(scope="module")
+def keywords_tree(tmp_path_factory):
+    snapshot_file = str(tmp_path_factory.mktemp("snapshot") / "category_tree.npz")
+    CategoryTree.set_up_tree_with_keywords(CSV_FILE, KEYWORDS_FILE, snapshot_file)
+
+    return CategoryTree.load_snapshot(snapshot_file, CSV_FILE, KEYWORDS_FILE)
+
+
+@pytest.fixture(scope="module")
+def top_matches(category_list, user_dicts):
+    return [result.top_matches for result in Calculator.match_batch(category_list, user_dicts)]
+
+
+def test_ancestor_paths(category_list):
+    arrays = category_list.get_arrays()
+
+    for position, category in enumerate(category_list):
+        path = []
+        while category is not None and category.parent is not None:
+            path.insert(0, arrays.get_position(category))
+            category = category.parent
+
+        assert arrays.get_ancestors(position).tolist() == path
+        assert arrays.main_category_indices[position] == (path[0] if path else -1)
+
+
+def test_main_categories_equal_original_main_categories(category_list):
+    assert category_list.root.main_category is None
+
+    for category in category_list[1:]:
+        assert category.main_category is reference.calculate_main_category(category)
+        assert Calculator.calculate_main_category(category) is reference.calculate_main_category(category)
+
+
+def test_main_category_of_a_category_outside_a_tree():
+    main_category = Category("1", "Main")
+    main_category.set_tier("1")
+    sub_category = Category("2", "Sub")
+    sub_category.set_tier("2")
+    sub_category.parent = main_category
+
+    assert Calculator.calculate_main_category(sub_category) is main_category
+
+
+def test_restored_tree_has_main_categories(keywords_tree):
+    for category in keywords_tree[1:]:
+        assert category.main_category is reference.calculate_main_category(category)
+
+
+def test_aggregation_of_top_matches(category_list, top_matches):
+    for matching_dict in top_matches:
+        absolute_numbers = Calculator.calculate_main_category_application_absolute_number(matching_dict,
+                                                                                          category_list)
+        matching_values = Calculator.calculate_main_category_application_matching_values(matching_dict,
+                                                                                         category_list)
+
+        assert list(absolute_numbers.items()) == list(aggregate(matching_dict, category_list, True).items())
+        assert list(matching_values) == list(aggregate(matching_dict, category_list, False))
+        assert list(matching_values.values()) == pytest.approx(
+            list(aggregate(matching_dict, category_list, False).values()))
+
+        if not has_lost_main_categories(matching_dict, category_list):
+            assert absolute_numbers == reference.calculate_main_category_application_absolute_number(
+                matching_dict, category_list)
+            assert matching_values == pytest.approx(reference.calculate_main_category_application_matching_values(
+                matching_dict, category_list))
+
+
+def test_main_categories_after_a_repetition_are_kept(category_list):
+    matching_dict = {"Horse Racing": 0.5, "Equine Sports": 0.4, "Sedan": 0.3}
+
+    assert reference.calculate_main_category_application_absolute_number(matching_dict, category_list) == {
+        "Healthy Living": 2}
+    assert Calculator.calculate_main_category_application_absolute_number(matching_dict, category_list) == {
+        "Healthy Living": 2, "Automotive": 1}
+    assert Calculator.calculate_main_category_application_matching_values(matching_dict, category_list) == \
+        pytest.approx({"Healthy Living": 0.9, "Automotive": 0.3})
+
+
+def test_root_is_skipped(category_list):
+    matching_dict = {"Category": 1.0, "Sedan": 0.3}
+
+    assert Calculator.calculate_main_category_application_absolute_number(matching_dict, category_list) == {
+        "Automotive": 1}
+    assert Calculator.calculate_main_category_application_matching_values(matching_dict, category_list) == {
+        "Automotive": 0.3}
+    assert Calculator.calculate_main_category_application_absolute_number(dict(), category_list) == dict()
+
+
+def test_aggregation_of_all_categories(category_list, user_dicts):
+    for user_dict in user_dicts[:50]:
+        matching_values = reference.calculate_matching_values_all_categories(category_list, user_dict)
+        expected = aggregate(matching_values, category_list, False)
+
+        for result in (Calculator.calculate_main_category_matching_values_all_categories(category_list, user_dict),
+                       Calculator.calculate_main_category_matching_values_all_categories(
+                           category_list, Calculator.match(category_list, user_dict))):
+            assert list(result) == list(expected)
+            assert list(result.values()) == pytest.approx(list(expected.values()))
@@ -0,0 +1,59 @@
+import builtins
+
+from application.Category.CategoryTree import CategoryTree
+from application.Matching import Calculator, NLPHelper
+from application.UI.UI import UserInterface
+
+import reference
+from conftest import KEYWORDS_FILE
+
+
+def test_match_result_equals_the_original_results(category_list, user_dicts):
+    for user_dict in user_dicts:
+        match_result = Calculator.match(category_list, user_dict)
+
+        assert match_result.best_match is reference.calculate_best_matching_category(category_list, user_dict)
+        assert match_result.has_match == (match_result.best_match != -1)
+        assert list(match_result.top_matches.items()) == \
+               list(reference.get_top10_best_matches(category_list, user_dict).items())
+        assert list(match_result.top_matches_application.items()) == \
+               list(reference.get_top10_best_matches(category_list, user_dict, threshold=0).items())
+        assert match_result.matching_values == reference.calculate_matching_values_all_categories(category_list,
+                                                                                                 user_dict)
+
+
+def test_calculator_functions_accept_a_match_result(category_list, user_dicts):
+    for user_dict in user_dicts[:20]:
+        match_result = Calculator.match(category_list, user_dict)
+
+        assert Calculator.calculate_best_matching_category(category_list, match_result) is \
+               Calculator.calculate_best_matching_category(category_list, user_dict)
+        assert Calculator.get_top10_best_matches(category_list, match_result) == \
+               Calculator.get_top10_best_matches(category_list, user_dict)
+        assert match_result.main_categories == Calculator.calculate_main_category_application_matching_values(
+            match_result.top_matches_application, category_list)
+
+
+def test_batch_results_share_the_names_and_create_the_matching_values_lazily(category_list, user_dicts):
+    match_results = Calculator.match_batch(category_list, user_dicts)
+
+    assert len(match_results) == len(user_dicts)
+    assert all(match_result.category_names is match_results[0].category_names for match_result in match_results)
+    assert all("matching_values" not in vars(match_result) for match_result in match_results)
+
+    for match_result, user_dict in zip(match_results, user_dicts):
+        assert match_result.to_dict() == Calculator.match(category_list, user_dict).to_dict()
+
+    assert match_results[2].matching_values is match_results[2].matching_values
+
+
+def test_keywords_of_the_user_are_shown_in_sub_case1_2(category_list, monkeypatch, capsys):
+    keyword_dict_user = {"budget": 2, "money": 1}
+    inputs = iter([KEYWORDS_FILE, "Budget Planner", "1", "0"])
+    monkeypatch.setattr(builtins, "input", lambda: next(inputs))
+    monkeypatch.setattr(NLPHelper, "generate_keyword_dict_from_user_description", lambda *args: keyword_dict_user)
+    monkeypatch.setattr(CategoryTree, "create_category_profile", lambda *args: {"Finance": 0.5})
+
+    UserInterface.sub_case1_2("user.txt", "english", category_list)
+
+    assert f"The keywords for this description are: {keyword_dict_user}." in capsys.readouterr().out
@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+
+import pytest
+
+from application.Category.Category import Category
+from application.Scraper import CategoryScraper, RateLimiter
+from application.Scraper.RateLimiter import TokenBucket
+from application.Scraper.Retry import RetryPolicy
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now = self.now + seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(RateLimiter, "time", clock)
+    return clock
+
+
+def test_full_bucket_allows_a_burst_and_paces_afterwards(clock):
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    waiting_times = [round(bucket.acquire(), 6) for _ in range(5)]
+
+    assert waiting_times == [0, 0, 0.1, 0.1, 0.1]
+    assert clock.sleeps == [0.1, 0.1, 0.1]
+
+
+def test_bucket_is_refilled_up_to_its_capacity(clock):
+    bucket = TokenBucket(rate=10, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    clock.now = clock.now + 60
+
+    assert [bucket.acquire() for _ in range(2)] == [0, 0]
+    assert round(bucket.acquire(), 6) == 0.1
+
+
+def test_invalid_rate_is_rejected():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_shared_bucket_limits_all_threads():
+    bucket = TokenBucket(rate=100, capacity=1)
+    start = time.monotonic()
+
+    threads = [threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 0.19
+
+
+class StubPlayStore:
+
+    def __init__(self, failure_rate=0.0):
+        self.random = random.Random(7)
+        self.failure_rate = failure_rate
+        self.lock = threading.Lock()
+
+    def search(self, query, detailed=False):
+        with self.lock:
+            failed = self.random.random() < self.failure_rate
+        time.sleep(0.001)
+        if failed:
+            raise ConnectionError("Connection reset")
+        return [{"title": f"{query} {i}", "description": f"The {query} app number {i} (www.example.com)"}
+                for i in range(3)]
+
+
+def test_concurrent_scraping_produces_the_same_dictionary(tmp_path):
+    categories = [Category(0, "Category")] + [Category(i, f"Category {i}") for i in range(1, 31)]
+    categories.append(Category(31, "Category 5"))
+    dict_file = tmp_path / "dict.json"
+    dict_file.write_text("{}")
+    retry_policy = RetryPolicy(maximum_attempts=10, initial_backoff=0.001, maximum_backoff=0.002)
+
+    sequential = CategoryScraper.store_all_descriptions(categories, scraper=StubPlayStore(),
+                                                        dict_file=str(dict_file))
+    sequential_file = dict_file.read_text()
+    concurrent = CategoryScraper.store_all_descriptions(categories, workers=8, requests_per_second=1000,
+                                                        scraper=StubPlayStore(failure_rate=0.2),
+                                                        dict_file=str(dict_file), retry_policy=retry_policy)
+
+    assert list(concurrent.items()) == list(sequential.items())
+    assert dict_file.read_text() == sequential_file
+    assert len(sequential) == 30
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from application.Scraper import Retry
+from application.Scraper.Retry import FailureReport, RetryError, RetryPolicy
+
+
+class FlakyFunction:
+
+    def __init__(self, errors, result="result"):
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls = self.calls + 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(Retry.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_temporary_errors_are_retried(sleeps):
+    function = FlakyFunction([ConnectionError("reset"), TimeoutError("timeout")])
+
+    assert RetryPolicy(maximum_attempts=3).call(function) == "result"
+    assert function.calls == 3
+    assert len(sleeps) == 2
+
+
+def test_attempts_are_bounded(sleeps):
+    function = FlakyFunction([ConnectionError("reset")] * 10)
+
+    with pytest.raises(RetryError) as error:
+        RetryPolicy(maximum_attempts=4).call(function, description="Category 1")
+
+    assert function.calls == 4
+    assert len(sleeps) == 3
+    assert error.value.attempts == 4
+    assert error.value.description == "Category 1"
+    assert isinstance(error.value.__cause__, ConnectionError)
+
+
+def test_permanent_errors_are_not_retried(sleeps):
+    function = FlakyFunction([ValueError("Error: The app was not found.")])
+
+    with pytest.raises(RetryError) as error:
+        RetryPolicy(maximum_attempts=5).call(function)
+
+    assert function.calls == 1
+    assert sleeps == []
+    assert error.value.attempts == 1
+
+
+def test_errors_can_be_classified(sleeps):
+    policy = RetryPolicy(retry_on=(ConnectionError,), give_up_on=(ConnectionRefusedError,))
+
+    assert policy.is_retryable(ConnectionResetError())
+    assert not policy.is_retryable(ConnectionRefusedError())
+    assert not policy.is_retryable(KeyError("description"))
+
+
+def test_exits_and_interrupts_are_never_caught(sleeps):
+    for error in (SystemExit("stop"), KeyboardInterrupt()):
+        function = FlakyFunction([error])
+        with pytest.raises(type(error)):
+            RetryPolicy().call(function)
+        assert function.calls == 1
+
+
+def test_backoff_is_jittered_and_bounded():
+    policy = RetryPolicy(initial_backoff=1.0, maximum_backoff=5.0)
+
+    for attempt, limit in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)]:
+        backoffs = [policy.get_backoff(attempt) for _ in range(200)]
+        assert all(0 <= backoff <= limit for backoff in backoffs)
+        assert len(set(backoffs)) > 1
+
+
+def test_rate_limiter_is_used_for_every_attempt(sleeps):
+    class Counter:
+        tokens = 0
+
+        def acquire(self):
+            self.tokens = self.tokens + 1
+
+    counter = Counter()
+    RetryPolicy().call(FlakyFunction([ConnectionError("reset")]), rate_limiter=counter)
+
+    assert counter.tokens == 2
+
+
+def test_failure_report(sleeps, tmp_path):
+    report = FailureReport()
+    assert report.get_summary() == "No failures."
+
+    for description, error in [("Category 1", ConnectionError("reset")), ("Unknown App", ValueError("not found"))]:
+        try:
+            RetryPolicy(maximum_attempts=2).call(FlakyFunction([error] * 2), description=description)
+        except RetryError as retry_error:
+            report.add(retry_error)
+
+    assert len(report) == 2
+    assert report.get_descriptions() == ["Category 1", "Unknown App"]
+    assert "Category 1 (2 attempt(s)): ConnectionError: reset" in report.get_summary()
+    assert "Unknown App (1 attempt(s)): ValueError: not found" in report.get_summary()
+
+    report.write(str(tmp_path / "report.json"))
+    assert json.loads((tmp_path / "report.json").read_text()) == report.failures
@@ -0,0 +1,146 @@
+import json
+import shutil
+
+import numpy as np
+import pytest
+
+from application.Category.CategoryTree import CategoryTree
+from application.Matching import Calculator
+from conftest import CSV_FILE, KEYWORDS_FILE, create_user_dicts
+
+
+def describe_tree(category_list):
+    return [(category.category_id, category.parent_id, category.name, category.tier, str(category.structure_id),
+             category.parent.name if category.parent is not None else None,
+             [child.name for child in category.children], category.keywords)
+            for category in category_list]
+
+
+@pytest.fixture
+def keywords_file(tmp_path):
+    keywords_file = tmp_path / "keywords.json"
+    shutil.copyfile(KEYWORDS_FILE, keywords_file)
+
+    return str(keywords_file)
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    return str(tmp_path / "category_tree.npz")
+
+
+def test_snapshot_restores_tree_and_scores(category_list, keywords_file, snapshot_file, monkeypatch):
+    built_list = CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+
+    def fail(csv_data):
+        raise AssertionError("the tree was built from the csv file instead of the snapshot")
+
+    monkeypatch.setattr(CategoryTree, "set_up_tree", fail)
+    restored_list = CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+
+    assert restored_list is not built_list
+    assert restored_list.csv_data == CSV_FILE
+    assert describe_tree(restored_list) == describe_tree(category_list)
+    horse_racing = CategoryTree.find_category_by_name(category_list, "Horse Racing")
+    assert CategoryTree.find_category_by_name(restored_list, "Horse Racing") is CategoryTree.find_category_by_id(
+        restored_list, horse_racing.category_id)
+
+    user_dicts = create_user_dicts(category_list, 50)
+    expected = Calculator.match_batch(category_list, user_dicts)
+    actual = Calculator.match_batch(restored_list, user_dicts)
+
+    for expected_result, actual_result in zip(expected, actual):
+        assert np.allclose(actual_result.scores, expected_result.scores)
+        assert getattr(actual_result.best_match, "name", -1) == getattr(expected_result.best_match, "name", -1)
+
+
+def test_changed_keywords_invalidate_snapshot(keywords_file, snapshot_file):
+    CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is not None
+
+    with open(keywords_file, "r") as file:
+        keywords = json.load(file)
+    keywords["Horse Racing"] = {"saddle": 7}
+    with open(keywords_file, "w") as file:
+        json.dump(keywords, file)
+
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is None
+
+    category_list = CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+    assert CategoryTree.find_category_by_name(category_list, "Horse Racing").keywords == {"saddle": 7}
+
+    restored_list = CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file)
+    assert CategoryTree.find_category_by_name(restored_list, "Horse Racing").keywords == {"saddle": 7}
+
+
+def test_missing_snapshot_is_created(keywords_file, snapshot_file):
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is None
+
+    CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is not None
+
+
+def test_damaged_snapshot_is_rebuilt(category_list, keywords_file, snapshot_file):
+    with open(snapshot_file, "wb") as file:
+        file.write(b"no snapshot")
+
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is None
+
+    rebuilt_list = CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+
+    assert describe_tree(rebuilt_list) == describe_tree(category_list)
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is not None
+
+
+def test_snapshot_with_missing_arrays_is_rebuilt(category_list, keywords_file, snapshot_file):
+    CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+
+    with np.load(snapshot_file) as snapshot:
+        arrays = {key: snapshot[key] for key in snapshot.files if key != "keyword_counts"}
+    with open(snapshot_file, "wb") as file:
+        np.savez(file, **arrays)
+
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is None
+
+    rebuilt_list = CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+
+    assert describe_tree(rebuilt_list) == describe_tree(category_list)
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is not None
+
+
+def test_snapshot_restores_distances(keywords_file, snapshot_file):
+    built_list = CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file, with_distances=True)
+    restored_list = CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file)
+
+    assert restored_list.distance_matrix is not None
+    assert restored_list.get_distance_matrix() is restored_list.distance_matrix
+    assert np.array_equal(restored_list.distance_matrix.matrix, built_list.get_distance_matrix().matrix,
+                          equal_nan=True)
+
+    horse_racing = CategoryTree.find_category_by_name(restored_list, "Horse Racing")
+    sports = CategoryTree.find_category_by_name(restored_list, "Sports")
+    assert restored_list.get_distance_matrix().distance(horse_racing, sports) == Calculator.calculate_distance(
+        horse_racing.structure_id, sports.structure_id)
+
+
+def test_snapshot_without_distances_calculates_them_on_use(keywords_file, snapshot_file):
+    CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)
+    restored_list = CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file)
+
+    assert restored_list.distance_matrix is None
+    assert restored_list.get_distance_matrix().matrix.shape == (len(restored_list), len(restored_list))
+
+
+def test_snapshot_with_unfitting_distances_is_rebuilt(category_list, keywords_file, snapshot_file):
+    CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file, with_distances=True)
+
+    with np.load(snapshot_file) as snapshot:
+        arrays = {key: snapshot[key] for key in snapshot.files}
+    arrays["distances"] = arrays["distances"][:10, :10]
+    with open(snapshot_file, "wb") as file:
+        np.savez(file, **arrays)
+
+    assert CategoryTree.load_snapshot(snapshot_file, CSV_FILE, keywords_file) is None
+    assert describe_tree(CategoryTree.set_up_tree_with_keywords(CSV_FILE, keywords_file, snapshot_file)) == \
+        describe_tree(category_list)
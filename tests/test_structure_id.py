@@ -0,0 +1,121 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+import reference
+from application.Category import StructureId
+from application.Category.CategoryTree import CategoryTree
+from application.Matching import Calculator
+from conftest import CSV_FILE
+
+TIER_VALUES = ("00", "01", "10", "11", "20", "99")
+SYNTHETIC_IDS = ["".join(tiers) for tiers in itertools.product(TIER_VALUES, repeat=4)]
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return CategoryTree.set_up_tree(CSV_FILE)
+
+
+@pytest.fixture(scope="module")
+def structure_ids(tree):
+    return [category.structure_id for category in tree[1:]]
+
+
+def is_valid(structure_id):
+    try:
+        reference.check_distances(structure_id)
+    except Exception:
+        return False
+    return True
+
+
+def test_pack_and_unpack(structure_ids):
+    for structure_id in structure_ids + SYNTHETIC_IDS:
+        packed = StructureId.pack(structure_id)
+
+        assert StructureId.unpack(packed) == structure_id
+        assert packed == int(structure_id[0:2]) << 24 | int(structure_id[2:4]) << 16 | int(
+            structure_id[4:6]) << 8 | int(structure_id[6:8])
+
+
+def test_subcategories_share_the_leading_bytes(tree):
+    for category in tree[2:]:
+        if category.parent is not tree.root:
+            tier = int(category.parent.tier)
+            shift = 8 * (StructureId.TIERS - tier)
+            assert StructureId.pack(category.structure_id) >> shift == StructureId.pack(
+                category.parent.structure_id) >> shift
+
+
+@pytest.mark.parametrize("structure_id", ["0101010101", "0101010102", "010101", "", "01a10000", 1010100, None])
+def test_pack_rejects_ids_without_eight_digits(structure_id):
+    with pytest.raises(ValueError):
+        StructureId.pack(structure_id)
+
+    with pytest.raises(ValueError):
+        Calculator.calculate_distance(structure_id, "01000000")
+
+
+def test_check_equals_original_check():
+    for structure_id in SYNTHETIC_IDS:
+        if is_valid(structure_id):
+            Calculator.check_distances(structure_id)
+        else:
+            with pytest.raises(Exception, match="Incorrect structure id!"):
+                Calculator.check_distances(structure_id)
+
+
+def test_distance_equals_original_distance_on_the_tree(structure_ids):
+    for index, structure_id_1 in enumerate(structure_ids):
+        for structure_id_2 in structure_ids[index:]:
+            expected = reference.calculate_distance(structure_id_1, structure_id_2)
+
+            assert Calculator.calculate_distance(structure_id_1, structure_id_2) == expected
+            assert Calculator.calculate_distance(structure_id_2, structure_id_1) == expected
+
+
+def test_distance_equals_original_distance_on_synthetic_ids():
+    generator = random.Random(11)
+    valid_ids = [structure_id for structure_id in SYNTHETIC_IDS if is_valid(structure_id)]
+    pairs = [(generator.choice(valid_ids), generator.choice(valid_ids)) for _ in range(20000)]
+
+    for structure_id_1, structure_id_2 in pairs:
+        assert Calculator.calculate_distance(structure_id_1, structure_id_2) == reference.calculate_distance(
+            structure_id_1, structure_id_2)
+
+    packed_1 = np.array([StructureId.pack(structure_id) for structure_id, _ in pairs])
+    packed_2 = np.array([StructureId.pack(structure_id) for _, structure_id in pairs])
+
+    assert StructureId.calculate_distances(packed_1, packed_2).tolist() == [
+        reference.calculate_distance(structure_id_1, structure_id_2) for structure_id_1, structure_id_2 in pairs]
+
+
+def test_vectorized_distances_equal_single_distances(structure_ids):
+    packed = np.array([StructureId.pack(structure_id) for structure_id in structure_ids])
+    distances = StructureId.calculate_distances(packed[:, None], packed[None, :])
+
+    for index in range(0, len(packed), 7):
+        assert distances[index].tolist() == [StructureId.calculate_distance(int(packed[index]), int(other))
+                                             for other in packed]
+
+
+def test_vectorized_check_rejects_incorrect_ids():
+    invalid_ids = [structure_id for structure_id in SYNTHETIC_IDS if not is_valid(structure_id)]
+
+    for structure_id in invalid_ids[::17]:
+        with pytest.raises(Exception, match="Incorrect structure id!"):
+            StructureId.calculate_distances(np.array([StructureId.pack("01000000"), StructureId.pack(structure_id)]),
+                                            StructureId.pack("01000000"))
+
+
+def test_calculator_distances_from_one_category_to_many(tree):
+    category = CategoryTree.find_category_by_name(tree, "Horse Racing")
+    others = tree[1::11]
+
+    expected = [reference.calculate_distance(category.structure_id, other.structure_id) for other in others]
+
+    assert Calculator.calculate_distances(tree, category, others).tolist() == expected
+    assert Calculator.calculate_distances(list(tree), category, others).tolist() == expected
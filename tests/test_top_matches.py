@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+import pytest
+
+from application.Matching import Calculator
+
+import reference
+
+
+def sort_all(values, number, threshold, tie_breaking):
+    if tie_breaking == "order":
+        key = lambda item: -item[1]
+    else:
+        key = lambda item: (-item[1], item[0])
+
+    return [item for item in sorted(values, key=key) if threshold is None or item[1] >= threshold][:number]
+
+
+@pytest.mark.parametrize("tie_breaking", ["order", "name"])
+@pytest.mark.parametrize("number, threshold", [(1, None), (3, None), (10, 0.01), (10, 0.5), (50, None), (0, None)])
+def test_selection_equals_sorting_all_values(number, threshold, tie_breaking):
+    generator = random.Random(3)
+
+    for _ in range(50):
+        names = [f"Category {i}" for i in generator.sample(range(1000), 40)]
+        scores = np.array([generator.choice([0, 0.01, 0.25, 0.5, 0.75, generator.random()]) for _ in names])
+        expected = sort_all(list(zip(names, scores.tolist())), number, threshold, tie_breaking)
+
+        assert list(Calculator.select_top_matches(dict(zip(names, scores.tolist())), number, threshold,
+                                                  tie_breaking).items()) == expected
+        top_indices = Calculator.select_top_indices(scores, number, threshold, tie_breaking, names)
+        assert [(names[index], scores[index]) for index in top_indices] == expected
+
+
+def test_invalid_tie_breaking_is_an_error():
+    with pytest.raises(ValueError):
+        Calculator.select_top_matches({"A": 1}, tie_breaking="random")
+    with pytest.raises(ValueError):
+        Calculator.select_top_indices(np.array([1.0]), tie_breaking="random")
+
+
+def test_top10_equals_the_original_top10(category_list, user_dicts):
+    for user_dict in user_dicts:
+        assert list(Calculator.get_top10_best_matches(category_list, user_dict).items()) == \
+               list(reference.get_top10_best_matches(category_list, user_dict).items())
+        assert list(Calculator.get_top10_best_matches_application(category_list, user_dict).items()) == \
+               list(reference.get_top10_best_matches(category_list, user_dict, threshold=0).items())